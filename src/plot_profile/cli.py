@@ -1,9 +1,14 @@
 """Command line interface of plot_profile."""
+# Standard library
+import datetime as dt
+import sys
 
 # Third-party
 import click
 
 # First-party
+from plot_profile.utils.dwh_prefetch import DEFAULT_REQUESTS
+from plot_profile.utils.dwh_prefetch import prefetch as prefetch_requests
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.variables import vdf
 
@@ -40,8 +45,9 @@ def print_stations(ctx, param, value: bool) -> None:
         ctx.exit(0)
 
 
-@click.command(
+@click.group(
     context_settings={"help_option_names": ["-h", "--help"]},
+    invoke_without_command=True,
 )
 @click.option(
     "--version",
@@ -87,3 +93,51 @@ def main() -> None:
 
     """
     pass
+
+
+@main.command()
+@click.option("--loc", default="pay", type=str, help="Name of location. Def: pay")
+@click.option(
+    "--request",
+    type=(str, str),
+    multiple=True,
+    help="Device and comma-separated variables to prefetch, i.e. --request rs temp,dewp_temp."
+    + " Def: soundings, MWR and tower data as requested by the plotting commands",
+)
+@click.option(
+    "--hours",
+    default=24,
+    type=int,
+    help="Prefetch the last <hours> hours of non-sounding devices. Def: 24",
+)
+@click.option(
+    "--date",
+    type=click.DateTime(formats=["%Y%m%d%H"]),
+    help="Reference time YYYYmmddHH. Def: now (UTC)",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    default=False,
+    help="Output details on what is happening.",
+)
+def prefetch(loc: str, request: tuple, hours: int, date: dt.datetime, verbose: bool):
+    """Retrieve the latest observations into the DWH cache.
+
+    The data is cached with the same keys as the plotting commands use, s.t.
+    their retrievals become cache hits. Example crontab entry:
+
+    5,35 * * * * plot_profile prefetch --loc pay
+    """
+    if loc not in sdf:
+        print(f"! {loc} is not listed as an available station.")
+        sys.exit(1)
+
+    requests = [(device, tuple(variables.split(","))) for device, variables in request]
+    failed = prefetch_requests(
+        loc, requests or DEFAULT_REQUESTS, now=date, hours=hours, verbose=verbose
+    )
+
+    if failed:
+        sys.exit(1)
+    print("--- done")
@@ -0,0 +1,163 @@
+"""Geometry of station points in the arome domain.
+
+Every point is described by the four surrounding grid points and their
+bilinear interpolation weights. The weights for all stations in sdf are
+computed once; extracting a point then reads the 2x2 box around it and
+applies the weights in one vectorised gather.
+"""
+
+# Standard library
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.utils.stations import sdf
+
+# arome domain: 121 x 201 grid points, north-west corner at 49N/5E
+AROME_NY, AROME_NX = 121, 201
+AROME_LAT_MAX, AROME_LON_MIN = 49, 5
+AROME_A, AROME_B = 121 / 3, 201 / 5  # grid points per degree (lat, lon)
+
+# y0, x0:   upper left grid point of the 2x2 box around the point
+# weights:  2x2 array of bilinear weights, weights[j, i] for (y0 + j, x0 + i)
+AromePoint = namedtuple("AromePoint", ["lat", "lon", "y0", "x0", "weights"])
+
+
+def arome_grid_position(lat, lon):
+    """Fractional (y, x) position of lat/lon in the arome grid.
+
+    Args:
+        lat (float): latitude
+        lon (float): longitude
+
+    Returns:
+        fy, fx (float)
+
+    """
+    return (AROME_LAT_MAX - lat) * AROME_A, (lon - AROME_LON_MIN) * AROME_B
+
+
+def calc_arome_point(lat, lon, verbose=False):
+    """Compute the 2x2 box and bilinear weights around lat/lon.
+
+    Args:
+        lat (float):    latitude
+        lon (float):    longitude
+        verbose (bool): print details
+
+    Returns:
+        AromePoint, or None if lat/lon is outside of the arome domain
+
+    """
+    fy, fx = arome_grid_position(lat, lon)
+    if not (0 <= fy <= AROME_NY - 1 and 0 <= fx <= AROME_NX - 1):
+        return None
+
+    # upper left corner of the box; on the last row/column use the box before
+    y0 = min(int(np.floor(fy)), AROME_NY - 2)
+    x0 = min(int(np.floor(fx)), AROME_NX - 2)
+    wy, wx = fy - y0, fx - x0
+
+    weights = np.array(
+        [
+            [(1 - wy) * (1 - wx), (1 - wy) * wx],
+            [wy * (1 - wx), wy * wx],
+        ]
+    )
+
+    if verbose:
+        print(
+            f"Determined (y,x) corresponding to (lat,lon): ({lat},{lon}) -> ({fy:.2f},{fx:.2f})"
+        )
+
+    return AromePoint(lat, lon, y0, x0, weights)
+
+
+@lru_cache(maxsize=1)
+def arome_station_points():
+    """Table of the arome geometry of all stations in sdf inside the domain.
+
+    Returns:
+        pandas dataframe: one row per station with columns lat, lon, y0, x0,
+                          w00, w01, w10, w11
+
+    """
+    rows = {}
+    for station in sdf.columns:
+        lat, lon = sdf[station].lat, sdf[station].lon
+        if pd.isna(lat) or pd.isna(lon):
+            continue
+        point = calc_arome_point(lat, lon)
+        if point is None:
+            continue
+        rows[station] = [lat, lon, point.y0, point.x0, *point.weights.ravel()]
+
+    table = pd.DataFrame.from_dict(
+        rows,
+        orient="index",
+        columns=["lat", "lon", "y0", "x0", "w00", "w01", "w10", "w11"],
+    )
+    return table.astype({"y0": "int64", "x0": "int64"})
+
+
+def arome_point(lat, lon, verbose=False):
+    """Geometry of lat/lon in the arome domain (from station table if possible).
+
+    Args:
+        lat (float):    latitude
+        lon (float):    longitude
+        verbose (bool): print details
+
+    Returns:
+        AromePoint
+
+    """
+    table = arome_station_points()
+    match = table[np.isclose(table["lat"], lat) & np.isclose(table["lon"], lon)]
+    if not match.empty:
+        row = match.iloc[0]
+        if verbose:
+            print(f"Using precomputed arome weights of station {match.index[0]}.")
+        weights = row[["w00", "w01", "w10", "w11"]].to_numpy(float).reshape(2, 2)
+        return AromePoint(lat, lon, int(row["y0"]), int(row["x0"]), weights)
+
+    point = calc_arome_point(lat, lon, verbose)
+    if point is None:
+        print(
+            f"--- ! Coordinates lat/lon: {lat}/{lon} are outside of the arome domain."
+        )
+        sys.exit(1)
+
+    return point
+
+
+def arome_box(point):
+    """Index expression for the 2x2 box around point (last two dims y, x)."""
+    return (
+        Ellipsis,
+        slice(point.y0, point.y0 + 2),
+        slice(point.x0, point.x0 + 2),
+    )
+
+
+def gather_point(box, point):
+    """Interpolate the 2x2 box(es) bilinearly to the point.
+
+    Args:
+        box (array):        values with trailing dimensions (2, 2) = (y, x)
+        point (AromePoint): geometry of the point
+
+    Returns:
+        array: box without the trailing (y, x) dimensions
+
+    """
+    return np.einsum("...yx,yx->...", np.asarray(box, dtype="float64"), point.weights)
+
+
+if __name__ == "__main__":
+    print(arome_station_points())
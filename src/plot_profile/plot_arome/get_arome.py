@@ -6,48 +6,247 @@ Author: Arthur Dandoy
 # Standard library
 import glob
 import sys
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from datetime import timedelta
 from pathlib import Path
 
 # Third-party
 import netCDF4 as nc
+import numpy as np
 import pandas as pd
 import scipy
 import xarray as xr
 
 # First-party
+from plot_profile.plot_arome.arome_points import arome_box
+from plot_profile.plot_arome.arome_points import arome_point
+from plot_profile.plot_arome.arome_points import gather_point
+from plot_profile.utils.level_matrix import level_dataset
 from plot_profile.utils.utils import decumulate
 from plot_profile.utils.variables import vdf
 
 # from ipdb import set_trace
 
+# The POSIX "Time" variable of the arome files is shifted by this offset to
+# obtain the valid time. The shift has always been applied when decoding the
+# timestamps and is kept s.t. arome lines stay aligned with icon and obs.
+AROME_TIME_OFFSET = pd.Timedelta(hours=1)
+
+
+def arome_timestamps(posix_times):
+    """Decode the POSIX "Time" variable of arome files into valid times.
+
+    Args:
+        posix_times (array-like): seconds since 1970-01-01 00:00 UTC
+
+    Returns:
+        pandas DatetimeIndex: datetime64[ns] timestamps (incl. AROME_TIME_OFFSET)
+
+    """
+    posix_times = np.asarray(posix_times)
+
+    # xarray decodes "Time" itself if the file carries CF-conform units
+    if np.issubdtype(posix_times.dtype, np.datetime64):
+        return pd.DatetimeIndex(posix_times) + AROME_TIME_OFFSET
+
+    return pd.to_datetime(posix_times.astype("int64"), unit="s") + AROME_TIME_OFFSET
+
+
+# ensemble statistics which can be computed over PE-AROME members
+ENS_STATS = ["mean", "spread", "min", "max", "q10", "q25", "q50", "q75", "q90"]
+
+
+def arome_member_names(var_aro, member_ids):
+    """Names of the (ensemble) member variables in the arome files.
+
+    Args:
+        var_aro (str):              name of variable in arome
+        member_ids (list of int):   ensemble members ([0] for deterministic model)
+
+    Returns:
+        list of str
+
+    """
+    if not member_ids or list(member_ids) == [0]:  # 0 for deterministic model
+        return [var_aro]
+    return [f"{var_aro}{member}" for member in member_ids]
+
+
+def read_arome_member(files, var_aro, member, point):
+    """Read the column of one member at a point from all files.
+
+    Only the 2x2 box around the point is read; the column is interpolated
+    bilinearly with the precomputed weights of the point.
+
+    Args:
+        files (list of Path):   arome files (one per leadtime)
+        var_aro (str):          name of variable (group) in arome files
+        member (str):           name of member variable in group
+        point (AromePoint):     location in arome domain
+
+    Returns:
+        member (str), 2d numpy array (time, z)
+
+    """
+    values = []
+    for f in files:
+        nc_data = nc.Dataset(f, "r")
+        try:
+            nc_var = nc_data.groups[var_aro].variables[member]
+            box = np.ma.filled(nc_var[arome_box(point)].astype("float64"), np.nan)
+            values.append(gather_point(box, point))
+        finally:
+            nc_data.close()
+
+    return member, np.concatenate(values, axis=0)
+
+
+def read_arome_times(files, var_aro):
+    """Read the POSIX "Time" variable of the arome files (one per leadtime)."""
+    times = []
+    for f in files:
+        nc_data = nc.Dataset(f, "r")
+        try:
+            times.append(np.ma.filled(nc_data.groups[var_aro].variables["Time"][:]))
+        finally:
+            nc_data.close()
+
+    return np.concatenate([np.atleast_1d(t) for t in times])
+
+
+def read_arome_columns(jobs, point, workers=None, verbose=False):
+    """Read several member columns with a bounded pool of worker processes.
+
+    The HDF5 library underneath netCDF4 is not thread-safe, hence every column
+    is read in a separate process. Columns are yielded as soon as they are read,
+    s.t. reading many variables takes about as long as the slowest one.
+
+    Args:
+        jobs (list of tuples):  (files, var_aro, member) for every column to read
+        point (AromePoint):     location in arome domain
+        workers (int):          max. number of worker processes (Def: #cpus)
+        verbose (bool):         print details
+
+    Yields:
+        index of job (int), 2d numpy array (time, z)
+
+    """
+    if len(jobs) == 1 or workers == 1:
+        for i, (files, var_aro, member) in enumerate(jobs):
+            yield i, read_arome_member(files, var_aro, member, point)[1]
+        return
+
+    if verbose:
+        print(f"Reading {len(jobs)} arome columns in parallel.")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(read_arome_member, files, var_aro, member, point): i
+            for i, (files, var_aro, member) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()[1]
+
+
+def read_arome_members(files, var_aro, members, point, workers=None, verbose=False):
+    """Read the columns of several members of one variable in parallel.
+
+    Args:
+        files (list of Path):   arome files (one per leadtime)
+        var_aro (str):          name of variable (group) in arome files
+        members (list of str):  names of member variables
+        point (AromePoint):     location in arome domain
+        workers (int):          max. number of worker processes (Def: #cpus)
+        verbose (bool):         print details
+
+    Yields:
+        member (str), 2d numpy array (time, z)
+
+    """
+    jobs = [(files, var_aro, member) for member in members]
+    for i, values in read_arome_columns(jobs, point, workers, verbose):
+        yield members[i], values
+
+
+class MemberStatistics:
+    """Reduce member columns into ensemble statistics while they are read.
+
+    Mean and spread (standard deviation) are updated on the fly (Welford);
+    members are only kept in memory if min/max or quantiles are requested.
+    """
+
+    def __init__(self, stats, n_members):
+        """Prepare the statistics.
+
+        Args:
+            stats (list of str):    statistics (see ENS_STATS)
+            n_members (int):        number of members that will be added
+
+        """
+        for stat in stats:
+            if stat not in ENS_STATS:
+                print(f"--- ! Unknown ensemble statistic: {stat}")
+                sys.exit(1)
+        self.stats = list(stats)
+        self.n_members = n_members
+        self.count = 0
+        self.mean = None
+        self.m2 = None
+        self.members = None
+        self.keep_members = any(s not in ["mean", "spread"] for s in self.stats)
+
+    def add(self, values):
+        if self.count == 0:
+            self.mean = np.zeros_like(values)
+            self.m2 = np.zeros_like(values)
+            if self.keep_members:
+                self.members = np.empty((self.n_members,) + values.shape)
+
+        if self.keep_members:
+            self.members[self.count] = values
+
+        self.count += 1
+        delta = values - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (values - self.mean)
+
+    def result(self):
+        """Return dict of statistics (each same shape as one member)."""
+        result = {}
+        for stat in self.stats:
+            if stat == "mean":
+                result[stat] = self.mean
+            elif stat == "spread":
+                result[stat] = np.sqrt(self.m2 / max(self.count - 1, 1))
+            elif stat == "min":
+                result[stat] = np.nanmin(self.members[: self.count], axis=0)
+            elif stat == "max":
+                result[stat] = np.nanmax(self.members[: self.count], axis=0)
+            else:  # quantiles: q10, q25, ...
+                q = int(stat[1:]) / 100
+                result[stat] = np.nanquantile(self.members[: self.count], q, axis=0)
+
+        return result
+
 
 def coord_2_arome_pts(lat, lon, verbose=False):
     """Convert lat/lon to dy/dx in arome domain.
 
+    Nearest grid point of the box returned by arome_point; exits if lat/lon
+    is outside of the arome domain.
+
     Args:
         lat (float): latitude
         lon (float): longitude
         verbose (bool): print details
-    Returns: x,y (int)
+    Returns: y,x (int)
 
     """
-    A, B = 121 / 3, 201 / 5
-
-    if (5 <= lon <= 10) and (46 <= lat <= 49):
-        dy, dx = int(round((49 - lat) * A)), int(round((lon - 5) * B))
-        if verbose:
-            print(
-                f"Determined (dx,dy) corresponding to (lon,lat): ({lon},{lat}) -> ({dx},{dy})"
-            )
-        return (dy, dx)
+    point = arome_point(lat, lon, verbose)
+    j, i = np.unravel_index(np.argmax(point.weights), point.weights.shape)
 
-    else:
-        print(
-            "Coordonnées lat/lon en dehors du domaine, par défaut Payerne: 46.81291/6.94418"
-        )
-        return (int(round((49 - 46.81291) * A)), int(round((6.94418 - 5) * B)))
+    return (point.y0 + int(j), point.x0 + int(i))
 
 
 def slice_top_bottom_V2(df_height, alt_top=None, alt_bot=None, verbose=False):
@@ -84,20 +283,21 @@ def slice_top_bottom_V2(df_height, alt_top=None, alt_bot=None, verbose=False):
     return crit
 
 
-def calc_arome_height(dx, dy, verbose=False):
+def calc_arome_height(point, verbose=False):
     """Calculate height levels above sea level in arome.
 
     Args:
-        dx (int):        x-coordinate in arome domain
-        dy (int):        y-coordinate in arome domain
-        verbose (bool):  print details
+        point (AromePoint): location in arome domain
+        verbose (bool):     print details
 
     Returns:
         pandas series: arome height (asl) levels over the grid point
 
     """
     if verbose:
-        print(f"Calculating arome levels hegihts above the ({dx},{dy}) grid point")
+        print(
+            f"Calculating arome levels hegihts above the ({point.lat},{point.lon}) point"
+        )
 
     # file containing arome heights data (could be any file)
     height_data = nc.Dataset(
@@ -107,29 +307,30 @@ def calc_arome_height(dx, dy, verbose=False):
 
     # open altitudes above sea level
     nc_alti = height_data.groups["P"].variables["Altitude"][:]  # alt above ground level
-    nc_physio = height_data.groups["PHYSIO"].variables["zsol"][
-        dy, dx
-    ]  # ground alt above sea level
+    nc_physio = gather_point(
+        height_data.groups["PHYSIO"].variables["zsol"][arome_box(point)], point
+    )  # ground alt above sea level
 
     df_height = pd.Series(nc_physio + nc_alti)
 
     return df_height
 
 
-def calc_arome_height_agl(dx, dy, verbose=False):
+def calc_arome_height_agl(point, verbose=False):
     """Calculate height levels above GROUND level in arome.
 
     Args:
-        dx (int):        x-coordinate in arome domain
-        dy (int):        y-coordinate in arome domain
-        verbose (bool):  print details
+        point (AromePoint): location in arome domain
+        verbose (bool):     print details
 
     Returns:
         pandas series: arome height (agl) levels over the grid point
 
     """
     if verbose:
-        print(f"Calculating arome levels hegihts above the ({dx},{dy}) grid point")
+        print(
+            f"Calculating arome levels hegihts above the ({point.lat},{point.lon}) point"
+        )
 
     # file containing arome heights data (could be any file)
     height_data = nc.Dataset(
@@ -156,6 +357,8 @@ def get_arome_profiles(
     alt_bot,
     alt_top,
     verbose,
+    ens_stats=None,
+    workers=None,
 ):
     """Retrieve vertical profile of variable from arome simulation.
 
@@ -170,9 +373,12 @@ def get_arome_profiles(
         alt_bot (int):          lower boundary of plot
         alt_top (int):          upper boundary of plot
         verbose (bool):         print details
+        ens_stats (list of str):   reduce members to these statistics (see ENS_STATS)
+        workers (int):          max. number of processes reading members in parallel
 
     Returns:
-        pandas dataframe:       arome simulation values
+        dict:                   height and one dataframe per variable and member
+                                (or statistic, i.e. "temp~mean")
 
     """
     if verbose:
@@ -182,7 +388,7 @@ def get_arome_profiles(
     data_dict = {}
 
     # profile location in arome coords
-    dy, dx = coord_2_arome_pts(lat, lon, verbose)
+    point = arome_point(lat, lon, verbose)
 
     # folder containing the arome files
     nc_path = folder + datetime.strftime(date, "%Y%m%dT%H%MP")
@@ -192,7 +398,7 @@ def get_arome_profiles(
     ## Create height Data Frame and select altitude
 
     # calculate arome heights above sea level
-    df_height = calc_arome_height(dx, dy, verbose)
+    df_height = calc_arome_height(point, verbose)
 
     # select the index where altitudes are between requested bottom and top
     crit = slice_top_bottom_V2(
@@ -218,24 +424,17 @@ def get_arome_profiles(
     for var in variables_list:
 
         # is var availible in our Arome files ?
-        if vdf.loc["arome_name"][var] == None:
+        if vdf[var].arome_name is None:
             print(f"--- ! No {var} in arome files")
             sys.exit(1)
 
         else:
-            var_aro = vdf.loc["arome_name"][var]  # name of variables in arome
+            var_aro = vdf[var].arome_name  # name of variables in arome
             if verbose:
                 print(f"Searching for {var} (called {var_aro}) in Arome.")
 
         # members name list
-        if member_ids == [0]:  # 0 for deterministic model
-            members_name = [var_aro]
-        else:
-            members_name = list(map((lambda x: var_aro + str(x)), member_ids))
-
-        # load nc files as xarray dataset
-        if verbose:
-            print("Loading files into xarray dataset.")
+        members_name = arome_member_names(var_aro, member_ids)
 
         # looking for nc files
         files = []
@@ -253,41 +452,37 @@ def get_arome_profiles(
             for f in files:
                 print(f"  {f}")
 
-        nc_data = nc.Dataset(files[0], "r")
-        ncgrp = nc_data.groups[var_aro]  # selecting the right group (ensembles)
-        xr_data = xr.open_dataset(
-            xr.backends.NetCDF4DataStore(ncgrp)
-        )  # nc to xarray dataset
+        # unit conversions
+        mult, plus = vdf[var].mult_arome, vdf[var].plus_arome
 
-        # keep only requested members
-        xr_data = xr_data[members_name]
+        if ens_stats:
+            stats = MemberStatistics(ens_stats, len(members_name))
 
-        for i in files[1:]:  # all the files except the first wich is already openend
-            nc_data = nc.Dataset(i, "r")  # open DS with netDCF4 modules
-            ncgrp = nc_data.groups[var_aro]  # selecting the group we need
-            xr_data_tmp = xr.open_dataset(
-                xr.backends.NetCDF4DataStore(ncgrp)
-            )  # converting it to xarray Dataset
-
-            # keep only requested members
-            xr_data = xr_data[members_name]
-
-            xr_data = xr.concat(
-                [xr_data, xr_data_tmp], dim="time"
-            )  # adding our new DS to the big old one
+        member_values = {}
+        for member, values in read_arome_members(
+            files, var_aro, members_name, point, workers, verbose
+        ):
+            values = values * mult + plus
+            if ens_stats:
+                stats.add(values)
+            else:
+                member_values[member] = values
 
         if verbose:
-            print("Finished loading files into xarray dataset.")
+            print("Finished loading files.")
 
-        for i, member in enumerate(members_name):
-            # subselect values at the right grid point and do conversions
-            values = (
-                xr_data.variables[member][:, :, dy, dx] * vdf.loc["mult_arome"][var]
-                + vdf.loc["plus_arome"][var]
-            )
+        if ens_stats:
+            for stat, values in stats.result().items():
+                df_values = pd.DataFrame(columns=leadtime, data=values.transpose())
+                data_dict[f"{var}~{stat}"] = df_values[crit]
+            continue
 
+        # keep the order of the requested members
+        for i, member in enumerate(members_name):
             # fill into dataframe
-            df_values = pd.DataFrame(columns=leadtime, data=values.transpose())
+            df_values = pd.DataFrame(
+                columns=leadtime, data=member_values[member].transpose()
+            )
 
             # only extract the relevant altitude levels (encoded in the crit series; True --> relevant)
             df_values = df_values[crit]
@@ -302,7 +497,18 @@ def get_arome_profiles(
 
 
 def get_arome_timeseries(
-    lat, lon, vars, init, levels, start_lt, end_lt, folder, verbose=False
+    lat,
+    lon,
+    vars,
+    init,
+    levels,
+    start_lt,
+    end_lt,
+    folder,
+    verbose=False,
+    member_ids=None,
+    ens_stats=None,
+    workers=None,
 ):
     """Retrieve timeseries from AROME outputs.
 
@@ -311,17 +517,23 @@ def get_arome_timeseries(
         lon (float):                         longitude
         vars (list of strings or string):    arome variables
         init (datetime object):              init date of simulation
-        levels (list of int):                model levels ("1" = lowest model level)
+        levels (list of int):                model levels ("1" = lowest model level),
+                                             None for all levels
         start_lt (int):                      start leadtime
         end_lt (int):                        end leadtime
         folder (str):                        folder containing subfolders with arome runs
         verbose (bool):                      print details
+        member_ids (list of int):            PE-AROME members (Def: deterministic run)
+        ens_stats (list of str):             reduce members to these statistics (see ENS_STATS)
+        workers (int):                       max. number of processes reading variables/members
 
-    """
-    df = pd.DataFrame()
+    Returns:
+        xarray Dataset: one (time, level) array per variable (see level_matrix);
+                        ensembles with a member dimension ("m<id>" or statistic)
 
+    """
     # open timeseries location in arome coords
-    dy, dx = coord_2_arome_pts(lat, lon, verbose)
+    point = arome_point(lat, lon, verbose)
 
     # folder containing the arome files
     nc_path = folder + datetime.strftime(init, "%Y%m%dT%H%MP")
@@ -339,14 +551,18 @@ def get_arome_timeseries(
             levels,
         ]
 
+    ensemble = bool(member_ids) and list(member_ids) != [0]
+
+    # 1) collect the files and member columns of all variables
+    var_files, var_members, jobs, job_vars = {}, {}, [], []
     for var in vars:
 
         # is var availible in our Arome files ?
-        if vdf.loc["arome_name"][var] == None:
+        if vdf[var].arome_name is None:
             print(f"--- ! No {var} in arome files")
             sys.exit(1)
         else:
-            var_aro = vdf.loc["arome_name"][var]  # name of variables in arome
+            var_aro = vdf[var].arome_name  # name of variables in arome
             if verbose:
                 print(f"Searching for {var} (called {var_aro}) in Arome.")
 
@@ -360,76 +576,95 @@ def get_arome_timeseries(
             for f in files:
                 print(f"  {f}")
 
-        # load nc files as xarray dataset
-        if verbose:
-            print("Loading files into xarray dataset.")
+        var_files[var] = files
+        var_members[var] = arome_member_names(var_aro, member_ids)
+        for member in var_members[var]:
+            jobs.append((files, var_aro, member))
+            job_vars.append(var)
 
-        nc_data = nc.Dataset(files[0], "r")
-        ncgrp = nc_data.groups[var_aro]  # selecting the right group (ensembles)
-        xr_data = xr.open_dataset(
-            xr.backends.NetCDF4DataStore(ncgrp)
-        )  # nc to xarray dataset
+    ## timestamps
+    first_var = vars[0]
+    timestamps = arome_timestamps(
+        read_arome_times(var_files[first_var], vdf[first_var].arome_name)
+    )
 
-        for i in files[1:]:  # all the files except the first wich is already openend
-            nc_data = nc.Dataset(i, "r")  # open DS with netDCF4 modules
-            ncgrp = nc_data.groups[var_aro]  # selecting the group we need
-            xr_data_tmp = xr.open_dataset(
-                xr.backends.NetCDF4DataStore(ncgrp)
-            )  # converting it to xarray Dataset
+    # 2) read all columns of all variables concurrently
+    if ens_stats:
+        stats = {
+            var: MemberStatistics(ens_stats, len(var_members[var])) for var in vars
+        }
+
+    member_values = {var: {} for var in vars}
+    for i, values in read_arome_columns(jobs, point, workers, verbose):
+        var, member = job_vars[i], jobs[i][2]
+        values = arome_levels(var, values, levels, verbose)
+        if ens_stats:
+            stats[var].add(values)
+        else:
+            member_values[var][member] = values
 
-            xr_data = xr.concat(
-                [xr_data, xr_data_tmp], dim="time"
-            )  # adding our new DS to the big old one
+    if verbose:
+        print("Finished loading files.")
 
-        if verbose:
-            print("Finished loading files into xarray dataset.")
-
-        ## timestamp column
-        if "timestamp" not in df.columns:  # only the first loop time
-            date_list = []
-            for date in xr_data["Time"]:
-                # from POSIX to string format
-                date_list.append(
-                    (
-                        datetime.utcfromtimestamp(int(date)) + timedelta(hours=1)
-                    ).strftime("%Y-%m-%d %H:%M:%S")
-                )
-            df["timestamp"] = date_list
-
-        ## var column
-        # one column for each requested levels
-        for level in levels:
-
-            # 2D var or level = 0
-            if level == 0 and xr_data["z"].size < 2:  # and len(levels) == 1:
-                if xr_data["z"].size < 2:
-                    column_label = var
-                    values = xr_data.variables[var_aro][:, 0, dy, dx]
-                else:
-                    print(
-                        f"--- ! No level 0 for 3D vars in arome (for first level input '1')"
-                    )
-                    sys.exit(1)
-
-            # 3D var -> add level to column name
-            else:
-                column_label = f"{var}~{level}"
-                # ask for level -1 so level indent in arome and in icon are equivalent.
-                values = xr_data.variables[var_aro][:, level - 1, dy, dx]
+    # 3) assemble the (time, level[, member]) arrays in the requested order
+    fields, members = {}, None
+    for var in vars:
+        members_name = var_members[var]
 
-            # decumulating vars
-            if vdf.loc["acc_arome"][var] == True:
-                if verbose:
-                    print("Decumalating arome vars")
+        if ens_stats:
+            result = stats[var].result()
+            members = list(result.keys())
+            fields[var] = np.stack(list(result.values()), axis=-1)
 
-                values = decumulate(values)
+        elif ensemble:
+            members = [f"m{member_id}" for member_id in member_ids]
+            fields[var] = np.stack(
+                [member_values[var][member] for member in members_name], axis=-1
+            )
+
+        else:
+            fields[var] = member_values[var][members_name[0]]
 
-            # add factor or values
-            mult, plus = vdf.loc["mult_arome"][var], vdf.loc["plus_arome"][var]
+    if levels is None:
+        levels = np.arange(1, fields[first_var].shape[1] + 1)
 
-            df[column_label] = values * mult + plus
+    return level_dataset(timestamps, fields, levels, members)
 
-    return df
+
+def arome_levels(var, values, levels, verbose=False):
+    """Extract and convert the requested levels from one member column.
+
+    Args:
+        var (str):              variable short name
+        values (2d array):      (time, z) column of one member
+        levels (list of int):   model levels ("1" = lowest model level, 0 for 2D vars),
+                                None for all levels
+        verbose (bool):         print details
+
+    Returns:
+        2d array: (time, level)
+
+    """
+    mult, plus = vdf[var].mult_arome, vdf[var].plus_arome
+
+    # 2D var (level = 0) or 3D var: ask for level -1 s.t. the level indices
+    # in arome and in icon are equivalent
+    if levels is None:
+        level_values = values
+    elif list(levels) == [0] and values.shape[1] < 2:
+        level_values = values[:, :1]
+    else:
+        level_values = values[:, np.asarray(levels) - 1]
+
+    # decumulating vars
+    if vdf[var].acc_arome:
+        if verbose:
+            print("Decumalating arome vars")
+
+        level_values = decumulate(level_values)
+
+    # add factor or values
+    return level_values * mult + plus
 
 
 def get_arome_hm(lat, lon, var, init, height_list, start_lt, end_lt, folder, verbose):
@@ -447,13 +682,11 @@ def get_arome_hm(lat, lon, var, init, height_list, start_lt, end_lt, folder, ver
         verbose (bool):               print details
 
     Returns:
-        pandas dataframe:             arome simulation values
+        xarray Dataset:               (time, level) array of var on the heights
 
     """
-    df = pd.DataFrame()
-
     # open timeseries location in arome coords
-    dy, dx = coord_2_arome_pts(lat, lon)
+    point = arome_point(lat, lon, verbose)
 
     # folder containing the arome files
     nc_path = folder + datetime.strftime(init, "%Y%m%dT%H%MP")
@@ -461,14 +694,14 @@ def get_arome_hm(lat, lon, var, init, height_list, start_lt, end_lt, folder, ver
         print(f"Looking for files in {str(nc_path)}")
 
     # oepening arome level heights
-    height_arome = calc_arome_height(dx, dy)
+    height_arome = calc_arome_height(point)
 
     # is var availible in our Arome files ?
-    if vdf.loc["arome_name"][var] == None:
+    if vdf[var].arome_name is None:
         print(f"--- ! No {var} in arome files")
         sys.exit(1)
     else:
-        var_aro = vdf.loc["arome_name"][var]  # name of variables in arome
+        var_aro = vdf[var].arome_name  # name of variables in arome
         if verbose:
             print(f"Searching for {var} (called {var_aro}) in Arome.")
 
@@ -499,19 +732,11 @@ def get_arome_hm(lat, lon, var, init, height_list, start_lt, end_lt, folder, ver
             [xr_data, xr_data_tmp], dim="time"
         )  # adding our new DS to the big old one
 
-    ## timestamp column
-    date_list = []
-    for date in xr_data["Time"]:
-        # from POSIX to string format
-        date_list.append(
-            (datetime.utcfromtimestamp(int(date)) + timedelta(hours=1)).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-        )
-    df["timestamp"] = date_list
+    ## timestamps
+    timestamps = arome_timestamps(xr_data["Time"].values)
 
     ## variables columns
-    values = xr_data.variables[var_aro][:, :, dy, dx]
+    values = gather_point(xr_data.variables[var_aro][arome_box(point)], point)
 
     if verbose:
         print(f"Interpolating arome {var} and heights on: {height_list}...")
@@ -526,10 +751,6 @@ def get_arome_hm(lat, lon, var, init, height_list, start_lt, end_lt, folder, ver
         print(f"Finished interpolating.")
 
     # add factor or values
-    mult, plus = vdf.loc["mult_arome"][var], vdf.loc["plus_arome"][var]
-
-    for k in range(len(height_list)):
-        col_name = f"{var}~{str(height_list[k])}"
-        df[col_name] = values[:, k] * mult + plus
+    mult, plus = vdf[var].mult_arome, vdf[var].plus_arome
 
-    return df
+    return level_dataset(timestamps, {var: values * mult + plus}, height_list)
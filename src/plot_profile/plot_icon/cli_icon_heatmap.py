@@ -12,8 +12,11 @@ from datetime import timedelta
 import click
 
 # Local
+from ..utils.boundary_layer import METHODS
 from ..utils.dwh_retrieve import dwh_retrieve
 from .get_icon import get_icon
+from .get_icon import icon_pbl_heights
+from .get_icon import PBL_VARS
 from .plot_icon import create_heatmap
 
 # import ipdb
@@ -125,6 +128,12 @@ from .plot_icon import create_heatmap
     default=False,
     help="Add cloud base height & vertical visibility scatter plots to heat map.",
 )
+@click.option(
+    "--pbl",
+    type=click.Choice(METHODS, case_sensitive=True),
+    multiple=True,
+    help="Overlay boundary-layer/inversion heights diagnosed with these methods.",
+)
 def main(
     *,
     date: str,
@@ -148,6 +157,7 @@ def main(
     var_min: float,
     var_max: float,
     add_cbh: bool,
+    pbl: tuple,
 ):
     """Plot heatmap (time-height crosssection) of variable from ICON simulation.
 
@@ -156,6 +166,14 @@ def main(
 
     """
     leadtimes = list(range(start_leadtime, end_leadtime + 1, step))
+
+    # the boundary-layer heights need the thermodynamic and wind fields down to
+    # the surface: load them with the plotted variables unless alt_bot cuts
+    # off the lowest levels
+    variables_list = list(var)
+    if pbl and not alt_bot:
+        variables_list += [name for name in PBL_VARS if name not in var]
+
     data_dict = get_icon(
         folder=folder,
         date=date,
@@ -164,11 +182,26 @@ def main(
         lon=lon,
         ind=ind,
         grid=height_file,
-        variables_list=var,
+        variables_list=variables_list,
         alt_bot=alt_bot,
         alt_top=alt_top,
         verbose=verbose,
     )
+    pbl_dict = data_dict
+    if pbl and alt_bot:
+        pbl_dict = get_icon(
+            folder=folder,
+            date=date,
+            leadtime=leadtimes,
+            lat=lat,
+            lon=lon,
+            ind=ind,
+            grid=height_file,
+            variables_list=PBL_VARS,
+            alt_bot=None,
+            alt_top=alt_top,
+            verbose=verbose,
+        )
 
     if add_cbh:
         t1 = date + timedelta(hours=start_leadtime)
@@ -187,6 +220,8 @@ def main(
     else:
         surface_data = None
 
+    pbl_heights = icon_pbl_heights(pbl_dict, list(pbl)) if pbl else None
+
     if True:
         create_heatmap(
             variables_list=var,
@@ -202,6 +237,7 @@ def main(
             var_min=var_min,
             var_max=var_max,
             surface_data=surface_data,
+            pbl_heights=pbl_heights,
         )
 
     print("--- done")
@@ -8,6 +8,7 @@ Date: 11/11/2021
 # Standard library
 import datetime as dt
 import sys
+from dataclasses import replace
 from doctest import DocFileCase
 from pathlib import Path
 from pprint import pprint
@@ -19,6 +20,9 @@ import scipy
 import xarray as xr
 
 # First-party
+from plot_profile.utils import thermo
+from plot_profile.utils.boundary_layer import frame_pbl_heights
+from plot_profile.utils.level_matrix import level_dataset
 from plot_profile.utils.utils import deaverage
 from plot_profile.utils.utils import get_dim_names
 from plot_profile.utils.utils import get_grid_names
@@ -28,6 +32,9 @@ from plot_profile.utils.variables import vdf
 
 # from ipdb import set_trace
 
+# variables of the boundary-layer height diagnostic
+PBL_VARS = ["temp", "press", "qv", "u", "v"]
+
 
 def lfff_name(lt):
     """Create mch-filename for icon ctrl run for given leadtime.
@@ -284,7 +291,7 @@ def get_icon(
         var = vdf[variable]
 
         # find correct icon name from list of possible names
-        var.icon_name = get_icon_name(ds, var, verbose)
+        var = replace(var, icon_name=get_icon_name(ds, var, verbose))
         
         # subselect values from column
         try:
@@ -334,13 +341,17 @@ def get_icon_timeseries(
         lon (float): longitude
         vars (list of strings or string): icon variables
         init (datetime object): init date of simulation
-        level (int): model level ("1" = lowest model level)
+        level (int, list or None): model level(s) ("1" = lowest model level),
+            None for all levels
         start_lt (int): start leadtime
         end_lt (int): end leadtime
         folder (str): folder containing subfolders with icon runs
         height_file (str): icon-1 height file
         verbose (bool): print details
 
+    Returns:
+        xarray Dataset: one (time, level) array per variable (see level_matrix)
+
     """
     # determine index of loc from grid file
     ind, height, size = index_height_from_height_file(lat, lon, height_file, verbose)
@@ -372,17 +383,15 @@ def get_icon_timeseries(
     if verbose:
         print("Finished loading files into xarray dataset.")
 
-    # create df which collects icon variables
-    #   pd.Dataframe with columns 'timestamp', 'var1~level1', 'var2', ...
-    df = pd.DataFrame()
+    # collect the (time, level) arrays of the icon variables
+    fields = {}
+    levels = None if level is None else np.atleast_1d(level)
 
     # timestamps
     timestamps = []
     for lt in leadtimes:
         timestamps.append(init + dt.timedelta(hours=int(lt)))
 
-    df["timestamp"] = timestamps
-
     # loop over icon variable(s) and add them to the dataframe
 
     # "vars" can be string or list of strings
@@ -393,17 +402,10 @@ def get_icon_timeseries(
 
     for i, variable in enumerate(vars):
 
-        # for variables without level, e.g. 2m_temperature
-        if level == 0:
-            column_label = variable
-        # add level to name
-        else:
-            column_label = f"{variable}~{level}"
-
         var = vdf[variable]
 
         # find correct icon name from list of possible names
-        var.icon_name = get_icon_name(ds, var, verbose)
+        var = replace(var, icon_name=get_icon_name(ds, var, verbose))
 
         # dataset with only one specific variable
         ds_var = ds[var.icon_name]
@@ -422,7 +424,9 @@ def get_icon_timeseries(
             and isinstance(dim_index, str)
             and isinstance(dim_level, str)
         ):
-            values = ds_var.isel(**{dim_index: ind, dim_level: np.negative(level)})
+            if levels is None:
+                levels = np.arange(1, ds_var.sizes[dim_level] + 1)
+            values = ds_var.isel(**{dim_index: ind, dim_level: np.negative(levels)})
 
         # b)
         elif (
@@ -441,8 +445,14 @@ def get_icon_timeseries(
         if var.avg:
             values = deaverage(values)
 
-        df[column_label] = values * var.mult + var.plus
-    return df
+        # 2D variables: one level
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, None]
+
+        fields[variable] = values * var.mult + var.plus
+
+    return level_dataset(timestamps, fields, [0] if levels is None else levels)
 
 
 def get_icon_hm(
@@ -463,12 +473,9 @@ def get_icon_hm(
         verbose (bool):                print details
 
     Returns:
-        pandas dataframe:              icon simulation values
+        xarray Dataset:                (time, level) array of var on the heights
 
     """
-    # create df which collects icon variables
-    df = pd.DataFrame()
-
     ind, height, size = index_height_from_height_file(lat, lon, height_file, verbose)
 
     hfl = calc_hfl(height)
@@ -501,7 +508,7 @@ def get_icon_hm(
         print("Finished loading files into xarray dataset.")
 
     # select variable
-    ds_var = ds[vdf.loc["icon_name"][var]]
+    ds_var = ds[vdf[var].icon_name]
 
     dim_time, dim_index, dim_level = get_dim_names(ds_var, verbose)
 
@@ -535,20 +542,38 @@ def get_icon_hm(
     if verbose:
         print(f"Finished interpolating.")
 
-    ## timestamps column
+    ## timestamps
     timestamps = []
     for lt in leadtimes:
         timestamps.append(init + dt.timedelta(hours=int(lt)))
 
-    df["timestamp"] = timestamps
+    # add factor or values
+    mult, plus = vdf[var].mult, vdf[var].plus
 
-    ## variables columns
+    return level_dataset(timestamps, {var: values * mult + plus}, height_list)
 
-    # add factor or values
-    mult, plus = vdf.loc["mult"][var], vdf.loc["plus"][var]
 
-    for k in range(len(height_list)):
-        col_name = f"{var}~{str(height_list[k])}"
-        df[col_name] = values[:, k] * mult + plus
+def icon_pbl_heights(data_dict, methods):
+    """Boundary-layer and inversion heights of all leadtimes of get_icon.
+
+    Args:
+        data_dict (dict):           output of get_icon, incl. height and PBL_VARS
+        methods (list of str):      see boundary_layer.METHODS
+
+    Returns:
+        pandas dataframe:           one row per leadtime, one column per method
+
+    """
+    temp, press, qv = (
+        data_dict[var].to_numpy(dtype="float64") for var in ["temp", "press", "qv"]
+    )
+    # virtual potential temperature (K)
+    qv = thermo.to_kg_per_kg(qv, "g/kg")
+    pot_temp = pd.DataFrame(
+        thermo.potential_temperature(temp, press)
+        * (1 + (thermo.R_V / thermo.R_D - 1) * qv),
+        index=data_dict["height"].values,
+        columns=data_dict["temp"].columns,
+    )
 
-    return df
+    return frame_pbl_heights(pot_temp, data_dict["u"], data_dict["v"], methods)
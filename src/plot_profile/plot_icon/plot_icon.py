@@ -23,6 +23,7 @@ from matplotlib.patches import Patch
 
 # First-party
 from plot_profile.plot_rs.plot_rs import plot_clouds
+from plot_profile.utils.boundary_layer import add_pbl_heights
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.utils import calc_qv_from_td
 from plot_profile.utils.utils import linestyle_dict
@@ -509,7 +510,7 @@ def create_plot(
         appendix (str):                 add to output filename to e.g. distinguish versions
         xmin (float):                   minimum value of xaxis
         xmax (float):                   maximum value of xaxis
-        xrange_fix(bool):               take fix xrange from variables.py
+        xrange_fix(bool):               take fix xrange from variables.json
         datatypes (tuple):              tuple containig all desired datatypes for the output files
         verbose (bool):                 print verbose messages
         show_grid (bool):               add grid to plot
@@ -589,6 +590,7 @@ def create_heatmap(
     var_min,
     var_max,
     surface_data=None,
+    pbl_heights=None,
 ):
     # the height dataframe is the same for all variables, thus outside of the
     # for-loop below. it needs some reformatting and type alignement for later use
@@ -636,6 +638,10 @@ def create_heatmap(
         if var_min:
             im.set_clim(var_min, var_max)
 
+        # boundary-layer and inversion heights (one row per leadtime)
+        if pbl_heights is not None:
+            add_pbl_heights(ax_colormesh, lt_dt, pbl_heights)
+
         # IF no surface_data is added to heatmap, initialise new axes-instace which can be
         # formatted using the concise date formater
         start = date
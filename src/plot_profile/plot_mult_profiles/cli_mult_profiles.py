@@ -17,6 +17,8 @@ import click
 from plot_profile.plot_mult_profiles.get_mult_profiles import get_mult_data
 from plot_profile.plot_mult_profiles.get_mult_profiles import parse_inputs
 from plot_profile.plot_mult_profiles.plot_mult_profiles import create_mult_plot
+from plot_profile.utils.pressure_levels import STANDARD_LEVELS
+from plot_profile.utils.pressure_levels import VCOORDS
 
 # from ipdb import set_trace
 
@@ -67,6 +69,18 @@ from plot_profile.plot_mult_profiles.plot_mult_profiles import create_mult_plot
     default="/store/s83/swester/HEIGHT_ICON-1E.nc",
     help="Icon file containing HEIGHT field. Def: ICON-1E operational 2021",
 )
+@click.option(
+    "--vcoord",
+    type=click.Choice(VCOORDS, case_sensitive=True),
+    default="height",
+    help="Vertical coordinate: altitude or pressure levels (interpolated in ln(p)). Def: height",
+)
+@click.option(
+    "--press_levels",
+    type=float,
+    multiple=True,
+    help="Pressure levels [hPa] for --vcoord press. Def: standard levels (1000-100 hPa) within --ymin and --ymax.",
+)
 @click.option("--ymin", type=int, help="Altitude bottom. Def: surface.")
 @click.option("--ymax", default=2000, type=int, help="Altitude top. Def: 2000")
 @click.option(
@@ -119,6 +133,11 @@ from plot_profile.plot_mult_profiles.plot_mult_profiles import create_mult_plot
     default=False,
     help="Output details on what is happening.",
 )
+@click.option(
+    "--dwh_processes",
+    type=int,
+    help="Max. number of simultaneous DWH retrievals. Def: 4",
+)
 @click.option(
     "--xmin",
     type=float,
@@ -139,6 +158,8 @@ def main(
     leadtime: tuple,
     add_obs: tuple,
     height_file: str,
+    vcoord: str,
+    press_levels: tuple,
     ymin: int,
     ymax: int,
     datatypes: tuple,
@@ -149,6 +170,7 @@ def main(
     outpath: str,
     grid: bool,
     verbose: bool,
+    dwh_processes: int,
     xmin: tuple,
     xmax: tuple,
 ):
@@ -164,6 +186,12 @@ def main(
 
     print("---  WARNING: Currently only one height_file per plot is supported.")
 
+    # profiles are retrieved between ymin and ymax (altitude) in any case
+    if vcoord == "press":
+        press_levels = list(press_levels) or STANDARD_LEVELS
+    else:
+        press_levels = None
+
     data_dict = get_mult_data(
         init=init,
         variable=variable,
@@ -175,6 +203,8 @@ def main(
         grid=height_file,
         ylims=(ymin, ymax),
         verbose=verbose,
+        dwh_processes=dwh_processes,
+        press_levels=press_levels,
     )
 
     # pprint(data_dict)
@@ -190,6 +220,7 @@ def main(
         grid=grid,
         datatypes=datatypes,
         outpath=outpath,
+        vcoord=vcoord,
         verbose=verbose,
     )
 
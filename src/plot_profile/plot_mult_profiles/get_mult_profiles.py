@@ -17,7 +17,9 @@ import pandas as pd
 from plot_profile.plot_arome.get_arome import get_arome_profiles
 from plot_profile.plot_icon.get_icon import get_icon
 from plot_profile.utils.calc_new_vars import calc_new_var_profiles
-from plot_profile.utils.dwh_retrieve import dwh_retrieve
+from plot_profile.utils.dwh_executor import DWHRequest
+from plot_profile.utils.dwh_executor import retrieve_all
+from plot_profile.utils.pressure_levels import frame_to_pressure
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.utils import calc_qv_from_td
 from plot_profile.utils.utils import check_inputs
@@ -68,6 +70,24 @@ def parse_inputs(variable, model, model_src, add_obs, loc, verbose=False):
     return
 
 
+def align_on_height(press, df):
+    """Pressure profiles at the heights (and index) of df.
+
+    Args:
+        press   (pandas dataframe): column height and one column per leadtime
+        df      (pandas dataframe): column height and the same leadtime columns
+
+    Returns:
+        pandas dataframe: leadtime columns, indexed like df
+
+    """
+    # soundings may contain a height twice
+    press = press.groupby("height").mean().reindex(df["height"])
+    press.index = df.index
+    press.columns = df.columns.drop("height")
+    return press
+
+
 def get_mult_data(
     init,
     variable,
@@ -79,6 +99,8 @@ def get_mult_data(
     grid,
     ylims,
     verbose,
+    dwh_processes=None,
+    press_levels=None,
 ):
     """Retrieve models and observation data for multiple profiles plots.
 
@@ -90,9 +112,13 @@ def get_mult_data(
         ylims (list of ints):    top and bottom altitude
         elements (tuple):        variables informations
         verbose (bool):          print details.Default: False
+        dwh_processes (int):     max. number of simultaneous DWH retrievals
+        press_levels (list):     interpolate all profiles to these pressure
+                                 levels in hPa (Def: keep the altitudes)
 
     Returns:
-        dict: returns models and obs data
+        dict: returns models and obs data, with column height (or press if
+              press_levels are given) and one column per leadtime
 
     """
     # 0) Parse loc / lat / lon input
@@ -335,25 +361,38 @@ def get_mult_data(
     # indeed measurments takes place at different altitudes for rs
     # or can be altered sometimes by clouds for lidars...
 
+    # all (device, leadtime) retrievals run concurrently
+    requests = []
     for device in add_obs:
         for lt in leadtimes:
-            # leadtimes to date format
-            date_lt = init + timedelta(hours=lt)
-
             if device == None:
-                if verbose:
-                    print("No observations input. Retreive models outputs only.")
+                continue
 
-            elif device == "rs" and variable == "qv":
+            if device == "rs" and variable == "qv":
                 vars = "dewp_temp", "press"
+            else:
+                vars = variable
 
-                unsliced_df = dwh_retrieve(
+            requests.append(
+                DWHRequest(
+                    key=(device, lt),
                     device=device,  # i.e. rs
                     station=loc,  # i.e. pay
                     vars=vars,
-                    timestamps=date_lt,
-                    verbose=verbose,
+                    timestamps=init + timedelta(hours=lt),
                 )
+            )
+
+    obs_data = retrieve_all(requests, max_processes=dwh_processes, verbose=verbose)
+
+    for device in add_obs:
+        for lt in leadtimes:
+            if device == None:
+                if verbose:
+                    print("No observations input. Retreive models outputs only.")
+
+            elif device == "rs" and variable == "qv":
+                unsliced_df = obs_data[(device, lt)]
                 # if returned df is not empty add to obs_dict
                 if not unsliced_df.empty:
                     del unsliced_df["timestamp"]
@@ -379,13 +418,7 @@ def get_mult_data(
                 continue
 
             else:
-                unsliced_df = dwh_retrieve(
-                    device=device,  # i.e. rs
-                    station=loc,  # i.e. pay
-                    vars=variable,
-                    timestamps=date_lt,
-                    verbose=verbose,
-                )
+                unsliced_df = obs_data[(device, lt)]
 
                 # if returned df is not empty add to obs_dict
                 if not unsliced_df.empty:
@@ -406,4 +439,31 @@ def get_mult_data(
 
                 continue
 
+    # interpolate all leadtimes of a model or device to the pressure levels at once
+    if press_levels is not None:
+        press_dict = get_mult_data(
+            init=init,
+            variable="press",
+            model=model,
+            model_src=model_src,
+            add_obs=add_obs,
+            leadtimes=leadtimes,
+            loc=loc,
+            grid=grid,
+            ylims=ylims,
+            verbose=verbose,
+            dwh_processes=dwh_processes,
+        )
+        for key, df in data_dict.items():
+            if key not in press_dict:
+                print(f"--- ! No pressure for {key}: cannot use pressure levels.")
+                sys.exit(1)
+            if verbose:
+                print(f"Interpolating {key} to {len(press_levels)} pressure levels.")
+            data_dict[key] = frame_to_pressure(
+                df.drop(columns="height"),
+                align_on_height(press_dict[key], df),
+                press_levels,
+            )
+
     return data_dict
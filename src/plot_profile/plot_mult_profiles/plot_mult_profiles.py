@@ -13,6 +13,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # First-party
+from plot_profile.utils.pressure_levels import pressure_axis
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.utils import get_cubehelix_colors
 from plot_profile.utils.utils import linestyle_dict
@@ -33,6 +34,7 @@ def create_mult_plot(
     grid,
     datatypes,
     outpath,
+    vcoord="height",
     verbose=False,
 ):
     # get location dataframe
@@ -112,8 +114,8 @@ def create_mult_plot(
             print(i, device)
             pprint(df)
 
-        # y-axis information: altitude
-        altitude = df["height"]
+        # y-axis information: altitude (or pressure)
+        altitude = df[vcoord]
         altitude_min = altitude.min()
 
         if ymin_dynamic == None:
@@ -185,8 +187,12 @@ def create_mult_plot(
     ax.set_title(label=title, bbox=dict(facecolor="none"), x=0.5, y=1.02)
     ax.set_ylabel(f"Altitude [m asl]")
 
-    # add ylim
-    if ymin == None:
+    # add ylim (pressure: all levels with data)
+    if vcoord == "press":
+        pressure_axis(
+            ax, sorted(set().union(*(df["press"] for df in data_dict.values())))
+        )
+    elif ymin == None:
         ax.set_ylim(ymin_dynamic, ymax)
     else:
         ax.set_ylim(ymin, ymax)
@@ -204,6 +210,10 @@ def create_mult_plot(
     for devname in device_namelist:
         var_dev += f"~{devname}"
 
+    # profiles on pressure levels
+    if vcoord == "press":
+        var_dev += "_plev"
+
     filename = f"profiles_{start_str}_{loc.short_name}_{var_dev}"
     save_fig(filename, datatypes, outpath, fig=fig)
     plt.clf()
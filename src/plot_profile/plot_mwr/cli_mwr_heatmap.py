@@ -1,4 +1,4 @@
-"""Purpose: Plot time-height-crosssection of MWR observational data.
+"""Purpose: Plot time-height-crosssection of MWR, lidar or RALMO observational data.
 
 Author: Stephanie Westerhuis
 
@@ -11,10 +11,15 @@ from pprint import pprint as pp
 
 # Third-party
 import click
+import numpy as np
 import pandas as pd
 
 # Local
+from ..utils.boundary_layer import frame_pbl_heights
+from ..utils.boundary_layer import METHODS
+from ..utils.boundary_layer import static_temperature
 from ..utils.dwh_retrieve import dwh_retrieve
+from ..utils.profile_array import profile_frame
 from ..utils.stations import sdf
 from ..utils.utils import slice_top_bottom
 from ..utils.variables import vdf
@@ -41,6 +46,12 @@ from .plot_mwr import mwr_heatmap
 # optional options
 @click.option("--alt_bot", type=int, help="Altitude bottom. Def: surface.")
 @click.option("--alt_top", default=2000, type=int, help="Altitude top. Def: 2000")
+@click.option(
+    "--alt_step",
+    type=float,
+    help="Interpolate profiles to a regular altitude grid with this spacing [m]."
+    + " Def: levels of the device",
+)
 @click.option(
     "--appendix", type=str, help="String to append to output filename. Def: None"
 )
@@ -68,6 +79,12 @@ from .plot_mwr import mwr_heatmap
     default="png",
     help="Choose data type(s) of final result. Def: png",
 )
+@click.option(
+    "--device",
+    type=click.Choice(["mwr", "lidar", "ralmo"]),
+    default="mwr",
+    help="Profiling device. Def: mwr",
+)
 @click.option("--loc", default="pay", type=str, help="Name of location. Def: pay")
 @click.option(
     "--min", type=float, help="Lower limit for colorbar/variable. No default."
@@ -80,6 +97,13 @@ from .plot_mwr import mwr_heatmap
     type=str,
     help="Path to folder where the plots should be saved. Def: /scratch/USER/tmp",
 )
+@click.option(
+    "--pbl",
+    type=click.Choice(METHODS, case_sensitive=True),
+    multiple=True,
+    help="Overlay boundary-layer/inversion heights diagnosed with these methods"
+    + " from the MWR temperature (bulk_ri needs wind: not available).",
+)
 @click.option(
     "--verbose",
     is_flag=True,
@@ -93,27 +117,29 @@ def main(
     var: str,
     alt_bot: int,
     alt_top: int,
+    alt_step: float,
     appendix: str,
     datatypes: tuple,
+    device: str,
     loc: str,
     min: float,
     max: float,
     outpath: str,
+    pbl: tuple,
     verbose: bool,
 ):
-    """Plot heatmap of variables retrieved from microwave radiometer.
+    """Plot heatmap of variables retrieved from microwave radiometer, lidar or RALMO.
 
-    Currently, only temperature is supported.
-
-    Example command:
+    Example commands:
     plot_mwr_heatmap --start 21111812 --end 21111912 --var temp --alt_top 2000 --outpath plots
+    plot_mwr_heatmap --start 21111812 --end 21111912 --var wind_vel --device lidar --alt_step 50
 
     """
     # retrieve station dataframe
     try:
         station = sdf[loc]
         if verbose:
-            print(f"Retrieving MWR data for {station.long_name}.")
+            print(f"Retrieving {device.upper()} data for {station.long_name}.")
     except KeyError:
         print(f"! {loc} is not listed as an available station.")
         sys.exit(1)
@@ -127,14 +153,26 @@ def main(
         print(f"! {var} is not available as variable.")
         sys.exit(1)
 
-    ## retrieve obs from DWH
-    mwr_data = dwh_retrieve(
-        device="mwr",
+    # the profiles of some devices do not share their levels
+    levels = None
+    if alt_step:
+        levels = np.arange(alt_bot or 0, alt_top + alt_step, alt_step)
+
+    ## retrieve obs from DWH: array (time, altitude, variable)
+    profiles = dwh_retrieve(
+        device=device,
         station=loc,
         vars=var,
         timestamps=[start, end],
         verbose=verbose,
+        levels=levels,
     )
+    if profiles.size == 0:
+        print(f"! No {device.upper()} data available for {var}.")
+        sys.exit(1)
+
+    # altitude as index, timestamps as columns
+    mwr_data = profile_frame(profiles, var_frame.short_name).dropna(how="all")
 
     # slice top and bottom
     if not alt_bot:
@@ -144,9 +182,33 @@ def main(
     crit.index = mwr_data.index
     mwr_data = mwr_data[crit]
 
-    pp(mwr_data.head())
-    mwr_data = mwr_data.subtract(273.15)  # K --> °C
-    pp(mwr_data.head())
+    if verbose:
+        pp(mwr_data.head())
+
+    # boundary-layer heights from the whole temperature profiles (not sliced)
+    pbl_heights = None
+    if pbl:
+        if device != "mwr":
+            print("! Boundary-layer heights are only available for the MWR.")
+            sys.exit(1)
+        if var != "temp":
+            profiles = dwh_retrieve(
+                device=device,
+                station=loc,
+                vars="temp",
+                timestamps=[start, end],
+                verbose=verbose,
+                levels=levels,
+            )
+        temp = profile_frame(profiles, "temp").dropna(how="all")
+        pot_temp = pd.DataFrame(
+            static_temperature(temp.index.to_numpy()[:, None], temp, axis=0),
+            index=temp.index,
+            columns=temp.columns,
+        )
+        pbl_heights = frame_pbl_heights(pot_temp, methods=list(pbl))
+        if verbose:
+            pp(pbl_heights.head())
 
     mwr_heatmap(
         start=start,
@@ -159,6 +221,8 @@ def main(
         appendix=appendix,
         datatypes=datatypes,
         outpath=outpath,
+        device=device,
+        pbl_heights=pbl_heights,
     )
 
     print("--- done")
@@ -21,6 +21,7 @@ munits.registry[datetime.date] = converter
 munits.registry[datetime.datetime] = converter
 
 # Local
+from ..utils.boundary_layer import add_pbl_heights
 from ..utils.utils import save_fig
 
 
@@ -35,8 +36,10 @@ def mwr_heatmap(
     appendix,
     datatypes,
     outpath,
+    device="mwr",
+    pbl_heights=None,
 ):
-    """Plot heatmap of MWR observational data.
+    """Plot heatmap of MWR (or lidar, RALMO) observational data.
 
     Args:
         start (datetime): left limit of x-axis
@@ -49,6 +52,8 @@ def mwr_heatmap(
         appendix (str): append to file outname
         datatypes (str): output filetype
         outpath (str): path to output
+        device (str): mwr, lidar or ralmo
+        pbl_heights (pandas dataframe): boundary-layer heights, one row per time
 
     """
     plt.rcParams["figure.figsize"] = (7.5, 4.5)
@@ -70,6 +75,9 @@ def mwr_heatmap(
     if min_value:
         im.set_clim(min_value, max_value)
 
+    if pbl_heights is not None:
+        add_pbl_heights(ax, pbl_heights.index.tolist(), pbl_heights)
+
     # IF no surface_data is added to heatmap, initialise new axes-instace which can be
     # formatted using the concise date formater
     if True:  # surface_data is None:
@@ -78,12 +86,12 @@ def mwr_heatmap(
         ax_date.plot([start, end], [np.NaN, np.NaN])
         ax_date.set_xlim(start, end)
 
-    ax.set_title(f"MWR {var.long_name} @ {station.long_name}: ")
+    ax.set_title(f"{device.upper()} {var.long_name} @ {station.long_name}: ")
     ax.set_ylabel(f"Altitude [m asl]")
     plt.tight_layout()
 
     # save figure
-    filename = f'heatmap_mwr_{start.strftime("%y%m%d_%H")}-{end.strftime("%y%m%d_%H")}_{station.short_name}_{var.short_name}'
+    filename = f'heatmap_{device}_{start.strftime("%y%m%d_%H")}-{end.strftime("%y%m%d_%H")}_{station.short_name}_{var.short_name}'
     if appendix:
         filename = filename + "_" + appendix
 
@@ -6,15 +6,19 @@ Date: 09/03/2022.
 """
 
 # Standard library
+import sys
 from pprint import pprint
 
 # Third-party
 import click
 
 # First-party
+from plot_profile.plot_arome.get_arome import ENS_STATS
 from plot_profile.plot_profiles.get_profiles import get_data
 from plot_profile.plot_profiles.get_profiles import parse_inputs
 from plot_profile.plot_profiles.plot_profiles import create_plot
+from plot_profile.utils.pressure_levels import STANDARD_LEVELS
+from plot_profile.utils.pressure_levels import VCOORDS
 
 # from ipdb import set_trace
 
@@ -61,6 +65,19 @@ from plot_profile.plot_profiles.plot_profiles import create_plot
     default="/store/s83/swester/grids/HEIGHT_ICON-1E.nc",
     help="Icon file containing HEIGHT field. Def: ICON-1E operational 2021",
 )
+# VERTICAL COORDINATE (optional): vcoord, press_levels
+@click.option(
+    "--vcoord",
+    type=click.Choice(VCOORDS, case_sensitive=True),
+    default="height",
+    help="Vertical coordinate: altitude or pressure levels (interpolated in ln(p)). Def: height",
+)
+@click.option(
+    "--press_levels",
+    type=float,
+    multiple=True,
+    help="Pressure levels [hPa] for --vcoord press. Def: standard levels (1000-100 hPa) within --ymin and --ymax.",
+)
 # AXES LIMITS (optional): ymin, ymax, xmin, xmax
 @click.option(
     "--ymin",
@@ -141,6 +158,24 @@ from plot_profile.plot_profiles.plot_profiles import create_plot
     help="Output details on what is happening.",
 )
 @click.option("--colours", multiple=True, help="Overwrite default colours.")
+# PE-AROME (optional): arome_members, ens_stats, workers
+@click.option(
+    "--arome_members",
+    type=int,
+    multiple=True,
+    help="PE-AROME ensemble member(s) to retrieve. Def: deterministic run.",
+)
+@click.option(
+    "--ens_stats",
+    type=click.Choice(ENS_STATS, case_sensitive=True),
+    multiple=True,
+    help="Reduce PE-AROME members to these statistics instead of plotting each member.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    help="Max. number of processes reading PE-AROME members in parallel. Def: #cpus",
+)
 def main(
     *,
     # Mandatory
@@ -152,11 +187,18 @@ def main(
     model_src: tuple,
     height_src: tuple,
     height_file: str,
+    # Vertical coordinate
+    vcoord: str,
+    press_levels: tuple,
     # Axes Limits
     ymin: float,
     ymax: float,
     xmin: tuple,
     xmax: tuple,
+    # PE-AROME
+    arome_members: tuple,
+    ens_stats: tuple,
+    workers: int,
     # Various
     colours: tuple,
     appendix: str,
@@ -172,6 +214,10 @@ def main(
         plot_profiles --loc pay --date 21111900 --add_obs rs temp --add_model icon temp ref --add_model icon temp exp --model_src ref /scratch/swester/output_icon/ICON-1/ 21111812 --model_src exp /scratch/swester/output_icon/exp1/ 21111812
 
     """
+    if ens_stats and not arome_members:
+        print("--- ! --ens_stats requires PE-AROME members (--arome_members).")
+        sys.exit(1)
+
     elements, multi_axes = parse_inputs(
         loc, add_model, add_obs, model_src, height_file, height_src, verbose
     )
@@ -179,12 +225,22 @@ def main(
     if verbose and multi_axes:
         print("Employing two different axes: Bottom and Top.")
 
+    # profiles are retrieved between ymin and ymax (altitude) in any case
+    if vcoord == "press":
+        press_levels = list(press_levels) or STANDARD_LEVELS
+    else:
+        press_levels = None
+
     data_dict, lt_dict = get_data(
         date=date,
         loc=loc,
         ylims=(ymin, ymax),
         elements=elements,
         verbose=verbose,
+        member_ids=list(arome_members),
+        ens_stats=list(ens_stats),
+        workers=workers,
+        press_levels=press_levels,
     )
 
     create_plot(
@@ -201,6 +257,7 @@ def main(
         datatypes=datatypes,
         outpath=outpath,
         multi_axes=multi_axes,
+        vcoord=vcoord,
         verbose=verbose,
     )
 
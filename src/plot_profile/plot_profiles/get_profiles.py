@@ -17,7 +17,10 @@ from plot_profile.plot_arome.get_arome import get_arome_profiles
 from plot_profile.plot_icon.get_icon import get_icon
 from plot_profile.plot_timeseries.parse_timeseries_inputs import check_units
 from plot_profile.utils.calc_new_vars import calc_new_var_profiles
+from plot_profile.utils.derived_cache import derived_key
+from plot_profile.utils.derived_cache import memoised
 from plot_profile.utils.dwh_retrieve import dwh_retrieve
+from plot_profile.utils.pressure_levels import frame_to_pressure
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.utils import calc_qv_from_td
 from plot_profile.utils.utils import check_inputs
@@ -116,14 +119,57 @@ def parse_inputs(loc, add_model, add_obs, model_src, height_file, height_src, ve
     return elements, multi_axes
 
 
+def add_pressure(elements):
+    """Add a press element for every model instance and obs device.
+
+    Args:
+        elements (list):    one tuple per model/obs element (see parse_inputs)
+
+    Returns:
+        list: elements, followed by the missing press elements
+
+    """
+    press_elements = []
+    for element in elements:
+        # models: (model, var, model_id, folder, init, grid); obs: (device, var)
+        press_element = (element[0], "press") + tuple(element[2:])
+        if press_element not in elements and press_element not in press_elements:
+            press_elements.append(press_element)
+
+    return list(elements) + press_elements
+
+
 def get_data(
     date,
     loc,
     ylims,
     elements,
     verbose,
+    member_ids=None,
+    ens_stats=None,
+    workers=None,
+    press_levels=None,
 ):
+    """Retrieve profiles of all elements (models & obs) into a dictionary.
+
+    Args:
+        date (datetime obj):        valid time of the profiles
+        loc (str):                  station short name
+        ylims (tuple):              bottom and top altitude
+        elements (list):            one tuple per model/obs element
+        verbose (bool):             print details
+        member_ids (list of int):   PE-AROME members (Def: deterministic arome)
+        ens_stats (list of str):    reduce PE-AROME members to these statistics
+        workers (int):              max. number of processes reading arome members
+        press_levels (list):        interpolate all profiles to these pressure
+                                    levels in hPa (Def: keep the altitudes)
+
+    Returns:
+        data_dict (dict):   one dataframe per model instance or obs device, with
+                            column height (or press if press_levels are given)
+        lt_dict (dict):     leadtime for each model instance
 
+    """
     # 0) Parse loc / lat / lon input
     ################################
     try:
@@ -152,6 +198,18 @@ def get_data(
             print(f"Specified lon: {lon}")
             print(f"Specified name for location: {loc}")
 
+    # pressure as vertical coordinate: retrieve press along with every
+    #  model instance and obs device
+    if press_levels is not None:
+        if ens_stats or (member_ids and list(member_ids) != [0]):
+            print("--- ! Pressure levels are not available for PE-AROME members yet.")
+            sys.exit(1)
+        for element in elements:
+            if element[0] == "icon" and not vdf[element[1]].icon_hfl:
+                print(f"--- ! {element[1]} is not on the full levels of icon pressure.")
+                sys.exit(1)
+        elements = add_pressure(elements)
+
     # collect data for various devices
     data_dict = {}
 
@@ -175,6 +233,9 @@ def get_data(
             init = element[4]
             grid = element[5]
 
+            # fields and derived variables are memoised for the whole run
+            source = ("icon", folder, init, grid)
+
             if var_name == "wind_vel" or var_name == "wind_dir":
                 var_open_icon = ["u", "v"]
 
@@ -192,27 +253,35 @@ def get_data(
             # the variable column to the already existing dataframe.
             if f"icon~{model_id}" in data_dict:
                 # retrieve data from ICON forecasts
-                tmp_dict = get_icon(
-                    folder=folder,
-                    date=init,
-                    leadtime=[
-                        int((date - init).total_seconds() / 3600)
-                    ],  # full hours!; has to be a list,
-                    lat=lat,
-                    lon=lon,
-                    ind=None,
-                    grid=grid,
-                    variables_list=var_open_icon,
-                    alt_bot=ylims[0],
-                    alt_top=ylims[1],
-                    verbose=verbose,
+                tmp_dict = memoised(
+                    derived_key(source, (lat, lon), date, date, ylims, var_open_icon),
+                    lambda: get_icon(
+                        folder=folder,
+                        date=init,
+                        leadtime=[
+                            int((date - init).total_seconds() / 3600)
+                        ],  # full hours!; has to be a list,
+                        lat=lat,
+                        lon=lon,
+                        ind=None,
+                        grid=grid,
+                        variables_list=var_open_icon,
+                        alt_bot=ylims[0],
+                        alt_top=ylims[1],
+                        verbose=verbose,
+                    ),
+                    verbose,
                 )
 
                 if var_open_icon != var_name:
                     tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
                     tmp_df.set_axis(["height"] + var_open_icon, axis=1, inplace=True)
-                    tmp_df = calc_new_var_profiles(
-                        tmp_df, var_name, device="icon", verbose=verbose
+                    tmp_df = memoised(
+                        derived_key(source, (lat, lon), date, date, ylims, var_name),
+                        lambda: calc_new_var_profiles(
+                            tmp_df, var_name, device="icon", verbose=verbose
+                        ),
+                        verbose,
                     )
 
                 else:
@@ -243,27 +312,35 @@ def get_data(
                 lt_dict[f"icon~{model_id}"] = int((date - init).total_seconds() / 3600)
 
                 # retrieve data from ICON forecasts
-                tmp_dict = get_icon(
-                    folder=folder,
-                    date=init,
-                    leadtime=[
-                        int((date - init).total_seconds() / 3600)
-                    ],  # full hours!; has to be a list,
-                    lat=lat,
-                    lon=lon,
-                    ind=None,
-                    grid=grid,
-                    variables_list=var_open_icon,
-                    alt_bot=ylims[0],
-                    alt_top=ylims[1],
-                    verbose=verbose,
+                tmp_dict = memoised(
+                    derived_key(source, (lat, lon), date, date, ylims, var_open_icon),
+                    lambda: get_icon(
+                        folder=folder,
+                        date=init,
+                        leadtime=[
+                            int((date - init).total_seconds() / 3600)
+                        ],  # full hours!; has to be a list,
+                        lat=lat,
+                        lon=lon,
+                        ind=None,
+                        grid=grid,
+                        variables_list=var_open_icon,
+                        alt_bot=ylims[0],
+                        alt_top=ylims[1],
+                        verbose=verbose,
+                    ),
+                    verbose,
                 )
 
                 if var_open_icon != var_name:
                     tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
                     tmp_df.set_axis(["height"] + var_open_icon, axis=1, inplace=True)
-                    tmp_df = calc_new_var_profiles(
-                        tmp_df, var_name, device="icon", verbose=verbose
+                    tmp_df = memoised(
+                        derived_key(source, (lat, lon), date, date, ylims, var_name),
+                        lambda: calc_new_var_profiles(
+                            tmp_df, var_name, device="icon", verbose=verbose
+                        ),
+                        verbose,
                     )
 
                 else:
@@ -286,6 +363,15 @@ def get_data(
             folder = element[3]
             init = element[4]
 
+            # fields and derived variables are memoised for the whole run
+            source = (
+                "arome",
+                folder,
+                init,
+                tuple(member_ids or [0]),
+                tuple(ens_stats or []),
+            )
+
             # some parameters are not in arome and therefore need to be calculated from other parameters
 
             if var_name == "qv":
@@ -301,24 +387,38 @@ def get_data(
             else:
                 var_open_arome = var_name
 
+            # PE-AROME members or statistics thereof
+            ensemble = bool(ens_stats) or (bool(member_ids) and list(member_ids) != [0])
+            if ensemble and var_open_arome != var_name:
+                print(
+                    f"--- ! {var_name} cannot be calculated for PE-AROME members yet."
+                )
+                sys.exit(1)
+
             # check if a key for this arome-instance (for example arome-ref or arome-exp,...) already exists.
             # if yes --> retrieve df as usual, but instead of assigning it to a new key, only append/concatenate
             # the variable column to the already existing dataframe.
             if f"arome~{model_id}" in data_dict:
                 # retrieve data from AROME forecasts
-                tmp_dict = get_arome_profiles(
-                    folder=folder,
-                    date=init,
-                    leadtime=[
-                        int((date - init).total_seconds() / 3600)
-                    ],  # full hours!; has to be a list,
-                    lat=lat,
-                    lon=lon,
-                    variables_list=var_open_arome,  # list of str or str
-                    member_ids=[0],  # 0 for deterministic model
-                    alt_bot=ylims[0],
-                    alt_top=ylims[1],
-                    verbose=verbose,
+                tmp_dict = memoised(
+                    derived_key(source, (lat, lon), date, date, ylims, var_open_arome),
+                    lambda: get_arome_profiles(
+                        folder=folder,
+                        date=init,
+                        leadtime=[
+                            int((date - init).total_seconds() / 3600)
+                        ],  # full hours!; has to be a list,
+                        lat=lat,
+                        lon=lon,
+                        variables_list=var_open_arome,  # list of str or str
+                        member_ids=member_ids or [0],  # 0 for deterministic model
+                        alt_bot=ylims[0],
+                        alt_top=ylims[1],
+                        verbose=verbose,
+                        ens_stats=ens_stats,
+                        workers=workers,
+                    ),
+                    verbose,
                 )
 
                 # calculate new variables
@@ -327,10 +427,19 @@ def get_data(
                 ):  # equivalent to "if var needs to be calculated"
                     tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
                     tmp_df.set_axis(["height"] + var_open_arome, axis=1, inplace=True)
-                    tmp_df = calc_new_var_profiles(
-                        tmp_df, var_name, device="pe_arome", verbose=verbose
+                    tmp_df = memoised(
+                        derived_key(source, (lat, lon), date, date, ylims, var_name),
+                        lambda: calc_new_var_profiles(
+                            tmp_df, var_name, device="pe_arome", verbose=verbose
+                        ),
+                        verbose,
                     )
 
+                elif ensemble:
+                    # one column per member or statistic, i.e. "temp~mean"
+                    tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
+                    tmp_df.columns = list(tmp_dict.keys())
+
                 else:
                     # re-format output from get_arome_profiles slightly
                     tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
@@ -359,19 +468,25 @@ def get_data(
                 lt_dict[f"arome~{model_id}"] = int((date - init).total_seconds() / 3600)
 
                 # retrieve data from AROME forecasts
-                tmp_dict = get_arome_profiles(
-                    folder=folder,
-                    date=init,
-                    leadtime=[
-                        int((date - init).total_seconds() / 3600)
-                    ],  # full hours!; has to be a list,
-                    lat=lat,
-                    lon=lon,
-                    variables_list=var_open_arome,
-                    member_ids=[0],
-                    alt_bot=ylims[0],
-                    alt_top=ylims[1],
-                    verbose=verbose,
+                tmp_dict = memoised(
+                    derived_key(source, (lat, lon), date, date, ylims, var_open_arome),
+                    lambda: get_arome_profiles(
+                        folder=folder,
+                        date=init,
+                        leadtime=[
+                            int((date - init).total_seconds() / 3600)
+                        ],  # full hours!; has to be a list,
+                        lat=lat,
+                        lon=lon,
+                        variables_list=var_open_arome,
+                        member_ids=member_ids or [0],
+                        alt_bot=ylims[0],
+                        alt_top=ylims[1],
+                        verbose=verbose,
+                        ens_stats=ens_stats,
+                        workers=workers,
+                    ),
+                    verbose,
                 )
 
                 if (
@@ -380,10 +495,19 @@ def get_data(
 
                     tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
                     tmp_df.set_axis(["height"] + var_open_arome, axis=1, inplace=True)
-                    tmp_df = calc_new_var_profiles(
-                        tmp_df, var_name, device="pe_arome", verbose=verbose
+                    tmp_df = memoised(
+                        derived_key(source, (lat, lon), date, date, ylims, var_name),
+                        lambda: calc_new_var_profiles(
+                            tmp_df, var_name, device="pe_arome", verbose=verbose
+                        ),
+                        verbose,
                     )
 
+                elif ensemble:
+                    # one column per member or statistic, i.e. "temp~mean"
+                    tmp_df = pd.concat(tmp_dict, axis=1, ignore_index=True)
+                    tmp_df.columns = list(tmp_dict.keys())
+
                 else:
 
                     # re-format output from get_icon slightly
@@ -487,4 +611,17 @@ def get_data(
 
                 continue
 
+    # interpolate all profiles of a model instance or device to the pressure
+    #  levels at once
+    if press_levels is not None:
+        for key, df in data_dict.items():
+            if "press" not in df:
+                print(f"--- ! No pressure for {key}: cannot use pressure levels.")
+                sys.exit(1)
+            if verbose:
+                print(f"Interpolating {key} to {len(press_levels)} pressure levels.")
+            data_dict[key] = frame_to_pressure(
+                df.drop(columns=["height", "press"]), df["press"], press_levels
+            )
+
     return data_dict, lt_dict
@@ -12,6 +12,7 @@ from pprint import pprint
 import matplotlib.pyplot as plt
 
 # First-party
+from plot_profile.utils.pressure_levels import pressure_axis
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.utils import colour_dict
 from plot_profile.utils.utils import save_fig
@@ -32,6 +33,7 @@ def create_plot(
     datatypes,
     outpath,
     appendix,
+    vcoord="height",
     verbose=True,
 ):
     # get location dataframe
@@ -94,8 +96,8 @@ def create_plot(
             print(i, device)
             pprint(df)
 
-        # y-axis information: altitude
-        altitude = df["height"]
+        # y-axis information: altitude (or pressure)
+        altitude = df[vcoord]
         altitude_min = altitude.min()
 
         if ymin_dynamic == None:
@@ -113,12 +115,19 @@ def create_plot(
 
         # iterate over the columns
         for (variable, columnData) in df.iteritems():
-            if variable == "height":
+            if variable == vcoord:
                 continue
 
             if verbose:
                 print(f"  Variable: {variable}")
 
+            # PE-AROME columns: "temp~3" (member) or "temp~mean" (statistic)
+            variable, _, member = variable.partition("~")
+
+            # the ensemble spread is drawn as shading around the ensemble mean
+            if member == "spread" and f"{variable}~mean" in df.columns:
+                continue
+
             # extract current variable
             variable = vdf[variable]
             unit = variable.unit
@@ -136,6 +145,9 @@ def create_plot(
             else:  # else it is a device
                 label = f"{var_long}: {device.upper()}"
 
+            if member:
+                label = f"{label} {member}"
+
             # define unit for the bottom axis
             if not first_unit:
                 first_unit = unit
@@ -172,10 +184,27 @@ def create_plot(
                     marker=marker,
                     label=label,
                 )
+
+            # shade ensemble mean +/- spread
+            if member == "mean" and f"{variable.short_name}~spread" in df.columns:
+                spread = df[f"{variable.short_name}~spread"].values
+                spread_ax = ax if unit == first_unit else top_ax
+                spread_ax.fill_betweenx(
+                    altitude,
+                    x - spread,
+                    x + spread,
+                    color=colour_dict[colour_index],
+                    alpha=0.2,
+                    label=f"{var_long}: {device.split('~')[0].upper()} spread",
+                )
             colour_index += 1
 
-    # add ylim
-    if ymin == None:
+    # add ylim (pressure: all levels with data)
+    if vcoord == "press":
+        pressure_axis(
+            ax, sorted(set().union(*(df["press"] for df in data_dict.values())))
+        )
+    elif ymin == None:
         ax.set_ylim(ymin_dynamic, ymax)
     else:
         ax.set_ylim(ymin, ymax)
@@ -203,9 +232,13 @@ def create_plot(
         # b) columns: "clct", "sw_up", "temp"
         columns = df.columns
         for column in columns:
-            if column != "height":
+            if column != vcoord:
                 var_dev += f"_{column}"
 
+    # profiles on pressure levels
+    if vcoord == "press":
+        var_dev += "_plev"
+
     filename = f"profiles_{start_str}_{loc.short_name}{var_dev}"
     save_fig(filename, datatypes, outpath, fig=fig)
     plt.clf()
@@ -13,9 +13,14 @@ from pprint import pprint
 import click
 
 # First-party
+from plot_profile.plot_arome.get_arome import ENS_STATS
 from plot_profile.plot_timeseries.get_timeseries import get_timeseries_dict
 from plot_profile.plot_timeseries.parse_timeseries_inputs import parse_inputs
+from plot_profile.plot_timeseries.plot_timeseries import create_network_plot
 from plot_profile.plot_timeseries.plot_timeseries import create_plot
+from plot_profile.utils.dwh_retrieve import AGGREGATION_STATS
+from plot_profile.utils.dwh_retrieve import dwh_retrieve_stations
+from plot_profile.utils.dwh_retrieve import network_stations
 from plot_profile.utils.utils import parse_grid_file
 
 # from ipdb import set_trace
@@ -147,6 +152,34 @@ from plot_profile.utils.utils import parse_grid_file
     multiple=True,
     help="Specify which device/variable should be added to plot.",
 )
+@click.option(
+    "--network",
+    type=(str, str),
+    help="Compare one device/variable at all stations (in one DWH retrieve). --loc is highlighted.",
+)
+@click.option(
+    "--aggregate",
+    type=(str, click.Choice(AGGREGATION_STATS)),
+    help="Aggregate observations to a coarser resolution, i.e. --aggregate 1H mean."
+    + " Def: full resolution",
+)
+@click.option(
+    "--arome_members",
+    type=int,
+    multiple=True,
+    help="PE-AROME ensemble member(s) to retrieve. Def: deterministic run.",
+)
+@click.option(
+    "--ens_stats",
+    type=click.Choice(ENS_STATS, case_sensitive=True),
+    multiple=True,
+    help="Reduce PE-AROME members to these statistics instead of plotting each member.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    help="Max. number of processes reading PE-AROME members in parallel. Def: #cpus",
+)
 def main(
     *,
     # Mandatory
@@ -159,6 +192,11 @@ def main(
     add_model: tuple,
     model_src: tuple,
     add_obs: tuple,
+    network: tuple,
+    aggregate: tuple,
+    arome_members: tuple,
+    ens_stats: tuple,
+    workers: int,
     # Mandatory for ICON
     height_file: str,
     # Optional
@@ -177,9 +215,51 @@ def main(
     Example commands:
     plot_timeseries --loc pay --start 21111900 --end 21111912 --add_obs 2m ver_vis --add_obs 2m cbh
     plot_timeseries --loc pay --start 21111900 --end 21111906 --add_model icon temp 1 ref --add_model icon temp 1 exp --add_obs 10m_tower temp --model_src ref /scratch/swester/output_icon/ICON-1/ 21111812 --model_src exp /scratch/swester/output_icon/exp1/ 21111812
+    PE-AROME ensemble statistics:
+    plot_timeseries --loc pay --start 21111900 --end 21111912 --add_model arome temp 1 pe --model_src pe /scratch/adandoy/AROME/ 21111812 --arome_members 1 --arome_members 2 --arome_members 3 --ens_stats mean --ens_stats q10 --ens_stats q90
+    network-wide:
+    plot_timeseries --loc pay --start 21111900 --end 21111912 --network 2m temp
+    hourly means of a long period:
+    plot_timeseries --loc pay --start 21110100 --end 21113000 --add_obs 2m temp --aggregate 1H mean
     old way:
     plot_timeseries --loc gla --start 21111900 --end 21111902 --device 5cm --device 2m --var temp
     """
+    if ens_stats and not arome_members:
+        print("--- ! --ens_stats requires PE-AROME members (--arome_members).")
+        sys.exit(1)
+
+    if network:
+        device, variable = network
+        data = dwh_retrieve_stations(
+            device=device,
+            stations=network_stations(),
+            vars=variable,
+            timestamps=[start, end],
+            verbose=verbose,
+            aggregation=aggregate,
+        )
+        if data.empty:
+            print(f"--- ! No {variable} data for {device} in the network.")
+            sys.exit(1)
+
+        create_network_plot(
+            data=data,
+            variable=variable,
+            device=device,
+            location=loc,
+            start=start,
+            end=end,
+            ymin=ymin,
+            ymax=ymax,
+            grid=grid,
+            datatypes=datatypes,
+            outpath=outpath,
+            appendix=appendix,
+            verbose=verbose,
+        )
+        print("--- done")
+        return
+
     elements, multi_axes = parse_inputs(
         loc, var, device, add_model, add_obs, model_src, verbose
     )
@@ -194,6 +274,10 @@ def main(
         loc=loc,
         height_file=height_file,
         verbose=verbose,
+        member_ids=list(arome_members),
+        ens_stats=list(ens_stats),
+        workers=workers,
+        aggregation=aggregate,
     )
 
     create_plot(
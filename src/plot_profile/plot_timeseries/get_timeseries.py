@@ -1,5 +1,7 @@
 """Retrieve available data into dict for timeseries plots."""
 # Standard library
+import sys
+from functools import partial
 from pprint import pprint
 
 # Third-party
@@ -11,12 +13,20 @@ from plot_profile.plot_arome.get_arome import get_arome_hm
 from plot_profile.plot_arome.get_arome import get_arome_timeseries
 from plot_profile.plot_icon.get_icon import get_icon_hm
 from plot_profile.plot_icon.get_icon import get_icon_timeseries
+from plot_profile.utils import convection
 from plot_profile.utils.calc_new_vars import calc_new_var_timeseries
+from plot_profile.utils.derived_cache import derived_key
+from plot_profile.utils.derived_cache import memoised
 from plot_profile.utils.dwh_retrieve import dwh_retrieve
+from plot_profile.utils.level_matrix import level_frame
+from plot_profile.utils.profile_array import profiles_to_array
 from plot_profile.utils.stations import sdf
 
 # from ipdb import set_trace
 
+# radiosoundings are interpolated to these altitudes (m asl) for parcel ascents
+RS_LEVELS = np.arange(0, 20001, 50)
+
 
 def get_arome():
     # TODO: implement function to retrieve data from AROME model (.csv, .nc, whatever)
@@ -24,9 +34,110 @@ def get_arome():
     return print("should return AROME dataframe at this point")
 
 
-def get_timeseries_dict(start, end, elements, loc, height_file, verbose):
+def get_rs_indices(loc, start, end, var_name, verbose=False):
+    """Convective index of all radiosoundings between start and end.
+
+    Args:
+        loc (str):                  station short name
+        start, end (datetime obj):  time range
+        var_name (str):             cape, cin, lcl or li (see utils.convection)
+        verbose (bool):             print details
+
+    Returns:
+        pandas dataframe: columns timestamp and var_name
+
+    """
+    variables = ["press", "temp", "dewp_temp"]
+    profiles = dwh_retrieve(
+        device="rs",
+        station=loc,
+        vars=variables,
+        timestamps=[start, end],
+        levels=RS_LEVELS,
+        verbose=verbose,
+    )
+
+    # only 1 sounding: long dataframe
+    if isinstance(profiles, pd.DataFrame):
+        if profiles.empty:
+            return profiles
+        profiles = profiles_to_array(profiles, variables, RS_LEVELS, verbose)
+
+    return convection.sounding_indices(profiles)[["timestamp", var_name]]
+
+
+def model_timeseries(
+    source, loc, start, end, levels, var_name, var_open, read, verbose=False
+):
+    """Read the model fields var_open and derive var_name from them (memoised).
+
+    Args:
+        source (tuple):             model run (see utils.derived_cache)
+        loc (str):                  station short name
+        start, end (datetime obj):  time range
+        levels (list):              model levels (or altitudes)
+        var_name (str):             requested variable
+        var_open (str or list):     variable(s) in the model output
+        read (callable):            read() -> (time, level) dataset of var_open
+        verbose (bool):             print details
+
+    Returns:
+        xarray dataset
+
+    """
+    data = memoised(
+        derived_key(source, loc, start, end, levels, var_open), read, verbose
+    )
+
+    # calculate new variables
+    if var_name != var_open:  # equivalent to "if var needs to be calculated"
+        data = memoised(
+            derived_key(source, loc, start, end, levels, var_name),
+            lambda: calc_new_var_timeseries(
+                data, var_name, levels, sdf[loc].lat, sdf[loc].lon, verbose
+            ),
+            verbose,
+        )
+
+    return data
+
+
+def get_timeseries_dict(
+    start,
+    end,
+    elements,
+    loc,
+    height_file,
+    verbose,
+    member_ids=None,
+    ens_stats=None,
+    workers=None,
+    aggregation=None,
+):
+    """Retrieve data of all elements (models & obs) into a dictionary.
+
+    Args:
+        start (datetime obj):       start time
+        end (datetime obj):         end time
+        elements (list):            one tuple per model/obs element
+        loc (str):                  station short name
+        height_file (str):          icon file containing HEIGHT field
+        verbose (bool):             print details
+        member_ids (list of int):   PE-AROME members (Def: deterministic arome)
+        ens_stats (list of str):    reduce PE-AROME members to these statistics
+        workers (int):              max. number of processes reading arome members
+        aggregation (tuple):        aggregate observations: frequency and
+                                    statistic, i.e. ("1H", "mean")
+
+    Returns:
+        dict: one dataframe per model instance or obs device
+
+    """
     timeseries_dict = {}
 
+    # model data: one (time, level) dataset per element (see utils.level_matrix)
+    model_data = {}
+
     # loop over elements
     for element in elements:
 
@@ -41,6 +152,9 @@ def get_timeseries_dict(start, end, elements, loc, height_file, verbose):
             folder = element[4]
             init = element[5]
 
+            # fields and derived variables are memoised for the whole run
+            source = ("icon", folder, init)
+
             do_interpolation = False  # False by default, can be set to True later
             # if True, we need to call a different function in order to interpolate vertically model outputs
 
@@ -66,109 +180,56 @@ def get_timeseries_dict(start, end, elements, loc, height_file, verbose):
             elif var_name == "pot_temp":
                 var_open_icon = ["temp", "press"]
 
+            elif var_name in convection.INDICES:
+                # parcel ascent through all levels of the column
+                var_open_icon = ["press", "temp", "qv"]
+                levels = None
+
             else:
                 var_open_icon = var_name
 
-            # check if a key for this icon-instance (for example icon-ref or icon-exp,...) already exists.
-            # if yes --> retrieve df as usual, but instead of assigning it to a new key, only append/concatenate
-            # the variable column to the already existing dataframe.
-            if f"icon~{id}" in timeseries_dict:
-
-                if do_interpolation == True:
-                    df = get_icon_hm(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        var=var_open_icon,
-                        init=init,
-                        height_list=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        height_file=height_file,
-                        verbose=verbose,
-                    )
-                    do_interpolation = False  # reset
-
-                else:
-                    df = get_icon_timeseries(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        vars=var_open_icon,
-                        init=init,
-                        level=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        height_file=height_file,
-                        verbose=verbose,
-                    )
-
-                # calculate new variables
-                if (
-                    var_name != var_open_icon
-                ):  # equivalent to "if var needs to be calculated"
-                    df = calc_new_var_timeseries(
-                        df, var_name, levels, sdf[loc].lat, sdf[loc].lon, verbose
-                    )
-
-                del df["timestamp"]
-                timeseries_dict[f"icon~{id}"] = pd.concat(
-                    [timeseries_dict[f"icon~{id}"], df], axis=1
+            # leadtimes in full hours!
+            start_lt = int((start - init).total_seconds() / 3600)
+            end_lt = int((end - init).total_seconds() / 3600)
+
+            if do_interpolation == True:
+                source += ("hm",)
+                read = partial(
+                    get_icon_hm,
+                    lat=sdf[loc].lat,
+                    lon=sdf[loc].lon,
+                    var=var_open_icon,
+                    init=init,
+                    height_list=levels,
+                    start_lt=start_lt,
+                    end_lt=end_lt,
+                    folder=folder,
+                    height_file=height_file,
+                    verbose=verbose,
                 )
 
-                # print(id, timeseries_dict[f"icon~{id}"].columns.tolist(), df.columns.tolist())
-
             else:
+                read = partial(
+                    get_icon_timeseries,
+                    lat=sdf[loc].lat,
+                    lon=sdf[loc].lon,
+                    vars=var_open_icon,
+                    init=init,
+                    level=levels,
+                    start_lt=start_lt,
+                    end_lt=end_lt,
+                    folder=folder,
+                    height_file=height_file,
+                    verbose=verbose,
+                )
 
-                if do_interpolation == True:
-                    df = get_icon_hm(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        var=var_open_icon,
-                        init=init,
-                        height_list=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        height_file=height_file,
-                        verbose=verbose,
-                    )
-                    do_interpolation = False  # reset
-
-                else:
-                    df = timeseries_dict[f"icon~{id}"] = get_icon_timeseries(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        vars=var_open_icon,
-                        init=init,
-                        level=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        height_file=height_file,
-                        verbose=verbose,
-                    )
-
-                # calculate new variables
-                if (
-                    var_name != var_open_icon
-                ):  # equivalent to "if var needs to be calculated"
-                    df = calc_new_var_timeseries(
-                        df, var_name, levels, sdf[loc].lat, sdf[loc].lon, verbose
-                    )
-
-                timeseries_dict[f"icon~{id}"] = df
-
-            # increase icon index
-            continue
+            data = model_timeseries(
+                source, loc, start, end, levels, var_name, var_open_icon, read, verbose
+            )
+
+            # collect all variables of this icon-instance (for example icon-ref or icon-exp,...)
+            model_data.setdefault(f"icon~{id}", []).append(data)
+            timeseries_dict.setdefault(f"icon~{id}", None)
 
         # AROME
         elif element[0] == "arome":
@@ -178,6 +239,15 @@ def get_timeseries_dict(start, end, elements, loc, height_file, verbose):
             folder = element[4]
             init = element[5]
 
+            # fields and derived variables are memoised for the whole run
+            source = (
+                "arome",
+                folder,
+                init,
+                tuple(member_ids or []),
+                tuple(ens_stats or []),
+            )
+
             do_interpolation = False  # False by default, can be set to True later
             # if True, we need to call a different function in order to interpolate vertically model outputs
 
@@ -200,115 +270,85 @@ def get_timeseries_dict(start, end, elements, loc, height_file, verbose):
                 var_open_arome = ["press", "temp", "qc", "rel_hum"]
                 levels = np.arange(1, 21)
 
+            elif var_name in convection.INDICES:
+                # parcel ascent through all levels of the column
+                var_open_arome = ["press", "temp", "dewp_temp"]
+                levels = None
+
             else:
                 var_open_arome = var_name
 
-            if f"arome~{id}" in timeseries_dict:
+            if (member_ids or ens_stats) and var_open_arome != var_name:
+                print(
+                    f"--- ! {var_name} cannot be calculated for PE-AROME members yet."
+                )
+                sys.exit(1)
+
+            # leadtimes in full hours!
+            start_lt = int((start - init).total_seconds() / 3600)
+            end_lt = int((end - init).total_seconds() / 3600)
 
+            if do_interpolation == True:
                 # to calculate some kind of variables we need the levels in meters
                 # and the values needs to be extrapolated for comparison
-                if do_interpolation == True:
-                    df = get_arome_hm(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        var=var_open_arome,
-                        init=init,
-                        height_list=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        verbose=verbose,
-                    )
-                    do_interpolation = False  # reset
-
-                else:
-                    df = get_arome_timeseries(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        vars=var_open_arome,
-                        init=init,
-                        levels=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        verbose=verbose,
-                    )
-
-                # calculate new variables
-                if (
-                    var_name != var_open_arome
-                ):  # equivalent to "if var needs to be calculated"
-                    df = calc_new_var_timeseries(
-                        df, var_name, levels, sdf[loc].lat, sdf[loc].lon, verbose
-                    )
-
-                del df["timestamp"]
-                timeseries_dict[f"arome~{id}"] = pd.concat(
-                    [timeseries_dict[f"arome~{id}"], df], axis=1
+                source += ("hm",)
+                read = partial(
+                    get_arome_hm,
+                    lat=sdf[loc].lat,
+                    lon=sdf[loc].lon,
+                    var=var_open_arome,
+                    init=init,
+                    height_list=levels,
+                    start_lt=start_lt,
+                    end_lt=end_lt,
+                    folder=folder,
+                    verbose=verbose,
                 )
 
-                # print(id, timeseries_dict[f"icon~{id}"].columns.tolist(), df.columns.tolist())
-
             else:
-                if do_interpolation == True:
-                    df = get_arome_hm(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        var=var_open_arome,
-                        init=init,
-                        height_list=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        verbose=verbose,
-                    )
-                    do_interpolation = False  # reset
-
-                else:
-                    df = get_arome_timeseries(
-                        lat=sdf[loc].lat,
-                        lon=sdf[loc].lon,
-                        vars=var_open_arome,
-                        init=init,
-                        levels=levels,
-                        start_lt=int(
-                            (start - init).total_seconds() / 3600
-                        ),  # full hours!
-                        end_lt=int((end - init).total_seconds() / 3600),  # full hours!
-                        folder=folder,
-                        verbose=verbose,
-                    )
-
-                # calculate new variables
-                if (
-                    var_name != var_open_arome
-                ):  # equivalent to "if var needs to be calculated"
-                    df = calc_new_var_timeseries(
-                        df, var_name, levels, sdf[loc].lat, sdf[loc].lon, verbose
-                    )
-
-                timeseries_dict[f"arome~{id}"] = df
-
-            continue
+                read = partial(
+                    get_arome_timeseries,
+                    lat=sdf[loc].lat,
+                    lon=sdf[loc].lon,
+                    vars=var_open_arome,
+                    init=init,
+                    levels=levels,
+                    start_lt=start_lt,
+                    end_lt=end_lt,
+                    folder=folder,
+                    verbose=verbose,
+                    member_ids=member_ids,
+                    ens_stats=ens_stats,
+                    workers=workers,
+                )
+
+            data = model_timeseries(
+                source, loc, start, end, levels, var_name, var_open_arome, read, verbose
+            )
+
+            model_data.setdefault(f"arome~{id}", []).append(data)
+            timeseries_dict.setdefault(f"arome~{id}", None)
 
         # OBS from DWH
         else:
             device = element[0]
-            data = dwh_retrieve(
-                device=device,
-                station=loc,
-                vars=var_name,
-                timestamps=[start, end],
-                verbose=verbose,
-            )
+            if device == "rs" and var_name in convection.INDICES:
+                data = get_rs_indices(loc, start, end, var_name, verbose)
+            else:
+                data = dwh_retrieve(
+                    device=device,
+                    station=loc,
+                    vars=var_name,
+                    timestamps=[start, end],
+                    verbose=verbose,
+                    aggregation=aggregation,
+                )
 
             if not data.empty:
                 timeseries_dict[f"{device}~{var_name}"] = data
 
+    # "var~level" column labels are only added for plotting
+    for model, datasets in model_data.items():
+        timeseries_dict[model] = level_frame(datasets)
+
     return timeseries_dict
@@ -19,6 +19,7 @@ munits.registry[datetime.datetime] = converter
 # First-party
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.utils import colour_dict
+from plot_profile.utils.utils import get_cubehelix_colors
 from plot_profile.utils.utils import save_fig
 from plot_profile.utils.variables import vdf
 
@@ -127,7 +128,9 @@ def create_plot(
             pprint(df)
 
         # x-axis information: dates/timestamps
-        dates = pd.to_datetime(df["timestamp"], format="%Y-%m-%d %H:%M:%S")
+        dates = df["timestamp"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, format="%Y-%m-%d %H:%M:%S")
 
         # check if there are more than one variable in this dataframe
         if verbose:
@@ -157,8 +160,15 @@ def create_plot(
                 marker = None
 
             # it is only possible for ICON variables to have '~' in them, because a level has to be specified.
+            # PE-AROME columns carry a third part: the member or ensemble statistic
+            member = None
             if "~" in variable:
-                var, level = (variable.split(sep="~"))[0], (variable.split(sep="~"))[1]
+                parts = variable.split(sep="~")
+                var, level = parts[0], parts[1]
+                if len(parts) > 2:
+                    member = parts[2]
+                    if level == "0":
+                        level = None
                 variable = var
                 model = True
 
@@ -178,6 +188,8 @@ def create_plot(
                         label = f"{var_long}: {device.split('~')[0].upper()}"
                     else:
                         label = f"{var_long}: {device.split('~')[0].upper()} (Level: {level})"
+                if member:
+                    label = f"{label} {member}"
 
             # for observations, the label looks a bit differently
             if not model:  # 'icon' not in device and 'arome' not in device:
@@ -261,3 +273,83 @@ def create_plot(
     save_fig(filename, datatypes, outpath, fig=fig)
     plt.clf()
     return
+
+
+def create_network_plot(
+    data,
+    variable,
+    device,
+    location,
+    start,
+    end,
+    ymin,
+    ymax,
+    grid,
+    datatypes,
+    outpath,
+    appendix,
+    verbose,
+):
+    """Create timeseries plot of one variable at all stations of the network.
+
+    Args:
+        data (dataframe): (station, timestamp) index, column for the variable
+        variable (str): variable short name
+        device (str): measurement device, i.e. 2m
+        location (str): station to highlight (black line)
+        start (datetime obj): start time
+        end (datetime obj): end time
+        ymin (tuple): y-min value
+        ymax (tuple): y-max value
+        grid (bool): add grid to plot or not
+        datatypes (tuple): output data types
+        outpath (str): output folder path
+        appendix (str): add appendix to output name
+        verbose (bool): print details
+
+    """
+    var = vdf[variable]
+    stations = data.index.get_level_values("station").unique()
+    colours = get_cubehelix_colors(len(stations), start=0.2, stop=0.8)
+
+    fig, ax = plt.subplots(1, 1, figsize=(8, 5), constrained_layout=True)
+    if grid:
+        ax.grid(visible=True)
+    if ymin and ymax:
+        ax.set_ylim(ymin[0], ymax[0])
+
+    for i, station in enumerate(stations):
+        df = data.xs(station, level="station")
+        if verbose:
+            print(f"  {station}: {len(df)} values")
+
+        if station == location:
+            continue
+        ax.plot(df.index, df[variable], color=colours[i], linewidth=0.6, alpha=0.6)
+
+    # highlight selected station on top of the others
+    if location in stations:
+        df = data.xs(location, level="station")
+        ax.plot(
+            df.index,
+            df[variable],
+            color="black",
+            linewidth=1.5,
+            label=sdf[location].long_name,
+        )
+        ax.legend(fontsize="small")
+
+    ax.set_xlim(start, end)
+    ax.set_ylabel(f"{var.unit}")
+    title = f"{var.long_name} @ {device.upper()}, {len(stations)} stations: {start.strftime('%d. %b, %H:%M')} - {end.strftime('%d. %b, %H:%M')}"
+    ax.set_title(label=title)
+
+    # filename
+    start_str = start.strftime("%y%m%d_%H")
+    end_str = end.strftime("%y%m%d_%H")
+    filename = f"timeseries_{start_str}-{end_str}_network_{device}_{variable}"
+    if appendix:
+        filename = f"{filename}_{appendix}"
+    save_fig(filename, datatypes, outpath, fig=fig)
+    plt.clf()
+    return
@@ -0,0 +1,224 @@
+"""Purpose: Boundary-layer and inversion heights of time-height blocks.
+
+The heights are diagnosed for a whole block of columns (i.e. all leadtimes
+of an ICON run or all MWR retrievals of a period) at once, with the columns
+as numpy array operations:
+    parcel      top of the mixed layer: lowest height where the potential
+                temperature exceeds its surface value by PARCEL_EXCESS
+                (parcel method, Holzworth 1964)
+    theta_grad  inversion height: middle of the layer with the strongest
+                positive potential temperature gradient
+    bulk_ri     lowest height where the bulk Richardson number exceeds
+                RI_CRIT (Seibert et al. 2000, surface wind of 0 m/s)
+The surface is the lowest level of a column with a valid potential
+temperature. Heights are interpolated linearly between the levels and are
+NaN if the criterion is not met within the column (or bulk_ri without wind).
+
+Without pressure (MWR), the potential temperature is approximated by the
+static temperature T + g/cp * (z - z_sfc).
+
+Date: 19/10/2026.
+"""
+
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.utils import thermo
+
+METHODS = ["parcel", "theta_grad", "bulk_ri"]
+
+GRAVITY = 9.81  # m/s2
+PARCEL_EXCESS = 0.5  # potential temperature excess of the parcel (K)
+RI_CRIT = 0.25  # critical bulk Richardson number
+MIN_WIND = 0.1  # lower limit of the wind speed in the bulk Richardson number (m/s)
+
+# line appearance of the methods on heatmaps
+PBL_STYLES = {
+    "parcel": dict(color="black", linestyle="-", label="PBL (parcel)"),
+    "theta_grad": dict(color="black", linestyle="--", label="Inversion (dθ/dz)"),
+    "bulk_ri": dict(color="black", linestyle=":", label="PBL (bulk Ri)"),
+}
+
+
+def static_temperature(height, temp, temp_unit="degC", axis=-1):
+    """Potential temperature approximation without pressure: T + g/cp * (z - z_sfc).
+
+    Args:
+        height      (array):    altitude (m), broadcastable against temp
+        temp        (array):    temperature
+        temp_unit   (str):      unit of temp
+        axis        (int):      vertical axis
+
+    Returns:
+        array: K
+
+    """
+    height = np.asarray(height, dtype="float64")
+    temp = thermo.to_kelvin(np.asarray(temp, dtype="float64"), temp_unit)
+    surface = np.nanmin(np.broadcast_to(height, temp.shape), axis=axis, keepdims=True)
+    return temp + GRAVITY / thermo.CP_D * (height - surface)
+
+
+def take_index(values, index):
+    """Values at one level index (..., 1) per column."""
+    return np.take_along_axis(values, index, axis=-1)[..., 0]
+
+
+def first_crossing(height, excess, start):
+    """Interpolated height where excess first becomes positive above start.
+
+    Args:
+        height  (array):    altitude (m), (..., level) bottom-up
+        excess  (array):    criterion (..., level), positive = exceeded
+        start   (array):    index of the surface level (...)
+
+    Returns:
+        array: height (...), NaN if never exceeded
+
+    """
+    levels = np.arange(height.shape[-1])
+    with np.errstate(invalid="ignore"):
+        exceeded = (excess > 0) & (levels > start[..., None])
+    found = exceeded.any(axis=-1)
+    upper = np.argmax(exceeded, axis=-1)[..., None]
+    lower = np.maximum(upper - 1, 0)
+
+    z_lower, z_upper = (take_index(height, i) for i in (lower, upper))
+    e_lower, e_upper = (take_index(excess, i) for i in (lower, upper))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        crossing = z_lower + (z_upper - z_lower) * -e_lower / (e_upper - e_lower)
+    # missing level below the crossing: take the level above
+    crossing = np.where(np.isfinite(crossing), crossing, z_upper)
+    return np.where(found, crossing, np.nan)
+
+
+def pbl_heights(height, pot_temp, wind_u=None, wind_v=None, axis=-1, methods=METHODS):
+    """Boundary-layer and inversion heights of a block of columns.
+
+    Args:
+        height      (array):            altitude (m), broadcastable against pot_temp
+        pot_temp    (array):            (virtual) potential temperature (K)
+        wind_u      (array):            zonal wind (m/s), only for bulk_ri
+        wind_v      (array):            meridional wind (m/s), only for bulk_ri
+        axis        (int):              vertical axis (either direction)
+        methods     (list of str):      subset of METHODS
+
+    Returns:
+        dict: method -> height (m, same reference as height) without the
+              vertical axis
+
+    """
+    pot_temp = np.asarray(pot_temp, dtype="float64")
+    height = np.broadcast_to(np.asarray(height, dtype="float64"), pot_temp.shape)
+    height, pot_temp = (np.moveaxis(values, axis, -1) for values in (height, pot_temp))
+    has_wind = wind_u is not None and wind_v is not None
+    if has_wind:
+        speed = np.moveaxis(
+            thermo.wind_speed(
+                *np.broadcast_arrays(np.asarray(wind_u), np.asarray(wind_v))
+            ),
+            axis,
+            -1,
+        )
+
+    # bottom-up: lowest altitude first
+    flip = np.nansum(np.diff(height, axis=-1)) < 0
+    if flip:
+        height, pot_temp = height[..., ::-1], pot_temp[..., ::-1]
+        if has_wind:
+            speed = speed[..., ::-1]
+
+    # surface: lowest valid level
+    valid = np.isfinite(pot_temp) & np.isfinite(height)
+    start = np.argmax(valid, axis=-1)
+    no_data = ~valid.any(axis=-1)
+    z_sfc = np.take_along_axis(height, start[..., None], -1)
+    theta_sfc = np.take_along_axis(pot_temp, start[..., None], -1)
+
+    heights = {}
+    if "parcel" in methods:
+        excess = pot_temp - (theta_sfc + PARCEL_EXCESS)
+        heights["parcel"] = first_crossing(height, excess, start)
+
+    if "theta_grad" in methods:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gradient = np.diff(pot_temp, axis=-1) / np.diff(height, axis=-1)
+        gradient = np.where(np.isfinite(gradient), gradient, -np.inf)
+        strongest = np.argmax(gradient, axis=-1)[..., None]
+        middle = (take_index(height, strongest) + take_index(height, strongest + 1)) / 2
+        inversion = take_index(gradient, strongest) > 0
+        heights["theta_grad"] = np.where(inversion, middle, np.nan)
+
+    if "bulk_ri" in methods:
+        if has_wind:
+            with np.errstate(invalid="ignore"):
+                ri = (
+                    GRAVITY
+                    / theta_sfc
+                    * (pot_temp - theta_sfc)
+                    * (height - z_sfc)
+                    / np.maximum(speed, MIN_WIND) ** 2
+                )
+            heights["bulk_ri"] = first_crossing(height, ri - RI_CRIT, start)
+        else:
+            heights["bulk_ri"] = np.full(start.shape, np.nan)
+
+    return {
+        method: np.where(no_data, np.nan, values) for method, values in heights.items()
+    }
+
+
+def frame_pbl_heights(pot_temp, wind_u=None, wind_v=None, methods=METHODS):
+    """Boundary-layer and inversion heights of a heatmap dataframe.
+
+    Args:
+        pot_temp    (pandas dataframe): potential temperature (K), altitude as
+                                        index, one column per time
+        wind_u      (pandas dataframe): zonal wind (m/s), same shape
+        wind_v      (pandas dataframe): meridional wind (m/s), same shape
+        methods     (list of str):      subset of METHODS
+
+    Returns:
+        pandas dataframe: one row per time (column of pot_temp), one column
+                          per method
+
+    """
+    winds = [
+        None if wind is None else wind.to_numpy(dtype="float64")
+        for wind in (wind_u, wind_v)
+    ]
+    heights = pbl_heights(
+        pot_temp.index.to_numpy(dtype="float64")[:, None],
+        pot_temp.to_numpy(dtype="float64"),
+        *winds,
+        axis=0,
+        methods=methods,
+    )
+    return pd.DataFrame(heights, index=pot_temp.columns)
+
+
+def add_pbl_heights(ax, times, heights):
+    """Overlay the boundary-layer heights as lines on a heatmap.
+
+    Args:
+        ax      (matplotlib axes):  axes of the heatmap
+        times   (list):             x-values of the heatmap columns
+        heights (pandas dataframe): see frame_pbl_heights
+
+    """
+    # keep the altitude range of the heatmap
+    ylim = ax.get_ylim()
+    for method in heights.columns:
+        ax.plot(times, heights[method].values, linewidth=1.5, **PBL_STYLES[method])
+    ax.set_ylim(ylim)
+    ax.legend(loc="upper left", fontsize=8)
+
+
+if __name__ == "__main__":
+    # mixed layer up to 800 m (θ = 290 K) below an inversion of 5 K / 100 m
+    height = np.arange(0.0, 2001.0, 50.0)
+    inversion = np.clip(height - 800, 0, 100) / 20
+    pot_temp = 290 + inversion + 0.003 * np.clip(height - 900, 0, None)
+    print(pbl_heights(height, pot_temp, np.full(height.shape, 5.0), 0))
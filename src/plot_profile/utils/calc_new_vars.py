@@ -1,22 +1,34 @@
 """Calculate vars that are not in models/observations output files.
 
+The formulas are implemented in plot_profile.utils.thermo; the functions
+below convert the units and naming of the model and observation readers.
+
 Author: Arthur Dandoy
 """
 
 # Standard library
 import sys
+from functools import lru_cache
 
 # Third-party
 import numpy as np
 import pandas as pd
+import xarray as xr
 #from ipdb import set_trace
 
 # First-party
+from plot_profile.plot_arome.arome_points import arome_point
 from plot_profile.plot_arome.get_arome import calc_arome_height_agl
-from plot_profile.plot_arome.get_arome import coord_2_arome_pts
+from plot_profile.utils import convection
+from plot_profile.utils import thermo
 from plot_profile.utils.variables import vdf
 
 
+def temp_unit(temperature_metric):
+    """Translate a temperature_metric ("celsius" or "kelvin") to a thermo unit."""
+    return "degC" if temperature_metric == "celsius" else "K"
+
+
 def calculate_grad(var_bot, var_top, alt_bot, alt_top, verbose=False):
     """Calculate vertical gradient.
 
@@ -31,9 +43,7 @@ def calculate_grad(var_bot, var_top, alt_bot, alt_top, verbose=False):
     if verbose:
         print("Calculating vertical gradient.")
 
-    grad = (var_top - var_bot) / (alt_top - alt_bot)
-
-    return grad
+    return thermo.vertical_gradient(var_bot, var_top, alt_bot, alt_top)
 
 def calculate_pot_temp(temp, press, temperature_metric="celsius", verbose=False):
     """Calculate potential temperature from temperature.
@@ -47,22 +57,12 @@ def calculate_pot_temp(temp, press, temperature_metric="celsius", verbose=False)
         pandas series: potential temperature timeseries (in K)
 
     """
-    
-    #defining parameters
-    press_r = 1000.0                  #reference pressure (hPa)
-    Rd = 287.0                        #specific gas constant for dry air (J/kg*K)
-    cp = 1004.0                       #speific heat of dry air at constant pressure (J/kg*K)
-
-    #convert from °C to K
-    t_kelvin = np.zeros(len(temp)) ; t_kelvin = temp + 273
-
     if verbose:
         print("Calculating potential Temperature.")
-    
-    #compute potential temperature
-    pot_temp = t_kelvin*(press_r/press)**(Rd/cp)
 
-    return pot_temp
+    return thermo.potential_temperature(
+        temp, press, temp_unit=temp_unit(temperature_metric)
+    )
 
 def calculate_tdew_from_rh(rh, T, temperature_metric="celsius", verbose=False):
     """Calculate dew point temperature from relative humidity and temperature.
@@ -81,19 +81,7 @@ def calculate_tdew_from_rh(rh, T, temperature_metric="celsius", verbose=False):
             "Calculating dew point temperature (dewp_temp) from relative humidity and temp."
         )
 
-    if temperature_metric != "celsius":
-        if verbose:
-            print("Assuming input temperature unit is Kelvin for rh calculation.")
-        T = T - 273  # K to °C
-
-    # inspired from humidity.to.dewpoint in:
-    # https://github.com/geanders/weathermetrics/blob/master/R/moisture_conversions.R
-    Tdew = (rh / 100) ** (1 / 8) * (112 + (0.9 * T)) - 112 + (0.1 * T)  # in °C
-
-    if temperature_metric != "celsius":
-        Tdew = Tdew + 273  # °C to K
-
-    return Tdew
+    return thermo.dewpoint_from_rh(rh, T, temp_unit=temp_unit(temperature_metric))
 
 
 def calculate_rh_from_qv(T, qv, Press=1013.5, verbose=False):
@@ -102,7 +90,7 @@ def calculate_rh_from_qv(T, qv, Press=1013.5, verbose=False):
     Args:
         Press (pd series):   air pressure in hPa
         T (pd series):       air temperature in °C
-        qv (pd series):      specific humidity in kg/kg
+        qv (pd series):      specific humidity in g/kg
 
     Returns:
         pandas series: relative humidity series in %
@@ -113,20 +101,7 @@ def calculate_rh_from_qv(T, qv, Press=1013.5, verbose=False):
             "Calculating relative humidity (rh) from specific humidity, press and temp."
         )
 
-    # inspired from "qair2rh" function in:
-    # https://github.com/PecanProject/pecan/blob/master/modules/data.atmosphere/R/metutils.R
-    es = 6.112 * np.exp((17.67 * T) / (T + 243.5))
-    e = qv * 1e-3 * Press / (0.378 * qv * 1e-3 + 0.622)
-
-    rh = e / es
-
-    # assign 0 and 1 to values outside [0, 1]
-    rh = rh.clip(lower=0, upper=1)
-
-    # convert to %
-    rh = 100 * rh
-
-    return rh
+    return thermo.rh_from_qv(T, qv, Press, qv_unit="g/kg")
 
 
 def calculate_qv_from_tdew(Press, Tdew, verbose=False):
@@ -143,12 +118,7 @@ def calculate_qv_from_tdew(Press, Tdew, verbose=False):
     if verbose:
         print("Calculating specific humidity (qv) from press and dewp_temp.")
 
-    # after eq. 4.24 in Practical Meteorology from Stull
-    # P in hPa, Td in °C and qv in kg/kg
-    e = 6.112 * np.exp((17.67 * Tdew) / (Tdew + 243.5))
-    qv = (0.622 * e) / (Press - (0.378 * e))
-
-    return qv
+    return thermo.qv_from_dewpoint(Press, Tdew)
 
 
 def calculate_qv_from_rh(Press, rh, T, verbose=False):
@@ -157,7 +127,7 @@ def calculate_qv_from_rh(Press, rh, T, verbose=False):
     Args:
         Press (pd series):   air pressure series in hPa
         rh    (pd series):   air relative humidity in %
-        T     (pd series):   air temperature in K
+        T     (pd series):   air temperature in °C
 
     Returns:
         pandas series: specific humidity series in kg/kg
@@ -166,11 +136,7 @@ def calculate_qv_from_rh(Press, rh, T, verbose=False):
     if verbose:
         print("Calculating specific humidity (qv) from press and relative humidity.")
 
-    Tdew = calculate_tdew_from_rh(rh, T)
-
-    qv = calculate_qv_from_tdew(Press, Tdew)
-
-    return qv
+    return thermo.qv_from_rh(Press, rh, T)
 
 
 def calculate_wind_vel_from_uv(u, v, verbose=False):
@@ -189,9 +155,7 @@ def calculate_wind_vel_from_uv(u, v, verbose=False):
             "Calculating wind velocity (wind_vel) from meridian and zonal wind velocity."
         )
 
-    wind_vel = np.sqrt(u**2 + v**2)
-
-    return wind_vel
+    return thermo.wind_speed(u, v)
 
 
 def calculate_wind_dir_from_uv(u, v, modulo_180=False, unwrap=False, verbose=False):
@@ -201,6 +165,7 @@ def calculate_wind_dir_from_uv(u, v, modulo_180=False, unwrap=False, verbose=Fal
         u (pd series):     u wind component in m/s
         v (pd series):     v wind component in m/s
         modulo_180 (bool): if True, retruned angle will be between [-180,180]
+        unwrap (bool):     if True, remove jumps of 360° along the (1d) series
 
     Returns:
         pd series: wind direction in °
@@ -211,17 +176,7 @@ def calculate_wind_dir_from_uv(u, v, modulo_180=False, unwrap=False, verbose=Fal
             "Calculating wind direction (wind_dir) from meridian and zonal wind velocity."
         )
 
-    # convert to wind direction coordinate, different from trig unit circle coords
-    # if the wind directin is 360 then returns zero (by %360)
-    # inspired from wind_uv_to_dir function in:
-    # https://github.com/blaylockbk/Ute_WRF/blob/master/functions/wind_calcs.py
-
-    wind_dir = (270 - np.rad2deg(np.arctan2(v, u))) % 360
-
-    # if requested convert from [0,360] to [-180,180]
-    if modulo_180 == True:
-        wind_dir = (wind_dir + 180) % 360 - 180
-        # wind_dir  = np.rad2deg(np.arctan2(v, u))
+    wind_dir = thermo.wind_direction(u, v, modulo_180=modulo_180)
 
     if unwrap == True:
         wind_dir = np.unwrap(p=wind_dir, period=360)
@@ -229,87 +184,99 @@ def calculate_wind_dir_from_uv(u, v, modulo_180=False, unwrap=False, verbose=Fal
     return wind_dir
 
 
-def calc_rho_arome(df, levels, verbose=False):
-    """Calculate air density.
+def calculate_convective_index(index, press, temp, tdew, verbose=False):
+    """Calculate a convective index from a parcel ascent in every column.
 
     Args:
-            p (pd series):   air pressure (Pa)
-            t (pd series):   air temperature (K)
-            qc (pd series):  liquid water content (kg/kg)
-            rh (pd series):  air relative humidity in %
+        index (str):        cape, cin, lcl or li (see utils.convection)
+        press (DataArray):  (time, level) air pressure in hPa
+        temp (DataArray):   (time, level) air temperature in °C
+        tdew (DataArray):   (time, level) dew point temperature in °C
 
     Returns:
-        dict :      air density (kg/m**3)
+        DataArray: index timeseries (time)
 
     """
     if verbose:
-        print("Calculating air density (RHO) from press, temp, qc and qv")
-
-    rho = {}
+        print(f"Calculating {index} from a surface-based parcel ascent.")
 
-    # constants
-    r_d = 287.05  # gas constant for dry air
-    r_v = 461.51  # gas constant for moist air
-    rvd_m_o = r_v / r_d - 1
+    return convection.column_indices(press, temp, tdew, dim="level")[index]
 
-    for level in levels:
-        p = df[f"press~{level}"]  # in Pa
-        t = df[f"temp~{level}"]  # in K
-        qc = df[f"qc~{level}"]  # in kg/kg
-
-        qv = calculate_qv_from_rh(
-            Press=p, rh=df[f"rel_hum~{level}"], T=t, verbose=verbose
-        )
 
-        # density, after calrho in meteo_utilities from COSMO-code
-        # rho = press/(r_d * temp * ( 1 + rvd_m_o * qv - qc))
-        rho[level] = p / (r_d * t * (1 + rvd_m_o * qv - qc))
-
-    return rho
-
-def integrate_over_z(df, param_name, levels, lat, lon, verbose=False):
-    """Integrate variable over vertical coordinates.
+def calc_rho_arome(ds, verbose=False):
+    """Calculate air density.
 
     Args:
-        p (pd series):        air pressure (Pa)
-        t (pd series):        air temperature (K)
-        rh (pd series):       air relative humidity in %
-        df (DataFrame):       contains series and param to integrate
-        param_name (str):     param to integrate name (ex: qc)
-        levels (list of int): vertical levels
+        ds (Dataset):   (time, level) arrays press (hPa), temp (°C),
+                        qc (g/kg) and rel_hum (%) as read from arome
 
     Returns:
-        pd Series: integrated parameter
+        DataArray: air density (kg/m**3) of shape (time, level)
 
     """
     if verbose:
-        print(f"Integrating {param_name} over the vertical dimension.")
+        print("Calculating air density (RHO) from press, temp, qc and qv")
+
+    qv = thermo.qv_from_rh(ds["press"], ds["rel_hum"], ds["temp"])  # in kg/kg
+
+    return thermo.air_density(
+        ds["press"], ds["temp"], qv, ds["qc"] / 1000, press_unit="hPa", temp_unit="degC"
+    )
+
 
-    values = pd.Series()
+@lru_cache(maxsize=None)
+def arome_layer_thickness(lat, lon, levels):
+    """Thickness of the arome layers from the ground up to the requested levels.
 
-    # get air density dataFrame
-    rho = calc_rho_arome(df, levels)
-    rho = pd.DataFrame.from_dict(rho)
+    The arome heights are only read once per point and set of levels.
 
+    Args:
+        lat (float):            latitude
+        lon (float):            longitude
+        levels (tuple of int):  vertical levels
+
+    Returns:
+        1d numpy array (m)
+
+    """
     # get height levels in arome
-    dx, dy = coord_2_arome_pts(lat, lon)
-    heights = calc_arome_height_agl(dx, dy)
+    heights = calc_arome_height_agl(arome_point(lat, lon))
     altitudes = heights[levels[0] - 1 : levels[-1]]
 
     # adding the 0 level (ground)
     altitudes = np.insert(altitudes.to_numpy(), 0, 0)
 
     # level top - level base
-    level_thickness = altitudes[1:] - altitudes[:-1]
+    thickness = altitudes[1:] - altitudes[:-1]
+    thickness.flags.writeable = False
 
-    # select only var to integrate
-    crit = list(map((lambda x: f"{param_name}~" + str(x)), levels))
-    df = df[crit]
+    return thickness
 
-    for i in df.index:
-        values.loc[i] = np.sum(
-            np.array(df.loc[[i]]) * np.array(rho.loc[[i]]) * level_thickness
-        )
+
+def integrate_over_z(ds, param_name, lat, lon, verbose=False):
+    """Integrate variable over vertical coordinates.
+
+    Args:
+        ds (Dataset):         (time, level) arrays of press, temp, qc, rel_hum
+                              and the param to integrate
+        param_name (str):     param to integrate name (ex: qc)
+        lat (float):          latitude
+        lon (float):          longitude
+
+    Returns:
+        DataArray: integrated parameter (time)
+
+    """
+    if verbose:
+        print(f"Integrating {param_name} over the vertical dimension.")
+
+    levels = tuple(int(level) for level in ds["level"].values)
+    level_thickness = xr.DataArray(
+        arome_layer_thickness(lat, lon, levels), dims="level"
+    )
+
+    # all levels at once
+    values = xr.dot(ds[param_name] * calc_rho_arome(ds), level_thickness, dims="level")
 
     if verbose:
         print(f"Succesfully integrated {param_name} over vertical dimension.")
@@ -320,22 +287,8 @@ def integrate_over_z(df, param_name, levels, lat, lon, verbose=False):
 ##########################################################################################
 ##########################################################################################
 def calculate_potT(temp, press, temperature_metric="kelvin", verbose=False):
-    
-    #defining parameters
-    press_r = 1000                  #reference pressure (hPa)
-    Rd = 287                        #specific gas constant for dry air (J/kg*K)
-    cp = 1004                       #speific heat of dry air at constant pressure (J/kg*K)
-
-    #convert from °C to K
-    t_kelvin = np.zeros(len(temp)) ; t_kelvin = temp + 273
-
-    if verbose:
-        print("Calculating potential Temperature.")
-    
-    #compute potential temperature
-    potT = t_kelvin*(press_r/press)**(Rd/cp)
-
-    return potT
+    """Calculate potential temperature (in K), by default from temperature in K."""
+    return calculate_pot_temp(temp, press, temperature_metric, verbose)
 
 def calc_new_var_profiles(df, new_var, device="arome", verbose=False):
     """Calculate vert. profile of requested variable from model output variables.
@@ -348,11 +301,16 @@ def calc_new_var_profiles(df, new_var, device="arome", verbose=False):
 
     Returns:
         DataFrame: same format as the input but with newly calculated variable
+                   instead of its input variables (df itself is not modified)
 
     """
     if verbose:
         print(f"{new_var} needs to be calculated.")
 
+    # remove the input variables from a shallow copy only, s.t. the caller
+    # can derive further variables (i.e. wind_dir after wind_vel) from df
+    df = df.copy(deep=False)
+
     # parameters to calculate (alphabetical order):
 
     ## Relative humidity
@@ -402,10 +360,7 @@ def calc_new_var_profiles(df, new_var, device="arome", verbose=False):
 
     ## potential temperature
     elif new_var == "pot_temp":
-        values = calculate_pot_temp(
-            temp=df["temp"], press=df["press"], altitude=df["altitude"],
-             verbose=verbose
-        )
+        values = calculate_pot_temp(temp=df["temp"], press=df["press"], verbose=verbose)
         # delete remaining columns
         del df["temp"], df["press"]
 
@@ -417,12 +372,10 @@ def calc_new_var_profiles(df, new_var, device="arome", verbose=False):
 
     # do some unity conversions
     if device == "arome" or "pe_arome": 
-        values = (
-            values * vdf.loc["mult_arome"][new_var] + vdf.loc["plus_arome"][new_var]
-        )
+        values = values * vdf[new_var].mult_arome + vdf[new_var].plus_arome
 
     if device == "icon":
-        values = values * vdf.loc["mult"][new_var] + vdf.loc["plus"][new_var]
+        values = values * vdf[new_var].mult + vdf[new_var].plus
 
     # add values column to the dataframe
     df = pd.concat([df, values], axis=1)
@@ -430,61 +383,48 @@ def calc_new_var_profiles(df, new_var, device="arome", verbose=False):
     return df
 
 
-def calc_new_var_timeseries(df, new_var, levels, lat, lon, verbose=False):
+def calc_new_var_timeseries(ds, new_var, levels, lat, lon, verbose=False):
     """Calculate timeseries of requested variable from model output variables.
 
+    The variable is calculated for all levels at once.
+
     Args:
-        df (DataFrame):            model output variables
+        ds (Dataset):              model output variables, one (time, level) array
+                                   per variable (see utils.level_matrix)
         new_var (str):             name of the variable to be calculated
         levels (list of int):      level of the variables output
+        lat, lon (float):          location (for vertical integrals)
         verbose (bool, optional):  defaults to False.
 
     Returns:
-        DataFrame: same format as the input but with newly calculated variable
+        Dataset: same format as the input but with newly calculated variable
+                 instead of its input variables (ds itself is not modified)
 
     """
     if verbose:
         print(f"{new_var} needs to be calculated.")
 
-    # determine variables columns sufix
-    sufix_levels = []
-
     # if level is integer make it a one element list
     if isinstance(levels, int):
         levels = [
             levels,
         ]
 
-    for level in levels:
-        if level == 0:
-            sufix_levels.append("")
-        else:
-            sufix_levels.append(f"~{level}")
-
     ## Gradient vertical de température
     if new_var == "grad_temp":
+        inputs = ["temp"]
         values = calculate_grad(
-            var_bot=df[f"temp{sufix_levels[0]}"],
-            var_top=df[f"temp{sufix_levels[1]}"],
+            var_bot=ds["temp"].sel(level=levels[0], drop=True),
+            var_top=ds["temp"].sel(level=levels[1], drop=True),
             alt_bot=levels[0],
             alt_top=levels[1],
             verbose=verbose,
-        )
-
-        # delete remaining columns
-        del df[f"temp{sufix_levels[0]}"], df[f"temp{sufix_levels[1]}"]
-        sufix_levels = [""]
+        ).expand_dims(level=[0], axis=1)
 
     ## Relative humidity
     elif new_var == "rel_hum":
-        values = calculate_rh_from_qv(
-            T=df[f"temp{sufix_levels[0]}"],
-            qv=df[f"qv{sufix_levels[0]}"],
-            verbose=verbose,
-        )
-
-        # delete remaining columns
-        del df[f"temp{sufix_levels[0]}"], df[f"qv{sufix_levels[0]}"]
+        inputs = ["temp", "qv"]
+        values = calculate_rh_from_qv(T=ds["temp"], qv=ds["qv"], verbose=verbose)
 
     ## Specific humidity
     elif new_var in ["qv", "2m_qv"]:
@@ -493,85 +433,64 @@ def calc_new_var_timeseries(df, new_var, levels, lat, lon, verbose=False):
         else:
             prefix = ""
 
+        inputs = ["press", f"{prefix}dewp_temp"]
         values = calculate_qv_from_tdew(
-            Press=df[f"press{sufix_levels[0]}"],
-            Tdew=df[f"{prefix}dewp_temp{sufix_levels[0]}"],
-            verbose=verbose,
+            Press=ds["press"], Tdew=ds[f"{prefix}dewp_temp"], verbose=verbose
         )
 
-        # delete remaining columns
-        del df[f"press{sufix_levels[0]}"], df[f"{prefix}dewp_temp{sufix_levels[0]}"]
-
     ## Integrated cloud/vapor water
     elif new_var == "tqc":
-        values = integrate_over_z(df, "qc", levels, lat, lon, verbose)
-        for level in levels:
-            del (
-                df[f"press~{level}"],
-                df[f"rel_hum~{level}"],
-                df[f"temp~{level}"],
-                df[f"qc~{level}"],
-            )
+        inputs = ["press", "rel_hum", "temp", "qc"]
+        values = integrate_over_z(ds, "qc", lat, lon, verbose).expand_dims(
+            level=[0], axis=1
+        )
 
     ## Wind velocity
-    elif new_var == "wind_vel":
+    elif new_var in ["wind_vel", "wind_vel_10m"]:
+        suffix = new_var[len("wind_vel") :]
+        inputs = [f"u{suffix}", f"v{suffix}"]
         values = calculate_wind_vel_from_uv(
-            u=df[f"u{sufix_levels[0]}"], v=df[f"v{sufix_levels[0]}"], verbose=verbose
+            u=ds[f"u{suffix}"], v=ds[f"v{suffix}"], verbose=verbose
         )
 
-        # delete remaining columns
-        del df[f"u{sufix_levels[0]}"], df[f"v{sufix_levels[0]}"]
-
     ## Wind direction
-    elif new_var == "wind_dir":
-        values = calculate_wind_dir_from_uv(
-            u=df[f"u{sufix_levels[0]}"], v=df[f"v{sufix_levels[0]}"], verbose=verbose
-        )
-
-        # delete remaining columns
-        del df[f"u{sufix_levels[0]}"], df[f"v{sufix_levels[0]}"]
-
-
-     ## Wind velocity at 10m
-    elif new_var == "wind_vel_10m":
-        values = calculate_wind_vel_from_uv(
-            u=df[f"u_10m{sufix_levels[0]}"], v=df[f"v_10m{sufix_levels[0]}"], verbose=verbose
-        )
-
-        # delete remaining columns
-        del df[f"u_10m{sufix_levels[0]}"], df[f"v_10m{sufix_levels[0]}"]
-
-    ## Wind direction at 10m
-    elif new_var == "wind_dir_10m":
+    elif new_var in ["wind_dir", "wind_dir_10m"]:
+        suffix = new_var[len("wind_dir") :]
+        inputs = [f"u{suffix}", f"v{suffix}"]
         values = calculate_wind_dir_from_uv(
-            u=df[f"u_10m{sufix_levels[0]}"], v=df[f"v_10m{sufix_levels[0]}"], verbose=verbose
+            u=ds[f"u{suffix}"], v=ds[f"v{suffix}"], verbose=verbose
         )
 
-        # delete remaining columns
-        del df[f"u_10m{sufix_levels[0]}"], df[f"v_10m{sufix_levels[0]}"]
-
     ## potential temperature
     elif new_var == "pot_temp":
-        values = calculate_pot_temp(
-            temp=df[f"temp{sufix_levels[0]}"], press=df[f"press{sufix_levels[0]}"], verbose=verbose
-        )
-
-        # delete remaining columns
-        del df[f"temp{sufix_levels[0]}"], df[f"press{sufix_levels[0]}"]
+        inputs = ["temp", "press"]
+        values = calculate_pot_temp(temp=ds["temp"], press=ds["press"], verbose=verbose)
+
+    ## Convective indices (from all levels of the column)
+    elif new_var in convection.INDICES:
+        if "dewp_temp" in ds:
+            inputs = ["press", "temp", "dewp_temp"]
+            tdew = ds["dewp_temp"]
+        else:
+            inputs = ["press", "temp", "qv"]
+            tdew = thermo.dewpoint_from_rh(
+                thermo.rh_from_qv(ds["temp"], ds["qv"], ds["press"], qv_unit="g/kg"),
+                ds["temp"],
+            )
+        values = calculate_convective_index(
+            new_var, ds["press"], ds["temp"], tdew, verbose
+        ).expand_dims(level=[0], axis=1)
 
-    
     else:
         print(f"--- ! Variable {new_var} calculation not available yet.")
         sys.exit(1)
 
-    # convert values to pandas series
-    values = pd.Series(values, name=f"{new_var}{sufix_levels[0]}")
-
     # TODO si jamais icon detecter et appliquer les convertisseurs d'icon
     # do some unity conversions
-    values = values * vdf.loc["mult_arome"][new_var] + vdf.loc["plus_arome"][new_var]
+    values = values * vdf[new_var].mult_arome + vdf[new_var].plus_arome
 
-    # add values column to the dataframe
-    df = pd.concat([df, values], axis=1)
-
-    return df
+    # replace the input variables (in a new dataset)
+    others = ds.drop_vars(inputs)
+    if not others.data_vars:
+        return values.to_dataset(name=new_var)
+    return xr.merge([others, values.to_dataset(name=new_var)])
@@ -0,0 +1,327 @@
+"""Purpose: Convective indices from parcel ascents of many columns at once.
+
+A surface-based parcel is lifted through a whole block of columns (i.e. all
+leadtimes of a model run or all soundings of a station) at once: the loop
+only runs over the vertical levels, the columns are numpy array operations.
+The parcel rises dry adiabatically to its lifting condensation level (LCL,
+Bolton 1980) and pseudo-adiabatically above. From the parcel and the
+environment temperature profiles:
+    cape    convective available potential energy, LFC to EL (J/kg)
+    cin     convective inhibition below the LFC (J/kg, <= 0)
+    lcl     height of the LCL above the parcel origin (m)
+    li      lifted index: T_env - T_parcel at 500 hPa (K)
+The parcel origin is the lowest level of a column with valid press, temp
+and dewp_temp. Virtual temperature effects are neglected.
+
+Date: 19/10/2026.
+"""
+
+# Third-party
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# First-party
+from plot_profile.utils import thermo
+
+INDICES = ["cape", "cin", "lcl", "li"]
+
+L_V = 2.501e6  # latent heat of vaporisation (J/kg)
+GRAVITY = 9.81  # m/s2
+LI_PRESS = 500.0  # pressure level of the lifted index (hPa)
+MAX_STEP = 10.0  # max. pressure step of the moist ascent (hPa)
+
+
+def take_level(values, index):
+    """Values at one level index per column."""
+    return np.take_along_axis(values, index[..., None], axis=-1)[..., 0]
+
+
+def moist_lapse_rate(press, temp):
+    """dT/dp of a saturated parcel along the pseudo-adiabat.
+
+    Args:
+        press   (array):    pressure (hPa)
+        temp    (array):    parcel temperature (K)
+
+    Returns:
+        array: K/hPa
+
+    """
+    es = thermo.saturation_vapour_pressure(temp, temp_unit="K")
+    rs = thermo.EPSILON * es / (press - es)
+    return (thermo.R_D * temp + L_V * rs) / (
+        press
+        * (thermo.CP_D + L_V**2 * rs * thermo.EPSILON / (thermo.R_D * temp**2))
+    )
+
+
+def moist_ascent(press, temp, press_end):
+    """Lift saturated parcels from press to press_end (Runge-Kutta 4).
+
+    All columns take the same number of steps, s.t. no step is larger than
+    MAX_STEP. Columns with press_end == press are not changed.
+
+    Args:
+        press       (array):    start pressure (hPa)
+        temp        (array):    start temperature (K)
+        press_end   (array):    end pressure (hPa)
+
+    Returns:
+        array: parcel temperature at press_end (K)
+
+    """
+    distance = np.abs(press_end - press)
+    distance = distance[np.isfinite(distance)]
+    steps = max(int(np.ceil(distance.max() / MAX_STEP)), 1) if distance.size else 1
+    step = (press_end - press) / steps
+
+    for _ in range(steps):
+        k1 = moist_lapse_rate(press, temp)
+        k2 = moist_lapse_rate(press + step / 2, temp + step / 2 * k1)
+        k3 = moist_lapse_rate(press + step / 2, temp + step / 2 * k2)
+        k4 = moist_lapse_rate(press + step, temp + step * k3)
+        temp = temp + step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        press = press + step
+
+    return temp
+
+
+def parcel_temperature(origin, lcl, press_end, press_start=None, temp_start=None):
+    """Temperature of the parcels at press_end.
+
+    Below the LCL on the dry adiabat of the origin, above from the last known
+    parcel state (press_start, temp_start) or from the LCL if it lies
+    in between.
+
+    Args:
+        origin      (dict):     press and temp of the parcel origin (hPa, K)
+        lcl         (dict):     press and temp of the LCL (hPa, K)
+        press_end   (array):    target pressure (hPa)
+        press_start (array):    last known parcel pressure (Def: origin)
+        temp_start  (array):    last known parcel temperature (Def: origin)
+
+    Returns:
+        array: parcel temperature (K)
+
+    """
+    if press_start is None:
+        press_start, temp_start = origin["press"], origin["temp"]
+
+    dry = press_end >= lcl["press"]
+    from_lcl = press_start > lcl["press"]
+    start = np.where(from_lcl, lcl["press"], press_start)
+    moist = moist_ascent(
+        start,
+        np.where(from_lcl, lcl["temp"], temp_start),
+        # no moist steps for dry or invalid columns
+        np.where(dry | np.isnan(press_end), start, press_end),
+    )
+    with np.errstate(invalid="ignore"):
+        adiabat = origin["temp"] * (press_end / origin["press"]) ** (
+            thermo.R_D / thermo.CP_D
+        )
+    return np.where(dry, adiabat, moist)
+
+
+def parcel_ascent(press, temp, dewp_temp):
+    """Lift surface-based parcels through all columns.
+
+    Args:
+        press       (array):    (..., level) pressure (hPa), highest pressure first
+        temp        (array):    (..., level) temperature (K)
+        dewp_temp   (array):    (..., level) dew point temperature (K)
+
+    Returns:
+        array:  (..., level) parcel temperature (K), NaN below the origin
+        dict:   origin: level, press, temp (per column)
+        dict:   lcl: press, temp (per column)
+
+    """
+    valid = np.isfinite(press) & np.isfinite(temp) & np.isfinite(dewp_temp)
+    level = np.argmax(valid, axis=-1)
+    has_origin = valid.any(axis=-1)
+
+    origin = {
+        "level": level,
+        "press": np.where(has_origin, take_level(press, level), np.nan),
+        "temp": np.where(has_origin, take_level(temp, level), np.nan),
+    }
+    dewp = np.minimum(take_level(dewp_temp, level), origin["temp"])
+
+    # LCL temperature: eq. 15 in Bolton (1980), dry adiabat to its pressure
+    with np.errstate(invalid="ignore", divide="ignore"):
+        lcl_temp = 1 / (1 / (dewp - 56) + np.log(origin["temp"] / dewp) / 800) + 56
+        lcl = {
+            "press": origin["press"]
+            * (lcl_temp / origin["temp"]) ** (thermo.CP_D / thermo.R_D),
+            "temp": lcl_temp,
+        }
+
+    parcel = np.full(press.shape, np.nan)
+    press_prev, temp_prev = origin["press"], origin["temp"]
+    for k in range(press.shape[-1]):
+        active = (k >= origin["level"]) & np.isfinite(press[..., k]) & has_origin
+        press_end = np.where(active, press[..., k], press_prev)
+        temp_k = parcel_temperature(
+            origin, lcl, press_end, press_start=press_prev, temp_start=temp_prev
+        )
+        parcel[..., k] = np.where(active, temp_k, np.nan)
+        press_prev = np.where(active, press_end, press_prev)
+        temp_prev = np.where(active, temp_k, temp_prev)
+
+    return parcel, origin, lcl
+
+
+def positive_area(lower, upper):
+    """Positive part of the mean of a linear function from lower to upper."""
+    # sign change: triangle of the positive end
+    crossing = np.maximum(lower, upper) ** 2 / (2 * (np.abs(lower) + np.abs(upper)))
+    return np.where(
+        (lower >= 0) & (upper >= 0),
+        (lower + upper) / 2,
+        np.where((lower <= 0) & (upper <= 0), 0, crossing),
+    )
+
+
+def convective_indices(
+    press, temp, dewp_temp, axis=-1, press_unit="hPa", temp_unit="degC"
+):
+    """CAPE, CIN, LCL height and lifted index of a block of columns.
+
+    Args:
+        press       (array):    pressure
+        temp        (array):    temperature
+        dewp_temp   (array):    dew point temperature
+        axis        (int):      vertical axis (either direction)
+        press_unit  (str):      unit of press
+        temp_unit   (str):      unit of temp and dewp_temp
+
+    Returns:
+        dict: index (see INDICES) -> array without the vertical axis
+
+    """
+    press = thermo.to_hpa(np.asarray(press, dtype="float64"), press_unit)
+    temp = thermo.to_kelvin(np.asarray(temp, dtype="float64"), temp_unit)
+    dewp_temp = thermo.to_kelvin(np.asarray(dewp_temp, dtype="float64"), temp_unit)
+    press, temp, dewp_temp = (
+        np.moveaxis(values, axis, -1)
+        for values in np.broadcast_arrays(press, temp, dewp_temp)
+    )
+
+    # bottom-up: highest pressure first
+    if np.nansum(np.diff(press, axis=-1)) > 0:
+        press, temp, dewp_temp = press[..., ::-1], temp[..., ::-1], dewp_temp[..., ::-1]
+
+    parcel, origin, lcl = parcel_ascent(press, temp, dewp_temp)
+    buoyancy = parcel - temp
+    n_levels = press.shape[-1]
+
+    # areas of the layers between neighbouring levels, linear in ln(p)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        depth = thermo.R_D * np.log(press[..., :-1] / press[..., 1:])
+        lower, upper = buoyancy[..., :-1], buoyancy[..., 1:]
+        positive = positive_area(lower, upper) * depth
+        total = (lower + upper) / 2 * depth
+        negative = total - positive
+
+        # level of free convection (LFC) and equilibrium level (EL):
+        #  lowest and highest level above the LCL with a warmer parcel
+        warmer = (buoyancy > 0) & (press < lcl["press"][..., None])
+    has_lfc = warmer.any(axis=-1)
+    lfc = np.argmax(warmer, axis=-1)[..., None]
+    el = n_levels - 1 - np.argmax(warmer[..., ::-1], axis=-1)[..., None]
+
+    layer = np.arange(n_levels - 1)
+    cape = np.nansum(
+        np.where((layer >= lfc) & (layer < el), total, 0)
+        + np.where((layer == lfc - 1) | (layer == el), positive, 0),
+        axis=-1,
+    )
+    cin = np.nansum(np.where(layer < lfc, negative, 0), axis=-1)
+
+    valid = np.isfinite(origin["temp"])
+    indices = {
+        "cape": np.where(valid, np.where(has_lfc, np.maximum(cape, 0), 0), np.nan),
+        "cin": np.where(valid, np.where(has_lfc, cin, 0), np.nan),
+        "lcl": thermo.CP_D / GRAVITY * (origin["temp"] - lcl["temp"]),
+    }
+
+    # lifted index: environment interpolated in ln(p) between the
+    #  neighbouring levels of LI_PRESS, parcel lifted from the lower one
+    with np.errstate(invalid="ignore"):
+        above = press < LI_PRESS
+    top = np.argmax(above, axis=-1)
+    bottom = np.maximum(top - 1, 0)
+    inside = above.any(axis=-1) & (bottom >= origin["level"]) & (top > 0)
+    press_bottom = take_level(press, bottom)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.log(LI_PRESS / press_bottom) / np.log(
+            take_level(press, top) / press_bottom
+        )
+    temp_env = take_level(temp, bottom) + weight * (
+        take_level(temp, top) - take_level(temp, bottom)
+    )
+    temp_parcel = parcel_temperature(
+        origin,
+        lcl,
+        np.where(inside, LI_PRESS, np.nan),
+        press_start=np.where(inside, press_bottom, origin["press"]),
+        temp_start=np.where(inside, take_level(parcel, bottom), origin["temp"]),
+    )
+    indices["li"] = np.where(inside, temp_env - temp_parcel, np.nan)
+
+    return indices
+
+
+def column_indices(press, temp, dewp_temp, dim="level", **units):
+    """Convective indices of labelled columns.
+
+    Args:
+        press, temp, dewp_temp  (xarray DataArray): with the vertical dim
+        dim                     (str):              vertical dimension
+        units                   (str):              see convective_indices
+
+    Returns:
+        dict: index -> xarray DataArray without dim
+
+    """
+    dims = [name for name in press.dims if name != dim]
+    indices = convective_indices(
+        *(array.transpose(*dims, dim).values for array in (press, temp, dewp_temp)),
+        **units,
+    )
+    coords = {name: press[name] for name in dims if name in press.coords}
+    return {
+        name: xr.DataArray(values, dims=dims, coords=coords, name=name)
+        for name, values in indices.items()
+    }
+
+
+def sounding_indices(profiles):
+    """Convective indices of radiosoundings.
+
+    Args:
+        profiles    (xarray DataArray): dims (time, altitude, variable) with the
+                                        variables press, temp and dewp_temp
+                                        (see profile_array)
+
+    Returns:
+        pandas dataframe: timestamp and one column per index
+
+    """
+    indices = column_indices(
+        *(profiles.sel(variable=var) for var in ["press", "temp", "dewp_temp"]),
+        dim="altitude",
+    )
+    data = pd.DataFrame({name: array.values for name, array in indices.items()})
+    data.insert(0, "timestamp", profiles["time"].values)
+    return data
+
+
+if __name__ == "__main__":
+    # conditionally unstable column: moist surface layer below a dry adiabat
+    press = np.linspace(1000, 200, 81)
+    temp = 26 - 45 * np.log(1000 / press) / np.log(2)
+    dewp_temp = np.minimum(temp, 20 - 15 * np.log(1000 / press) / np.log(2))
+    print(convective_indices(press, temp, dewp_temp))
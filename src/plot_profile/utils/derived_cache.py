@@ -0,0 +1,77 @@
+"""Purpose: Memoise model fields and derived variables within one run.
+
+Several elements of one plot often need the same model fields, i.e. u and v
+for wind_vel and wind_dir, or temp for temp and pot_temp. Loaded fields and
+derived variables are kept for the rest of the run, keyed by
+(source, location, time range, levels, variable), s.t. every field is read
+and every variable is calculated only once. Callers get their own copy and
+may modify it.
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import copy
+import threading
+
+# Third-party
+import numpy as np
+
+# key -> loaded or derived data
+_cache = {}
+_lock = threading.Lock()
+
+
+def clear_cache():
+    """Forget all memoised data."""
+    with _lock:
+        _cache.clear()
+
+
+def derived_key(source, location, start, end, levels, variable):
+    """Key of a field or derived variable.
+
+    Args:
+        source      (tuple):                    i.e. (model, folder, init)
+        location    (str or tuple):             station or (lat, lon)
+        start, end  (datetime or int):          time range or leadtimes
+        levels      (int, list or None):        model levels or altitude range
+        variable    (str or list of str):       variable(s)
+
+    Returns:
+        tuple (hashable)
+
+    """
+    if levels is not None:
+        levels = tuple(np.atleast_1d(levels).tolist())
+    if not isinstance(variable, str):
+        variable = tuple(variable)
+    return (tuple(source), location, start, end, levels, variable)
+
+
+def memoised(key, compute, verbose=False):
+    """Return a copy of compute() and keep the result for later calls with key.
+
+    Args:
+        key         (tuple):        see derived_key
+        compute     (callable):     compute() -> data (dataframe, dict, ...)
+        verbose     (bool):         print details
+
+    Returns:
+        copy of the data
+
+    """
+    with _lock:
+        hit = key in _cache
+        if hit:
+            data = _cache[key]
+
+    if hit:
+        if verbose:
+            print(f"--- reusing {key[-1]} of {key[0][0]} ({key[1]})")
+    else:
+        data = compute()
+        with _lock:
+            _cache[key] = data
+
+    return copy.deepcopy(data)
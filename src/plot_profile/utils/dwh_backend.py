@@ -0,0 +1,177 @@
+"""Purpose: Record and replay jretrievedwh output.
+
+The backend of dwh2pandas is selected with PLOT_PROFILE_DWH_BACKEND:
+    live:   run jretrievedwh (default)
+    record: run jretrievedwh and store its raw output, keyed by the
+            normalised command
+    replay: run a local stand-in for jretrievedwh instead, which serves
+            the recorded output (python -m plot_profile.utils.dwh_backend)
+
+Replay runs through the same subprocess and streaming parser as a real
+retrieval, s.t. retrieval, parsing and plotting can be tested and
+benchmarked offline. The stand-in waits PLOT_PROFILE_DWH_LATENCY seconds
+before it answers and streams with max. PLOT_PROFILE_DWH_MBPS MB/s.
+
+Other configuration via environment variables:
+    PLOT_PROFILE_DWH_RECORDINGS:    directory of the recordings.
+                                    Def: /scratch/<user>/plot_profile_dwh_recordings
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import getpass
+import hashlib
+import os
+import shlex
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BACKENDS = ["live", "record", "replay"]
+
+
+def backend():
+    """Return the name of the DWH backend selected by PLOT_PROFILE_DWH_BACKEND."""
+    name = os.environ.get("PLOT_PROFILE_DWH_BACKEND", "live").lower()
+    if name not in BACKENDS:
+        print(f"! Unknown DWH backend: {name}. Choose from {BACKENDS}.")
+        sys.exit(1)
+    return name
+
+
+def recordings_dir():
+    """Directory of the recordings."""
+    default = f"/scratch/{getpass.getuser()}/plot_profile_dwh_recordings"
+    return Path(os.environ.get("PLOT_PROFILE_DWH_RECORDINGS", default))
+
+
+def normalise_command(cmd):
+    """Key of a jretrievedwh command, independent of path and option order.
+
+    Args:
+        cmd (str or list):  command line (incl. the executable)
+
+    Returns:
+        str: options and their values, sorted by option
+
+    """
+    tokens = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+
+    # (option, value) pairs; flags like --show_records have no value
+    options = []
+    for token in tokens[1:]:
+        if token.startswith("-") or not options:
+            options.append([token, ""])
+        else:
+            options[-1][1] = f"{options[-1][1]} {token}".strip()
+
+    return " ".join(f"{option} {value}".strip() for option, value in sorted(options))
+
+
+def recording_path(cmd):
+    """Path of the recording of a command."""
+    key = normalise_command(cmd)
+    return recordings_dir() / f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.txt"
+
+
+def command(cmd):
+    """Command to run for cmd with the selected backend."""
+    if backend() != "replay":
+        return cmd
+
+    # replace the jretrievedwh executable by the stand-in
+    options = cmd.split(maxsplit=1)[1] if len(cmd.split()) > 1 else ""
+    return f"{shlex.quote(sys.executable)} -m plot_profile.utils.dwh_backend {options}"
+
+
+class RecordingStream:
+    """File-like wrapper which writes everything read from stream to a recording."""
+
+    def __init__(self, cmd, stream):
+        """Start the recording of the output of cmd.
+
+        Args:
+            cmd     (str):          jretrievedwh command
+            stream  (file-like):    stdout of cmd
+
+        """
+        self.stream = stream
+        self.path = recording_path(cmd)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp = self.path.parent / f".{uuid.uuid4().hex}.tmp"
+        self.file = open(self.tmp, "w")
+
+        # store the normalised command next to the output
+        self.path.with_suffix(".cmd").write_text(normalise_command(cmd) + "\n")
+
+    def read(self, size=-1):
+        data = self.stream.read(size)
+        self.file.write(data)
+        return data
+
+    def readline(self):
+        line = self.stream.readline()
+        self.file.write(line)
+        return line
+
+    def finish(self, success):
+        """Keep the recording of a successful retrieval, discard it otherwise."""
+        self.file.close()
+        if success:
+            os.replace(self.tmp, self.path)
+        else:
+            self.tmp.unlink(missing_ok=True)
+
+
+def open_output(cmd, stream):
+    """Output stream of a retrieval; recorded if the backend is record."""
+    if backend() == "record":
+        return RecordingStream(cmd, stream)
+    return stream
+
+
+def finish_output(stream, success):
+    """Finish the recording (if any) of an output stream."""
+    if isinstance(stream, RecordingStream):
+        stream.finish(success)
+
+
+def replay(argv, out=None):
+    """Stand-in for jretrievedwh: write the recorded output of argv to out.
+
+    Args:
+        argv    (list): command line, argv[0] is the executable
+        out     (file): output (Def: stdout)
+
+    Returns:
+        int: exit code (1 if there is no recording)
+
+    """
+    out = out or sys.stdout
+    path = recording_path(argv)
+    if not path.is_file():
+        print(f"No recording for: {normalise_command(argv)} ({path})", file=sys.stderr)
+        return 1
+
+    time.sleep(float(os.environ.get("PLOT_PROFILE_DWH_LATENCY", 0)))
+
+    # stream in blocks of 64 kB, throttled to PLOT_PROFILE_DWH_MBPS
+    mbps = float(os.environ.get("PLOT_PROFILE_DWH_MBPS", 0))
+    block_size = 2**16
+    with open(path) as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            out.write(block)
+            if mbps:
+                out.flush()
+                time.sleep(len(block) / (mbps * 1024**2))
+    out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(replay(sys.argv))
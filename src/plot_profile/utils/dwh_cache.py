@@ -0,0 +1,437 @@
+"""Purpose: Persistent local cache for jretrievedwh results.
+
+Retrieved dataframes are stored as blocks on disk: one file per retrieved
+time range, grouped by source, station and variable ids (and all other
+jretrievedwh options). A request for a time range reuses every cached block
+which overlaps it and retrieves only the gaps in between.
+
+Long time ranges are split into chunks which are retrieved in parallel and
+cached independently.
+
+Configuration via environment variables:
+    PLOT_PROFILE_CACHE:         set to 0 to disable the cache
+    PLOT_PROFILE_CACHE_DIR:     cache directory. Def: /scratch/<user>/plot_profile_cache
+    PLOT_PROFILE_CACHE_MAX_MB:  max. size of the cache before the least
+                                recently used blocks are evicted. Def: 2048
+    PLOT_PROFILE_DWH_CHUNK_HOURS:   max. length of one retrieval. Def: 24
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import datetime as dt
+import getpass
+import hashlib
+import os
+import re
+import time
+import uuid
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Third-party
+import pandas as pd
+
+# parquet if pyarrow (or fastparquet) is installed, pickle otherwise
+try:
+    # Third-party
+    import pyarrow  # noqa: F401
+
+    BLOCK_SUFFIX = ".parquet"
+except ImportError:
+    BLOCK_SUFFIX = ".pkl"
+
+# blocks which end less than RECENT_PERIOD ago may still be completed in
+# the DWH and are only reused for RECENT_TTL after they have been retrieved
+# (modification time of the block); the access time of a block is its last
+# use for the LRU eviction
+RECENT_PERIOD = dt.timedelta(days=3)
+RECENT_TTL = dt.timedelta(hours=1)
+
+TIME_FORMATS = {10: "%Y%m%d%H", 12: "%Y%m%d%H%M"}
+
+
+def cache_enabled():
+    """Check whether the cache is switched on (PLOT_PROFILE_CACHE)."""
+    return os.environ.get("PLOT_PROFILE_CACHE", "1").lower() not in [
+        "0",
+        "false",
+        "no",
+        "off",
+    ]
+
+
+def cache_dir():
+    """Root directory of the cache."""
+    default = f"/scratch/{getpass.getuser()}/plot_profile_cache"
+    return Path(os.environ.get("PLOT_PROFILE_CACHE_DIR", default))
+
+
+def cache_max_bytes():
+    """Max. size of the cache in bytes."""
+    return int(float(os.environ.get("PLOT_PROFILE_CACHE_MAX_MB", 2048)) * 1024**2)
+
+
+def chunk_length(step=None):
+    """Max. length of the time range of one jretrievedwh call.
+
+    If step is given, the length is a multiple of step (at least one step).
+    """
+    length = dt.timedelta(
+        hours=float(os.environ.get("PLOT_PROFILE_DWH_CHUNK_HOURS", 24))
+    )
+    if step:
+        length = max(length // step, 1) * step
+    return length
+
+
+def str2time(timestamp):
+    """Convert YYYYmmddHH(MM) to datetime object."""
+    return dt.datetime.strptime(timestamp, TIME_FORMATS[len(timestamp)])
+
+
+def time2str(timestamp, length=10):
+    """Convert datetime object to YYYYmmddHH (length 10) or YYYYmmddHHMM (12)."""
+    return timestamp.strftime(TIME_FORMATS[length])
+
+
+def key_dir(source, station, vars_str, options=""):
+    """Directory containing the blocks of one (source, station, variables) key.
+
+    Args:
+        source      (str):  DWH source, i.e. "surface" or "profile_mwr"
+        station     (str):  station name or id
+        vars_str    (str):  DWH IDs of variables, separated by comma
+        options     (str):  all other jretrievedwh options (i.e. the command
+                            without its time range)
+
+    Returns:
+        Path
+
+    """
+    digest = hashlib.sha1(f"{source}|{station}|{vars_str}|{options}".encode())
+    readable = re.sub(r"[^0-9A-Za-z_.-]+", "-", f"{station}_{vars_str}")[:80]
+    return cache_dir() / source / f"{readable}_{digest.hexdigest()[:12]}"
+
+
+def list_blocks(directory):
+    """List the cached blocks of a key.
+
+    Returns:
+        list of tuples: (start, end, path) sorted by start
+
+    """
+    blocks = []
+    if not directory.is_dir():
+        return blocks
+    for path in directory.glob(f"*{BLOCK_SUFFIX}"):
+        try:
+            start, end = path.stem.split("-")
+            blocks.append((str2time(start), str2time(end), path))
+        except (ValueError, KeyError):
+            continue
+    return sorted(blocks, key=lambda block: (block[0], block[1]))
+
+
+def is_recent(end, now=None):
+    """Check whether data up to end may still be completed in the DWH."""
+    now = now or dt.datetime.utcnow()
+    return end >= now - RECENT_PERIOD
+
+
+def is_expired(end, path, now=None):
+    """Recent blocks expire RECENT_TTL after they have been retrieved."""
+    now = now or dt.datetime.utcnow()
+    if not is_recent(end, now):
+        return False
+    retrieved = dt.datetime.utcfromtimestamp(path.stat().st_mtime)
+    return now - retrieved > RECENT_TTL
+
+
+def find_gaps(start, end, blocks):
+    """Determine the parts of [start, end] which are not covered by blocks.
+
+    Boundaries are inclusive: a gap starts at the end of the preceding block
+    (and ends at the start of the following block), s.t. data between two
+    full hours is never lost. Duplicated boundary rows are dropped on merge.
+
+    Args:
+        start, end  (datetime): requested time range
+        blocks      (list):     (start, end, ...) of cached blocks, sorted
+
+    Returns:
+        list of tuples: (start, end) of missing time ranges
+
+    """
+    gaps = []
+    current = start
+    for block_start, block_end, *_ in blocks:
+        if block_end < current:
+            continue
+        if block_start > end:
+            break
+        if block_start > current:
+            gaps.append((current, block_start))
+        current = max(current, block_end)
+        if current >= end:
+            return gaps
+    gaps.append((current, end))
+    return gaps
+
+
+def split_range(start, end, chunk):
+    """Split [start, end] into chunks of max. length chunk.
+
+    Like the gaps, consecutive chunks share their boundary.
+
+    Args:
+        start, end  (datetime):     time range
+        chunk       (timedelta):    max. length of one chunk
+
+    Returns:
+        list of tuples: (start, end) of chunks
+
+    """
+    chunks = []
+    chunk_start = start
+    while end - chunk_start > chunk:
+        chunks.append((chunk_start, chunk_start + chunk))
+        chunk_start += chunk
+    chunks.append((chunk_start, end))
+    return chunks
+
+
+def fetch_chunks(chunks, fetch, length, verbose=False):
+    """Retrieve chunks in parallel.
+
+    The number of jretrievedwh processes is limited in dwh2pandas.
+
+    Args:
+        chunks  (list of tuples):   (start, end) datetime objects
+        fetch   (callable):         fetch(start, end) -> dataframe
+        length  (int):              length of timestamp strings for fetch
+        verbose (bool):             print details
+
+    Yields:
+        (start, end), dataframe (in order of completion)
+
+    """
+    if not chunks:  # everything cached
+        return
+
+    if len(chunks) == 1:
+        chunk_start, chunk_end = chunks[0]
+        yield chunks[0], fetch(
+            time2str(chunk_start, length), time2str(chunk_end, length)
+        )
+        return
+
+    if verbose:
+        print(f"--- retrieving {len(chunks)} chunks from DWH in parallel")
+
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = {
+            pool.submit(
+                fetch, time2str(chunk_start, length), time2str(chunk_end, length)
+            ): (chunk_start, chunk_end)
+            for chunk_start, chunk_end in chunks
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def read_block(path):
+    """Read block and mark it as recently used.
+
+    Only the access time is updated: the modification time remains the time
+    of the retrieval (see is_expired).
+    """
+    if BLOCK_SUFFIX == ".parquet":
+        data = pd.read_parquet(path)
+    else:
+        data = pd.read_pickle(path)
+
+    os.utime(path, (time.time(), path.stat().st_mtime))
+    return data
+
+
+def write_block(data, directory, start, end, length):
+    """Write block atomically (readers never see partially written files)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = (
+        directory / f"{time2str(start, length)}-{time2str(end, length)}{BLOCK_SUFFIX}"
+    )
+    tmp = directory / f".{uuid.uuid4().hex}.tmp"
+    try:
+        if BLOCK_SUFFIX == ".parquet":
+            data.to_parquet(tmp)
+        else:
+            data.to_pickle(tmp)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def evict(max_bytes=None, verbose=False):
+    """Delete least recently used blocks until the cache is below max_bytes."""
+    max_bytes = cache_max_bytes() if max_bytes is None else max_bytes
+    root = cache_dir()
+    if not root.is_dir():
+        return
+
+    files = []
+    for path in root.rglob(f"*{BLOCK_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # evicted by a concurrent process
+            continue
+        files.append((stat.st_atime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        if verbose:
+            print(f"--- evicting cached DWH block {path}")
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def merge_blocks(frames, start, end):
+    """Concatenate blocks, drop duplicated boundary rows and cut to [start, end]."""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    data = pd.concat(frames, ignore_index=True)
+
+    # blocks with different categories are concatenated as object columns
+    for name in frames[0].columns:
+        if isinstance(frames[0][name].dtype, pd.CategoricalDtype):
+            data[name] = data[name].astype("category")
+
+    data = data.drop_duplicates(ignore_index=True)
+    if "termin" in data.columns:
+        data = data[(data["termin"] >= start) & (data["termin"] <= end)]
+        data = data.sort_values("termin", kind="stable").reset_index(drop=True)
+    return data
+
+
+def cached_retrieve(
+    source, station, vars_str, options, start, end, fetch, verbose=False, step=None
+):
+    """Retrieve data for [start, end], reusing cached blocks.
+
+    Missing time ranges longer than chunk_length() are retrieved in chunks
+    in parallel, every chunk is cached as a separate block. Empty chunks of
+    recent periods are not cached (i.e. the latest sounding is not in the DWH
+    yet). If the cache directory is not writable, the data is returned
+    without being cached.
+
+    Args:
+        source      (str):      DWH source, i.e. "surface" or "profile_mwr"
+        station     (str):      station name or id
+        vars_str    (str):      DWH IDs of variables, separated by comma
+        options     (str):      jretrievedwh command without its time range
+        start, end  (str):      YYYYmmddHH(MM)
+        fetch       (callable): fetch(start, end) -> dataframe for a gap
+                                (start, end in the same format as above)
+        verbose     (bool):     print details
+        step        (timedelta):    chunks are multiples of step long, i.e.
+                                    the aggregation frequency of fetch
+
+    Returns:
+        pandas dataframe
+
+    """
+    length = len(start)
+    t1, t2 = str2time(start), str2time(end)
+
+    if not cache_enabled():
+        chunks = split_range(t1, t2, chunk_length(step))
+        if len(chunks) == 1:
+            return fetch(start, end)
+        frames = [data for _, data in fetch_chunks(chunks, fetch, length, verbose)]
+        return merge_blocks(frames, t1, t2)
+
+    directory = key_dir(source, station, vars_str, options)
+
+    # drop expired blocks of recent periods
+    blocks = []
+    for block in list_blocks(directory):
+        if is_expired(block[1], block[2]):
+            if verbose:
+                print(f"--- cached DWH block {block[2].name} expired")
+            block[2].unlink(missing_ok=True)
+        else:
+            blocks.append(block)
+
+    frames = []
+    for block_start, block_end, path in list(blocks):
+        if block_end >= t1 and block_start <= t2:
+            try:
+                frames.append(read_block(path))
+            except (FileNotFoundError, EOFError, OSError):  # evicted meanwhile
+                blocks.remove((block_start, block_end, path))
+
+    gaps = find_gaps(t1, t2, blocks)
+    if verbose:
+        print(
+            f"--- DWH cache: {len(frames)} cached block(s), {len(gaps)} gap(s) to retrieve"
+        )
+
+    chunks = []
+    for gap_start, gap_end in gaps:
+        chunks += split_range(gap_start, gap_end, chunk_length(step))
+
+    # every chunk is cached as soon as it has been retrieved
+    writable = True
+    for (chunk_start, chunk_end), data in fetch_chunks(chunks, fetch, length, verbose):
+        frames.append(data)
+        if not writable:
+            continue
+        if data.empty and is_recent(chunk_end):
+            # retrieved again as soon as it is available
+            if verbose:
+                print(
+                    f"--- no DWH data for {time2str(chunk_start, length)}-"
+                    f"{time2str(chunk_end, length)} yet, not cached"
+                )
+            continue
+        try:
+            write_block(data, directory, chunk_start, chunk_end, length)
+        except OSError as error:
+            # i.e. no /scratch: retrieve without caching
+            print(f"--- ! DWH cache not writable, data is not cached: {error}")
+            writable = False
+
+    if chunks and writable:
+        evict(verbose=verbose)
+
+    return merge_blocks(frames, t1, t2)
+
+
+if __name__ == "__main__":
+
+    # simulate jretrievedwh with hourly data
+    def fake_fetch(start, end):
+        print(f"  retrieving {start}-{end}")
+        times = pd.date_range(str2time(start), str2time(end), freq="10min")
+        return pd.DataFrame({"termin": times, "91": range(len(times))})
+
+    os.environ.setdefault("PLOT_PROFILE_CACHE_DIR", f"/tmp/{getpass.getuser()}_cache")
+    t_start = time.time()
+    print(
+        cached_retrieve(
+            "surface", "PAY", "91", "", "2021111900", "2021111906", fake_fetch
+        )
+    )
+    print(
+        cached_retrieve(
+            "surface", "PAY", "91", "", "2021111900", "2021111912", fake_fetch
+        )
+    )
+    print(f"took {time.time() - t_start:.2f}s")
@@ -0,0 +1,103 @@
+"""Purpose: Coalesce duplicate DWH retrievals within one run.
+
+One run often asks for the same station, device and time more than once
+(i.e. rs temperature for several model elements, or relative humidity for
+clouds). Every retrieval is registered with its raw DWH ids and time range;
+a later (or concurrent) request which is identical or contained in a
+registered one waits for that retrieval instead of starting its own
+jretrievedwh process, and gets its own copy of the requested columns.
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import threading
+from concurrent.futures import Future
+
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils.dwh_cache import str2time
+
+# (device, station) -> list of (raw ids, start, end, future)
+_requests = {}
+_lock = threading.Lock()
+_enabled = True
+
+
+def set_coalescing(enabled):
+    """Switch coalescing on or off (i.e. to fill the cache for every request)."""
+    global _enabled
+    _enabled = enabled
+
+
+def clear_requests():
+    """Forget all registered retrievals."""
+    with _lock:
+        _requests.clear()
+
+
+def find_request(key, raw_ids, start, end):
+    """Find the registered retrieval of key containing raw_ids and [start, end]."""
+    for ids, req_start, req_end, future in _requests.get(key, []):
+        if set(raw_ids) <= ids and req_start <= start and end <= req_end:
+            return ids, future
+    return None, None
+
+
+def subset(data, ids, raw_ids, start, end):
+    """Copy of the requested columns and time range of a shared result."""
+    if data.empty:
+        return pd.DataFrame()
+
+    # keep metadata (termin, level, ...) and the requested ids
+    columns = [name for name in data.columns if name not in ids or name in raw_ids]
+    data = data[columns]
+    if "termin" in data.columns:
+        data = data[(data["termin"] >= start) & (data["termin"] <= end)]
+    return data.reset_index(drop=True).copy()
+
+
+def coalesced_retrieve(key, raw_ids, start, end, fetch, verbose=False):
+    """Retrieve raw_ids for [start, end], sharing identical or contained requests.
+
+    Args:
+        key         (tuple):        identifies the retrieval, i.e. (device, station)
+        raw_ids     (list of str):  raw DWH ids
+        start, end  (str):          YYYYmmddHH(MM)
+        fetch       (callable):     fetch() -> dataframe with all raw_ids
+        verbose     (bool):         print details
+
+    Returns:
+        pandas dataframe (own copy of the requested columns)
+
+    """
+    if not _enabled:
+        return fetch()
+
+    t1, t2 = str2time(start), str2time(end)
+
+    with _lock:
+        ids, future = find_request(key, raw_ids, t1, t2)
+        owner = future is None
+        if owner:
+            ids, future = set(raw_ids), Future()
+            _requests.setdefault(key, []).append((ids, t1, t2, future))
+
+    if not owner:
+        if verbose:
+            print(f"--- sharing DWH retrieval of {key}: {','.join(raw_ids)}")
+        return subset(future.result(), ids, raw_ids, t1, t2)
+
+    try:
+        data = fetch()
+    except BaseException as e:
+        # later requests try again
+        with _lock:
+            _requests[key].remove((ids, t1, t2, future))
+        future.set_exception(e)
+        raise
+
+    future.set_result(data)
+    return subset(data, ids, raw_ids, t1, t2)
@@ -0,0 +1,77 @@
+"""Purpose: Run several DWH retrievals concurrently.
+
+Every retrieval runs in its own thread, while the number of jretrievedwh
+processes running at the same time is limited by a global semaphore
+(PLOT_PROFILE_DWH_PROCESSES, Def: 4). Results are returned as they complete.
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import threading
+from collections import namedtuple
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+# First-party
+from plot_profile.utils import dwh_retrieve as dwh
+
+# one retrieval: key (any hashable to identify the result) and the
+# arguments of dwh_retrieve
+DWHRequest = namedtuple(
+    "DWHRequest", ["key", "device", "station", "vars", "timestamps"]
+)
+
+
+def set_max_processes(max_processes):
+    """Change the limit on simultaneous jretrievedwh processes."""
+    dwh.dwh_slots = threading.BoundedSemaphore(max_processes)
+
+
+def retrieve_concurrently(requests, max_processes=None, verbose=False):
+    """Run a batch of DWH retrievals concurrently.
+
+    Args:
+        requests        (list of DWHRequest):   retrievals to run
+        max_processes   (int):                  max. number of simultaneous
+                                                jretrievedwh processes
+                                                (Def: PLOT_PROFILE_DWH_PROCESSES)
+        verbose         (bool):                 print details
+
+    Yields:
+        key, pandas dataframe (in order of completion)
+
+    """
+    if max_processes:
+        set_max_processes(max_processes)
+
+    if not requests:
+        return
+
+    if verbose:
+        print(f"Running {len(requests)} DWH retrievals concurrently.")
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        futures = {
+            pool.submit(
+                dwh.dwh_retrieve,
+                device=request.device,
+                station=request.station,
+                vars=request.vars,
+                timestamps=request.timestamps,
+                verbose=verbose,
+            ): request.key
+            for request in requests
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def retrieve_all(requests, max_processes=None, verbose=False):
+    """Run a batch of DWH retrievals concurrently and collect the results.
+
+    Returns:
+        dict: key -> pandas dataframe
+
+    """
+    return dict(retrieve_concurrently(requests, max_processes, verbose))
@@ -0,0 +1,171 @@
+"""Purpose: Plan DWH retrievals of raw and derived variables.
+
+Derived variables are marked in vdf by their dwh_id:
+    net_calc:<down>:<up>:   net radiation (down - up)
+    grad_temp:<top>:<bot>   temperature gradient between tower levels
+    pot_temp                potential temperature from press, temp
+    qv                      specific humidity from press and dewp_temp or rel_hum
+
+For any combination of requested variables, the planner resolves these
+dependencies to the minimal set of raw DWH ids, which are then retrieved in
+one jretrievedwh call per device. All derived variables are computed from
+this shared result, in dependency order.
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import sys
+from collections import namedtuple
+
+# First-party
+from plot_profile.utils import thermo
+from plot_profile.utils.variables import vdf
+
+# column:   name of the derived column (its dwh_id in vdf)
+# inputs:   DWH ids (raw or derived) of the inputs
+# compute:  compute(data, verbose) -> pandas series
+DerivedVar = namedtuple("DerivedVar", ["column", "inputs", "compute"])
+
+TOWERS = ["2m_tower", "10m_tower", "30m_tower"]
+
+
+def raw_id(var, device):
+    """DWH id of variable var measured by device."""
+    try:
+        return vdf[var].dwh_id[device]
+    except (KeyError, TypeError):
+        print(f"! Device {device} not available for {var}!")
+        sys.exit(1)
+
+
+def derivation(dwh_id, device):
+    """Determine inputs and computation of a derived DWH id.
+
+    Args:
+        dwh_id  (str):  DWH id as listed in vdf
+        device  (str):  measurement device
+
+    Returns:
+        DerivedVar, or None if dwh_id is a raw DWH id
+
+    """
+    kind, *ids = dwh_id.split(":")
+
+    if kind == "net_calc":
+        down, up = ids[:2]
+        return DerivedVar(
+            dwh_id, [down, up], lambda data, verbose: data[down] - data[up]
+        )
+
+    if kind == "grad_temp":
+        # gradT = (Ttop - Tbot)/(alt_top - alt_bot), tower levels 30m and 10m
+        top, bot = ids[:2]
+        return DerivedVar(
+            dwh_id, [top, bot], lambda data, verbose: (data[top] - data[bot]) / 20
+        )
+
+    if kind == "pot_temp":
+        press, temp = raw_id("press", device), raw_id("temp", device)
+        return DerivedVar(
+            dwh_id,
+            [press, temp],
+            lambda data, verbose: thermo.potential_temperature(data[temp], data[press]),
+        )
+
+    if kind == "qv":
+        # 2m, rs: calculate qv from tdew
+        if device in ["2m", "rs"]:
+            press, dewp_temp = raw_id("press", device), raw_id("dewp_temp", device)
+            return DerivedVar(
+                dwh_id,
+                [press, dewp_temp],
+                lambda data, verbose: thermo.qv_from_dewpoint(
+                    data[press], data[dewp_temp], qv_unit="g/kg"
+                ),
+            )
+
+        # tower: calculate from rh (tdew not available)
+        if device in TOWERS:
+            # pressure only available at 2 meter: propagate last valid
+            # observation forward to the timestamps of the tower
+            press = raw_id("press", "2m")
+            rel_hum, temp = raw_id("rel_hum", device), raw_id("temp", device)
+            return DerivedVar(
+                dwh_id,
+                [press, rel_hum, temp],
+                lambda data, verbose: thermo.qv_from_rh(
+                    data[press].fillna(method="ffill"),
+                    data[rel_hum],
+                    data[temp],
+                    qv_unit="g/kg",
+                ),
+            )
+
+        print(f"! Device: {device} not available for qv.")
+        sys.exit(1)
+
+    return None
+
+
+def plan_retrieval(vars, device, verbose=False):
+    """Resolve variables to raw DWH ids and derivation steps.
+
+    Args:
+        vars    (tuple):    variables (short names)
+        device  (str):      measurement device
+        verbose (bool):     print details
+
+    Returns:
+        list of str:        raw DWH ids (each only once)
+        list of DerivedVar: derivation steps in dependency order
+
+    """
+    raw_ids, steps = [], []
+
+    def resolve(dwh_id):
+        step = derivation(dwh_id, device)
+        if step is None:
+            if dwh_id not in raw_ids:
+                raw_ids.append(dwh_id)
+            return
+        # inputs first s.t. the steps are in dependency order
+        for input_id in step.inputs:
+            resolve(input_id)
+        if step.column not in [planned.column for planned in steps]:
+            steps.append(step)
+
+    for var in vars:
+        resolve(raw_id(var, device))
+
+    # add altitude for radiosounding retrieves
+    if device == "rs":
+        resolve(raw_id("altitude", device))
+
+    if verbose:
+        print(f"Planned DWH retrieval for {vars} ({device}):")
+        print(f"  raw DWH ids: {','.join(raw_ids)}")
+        print(f"  derived:     {[step.column for step in steps]}")
+
+    return raw_ids, steps
+
+
+def compute_derived(data, steps, verbose=False):
+    """Add derived columns to the retrieved data (in place).
+
+    Columns which are already present (i.e. computed before an aggregation)
+    are kept.
+    """
+    for step in steps:
+        if step.column in data.columns:
+            continue
+        if verbose:
+            print(f"Calculating {step.column} from {step.inputs}.")
+        data[step.column] = step.compute(data, verbose)
+    return data
+
+
+if __name__ == "__main__":
+    print(plan_retrieval(("temp", "pot_temp", "qv"), "2m", verbose=True))
+    print(plan_retrieval(("lw_net", "lw_down"), "2m", verbose=True))
+    print(plan_retrieval(("qv", "temp"), "30m_tower", verbose=True))
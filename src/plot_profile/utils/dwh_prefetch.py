@@ -0,0 +1,121 @@
+"""Purpose: Prefetch observations into the DWH cache (i.e. from cron).
+
+Every request is retrieved with dwh_retrieve exactly as the plotting
+commands request it, s.t. the cached blocks have the same keys and the
+interactive calls afterwards are cache hits:
+    rs:     the latest 00/12 UTC sounding
+    others: the last <hours> hours
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import datetime as dt
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# First-party
+from plot_profile.utils import dwh_coalesce
+from plot_profile.utils.dwh_cache import cache_enabled
+from plot_profile.utils.dwh_cache import time2str
+from plot_profile.utils.dwh_retrieve import dwh_retrieve
+
+# (device, variables) as requested by the plotting commands
+DEFAULT_REQUESTS = [
+    # plot_rs (default params)
+    ("rs", ("temp", "dewp_temp", "wind_vel", "wind_dir")),
+    # plot_profiles, plot_mult_profiles (one variable per call; qv from dewp_temp, press)
+    ("rs", ("temp",)),
+    ("rs", ("dewp_temp",)),
+    ("rs", ("rel_hum",)),
+    ("rs", ("wind_vel",)),
+    ("rs", ("wind_dir",)),
+    ("rs", ("dewp_temp", "press")),
+    # plot_mwr_heatmap, plot_profiles
+    ("mwr", ("temp",)),
+    # plot_timeseries
+    ("2m", ("temp",)),
+    ("2m_tower", ("temp",)),
+    ("10m_tower", ("temp",)),
+    ("30m_tower", ("temp",)),
+]
+
+SOUNDING_HOURS = [0, 12]
+
+
+def latest_sounding(now):
+    """Latest regular sounding time (00 or 12 UTC) at or before now."""
+    hour = max(h for h in SOUNDING_HOURS if h <= now.hour)
+    return now.replace(hour=hour, minute=0, second=0, microsecond=0)
+
+
+def prefetch_timestamps(device, now, hours):
+    """Timestamps of the data to prefetch for a device.
+
+    Args:
+        device  (str):      measurement device
+        now     (datetime): reference time
+        hours   (int):      length of the period of non-sounding devices
+
+    Returns:
+        list of str: 1 or 2 timestamps YYYYmmddHH
+
+    """
+    if device == "rs":
+        return [time2str(latest_sounding(now))]
+    end = now.replace(minute=0, second=0, microsecond=0)
+    return [time2str(end - dt.timedelta(hours=hours)), time2str(end)]
+
+
+def prefetch(station, requests=None, now=None, hours=24, verbose=False):
+    """Retrieve requests concurrently into the cache.
+
+    Args:
+        station     (str):              station short name
+        requests    (list of tuples):   (device, variables), Def: DEFAULT_REQUESTS
+        now         (datetime):         reference time, Def: now (UTC)
+        hours       (int):              period of non-sounding devices
+        verbose     (bool):             print details
+
+    Returns:
+        list of tuples: failed requests; requests without data (i.e. the
+        sounding is not in the DWH yet) are skipped and retried by the next
+        call since empty recent data is not cached
+
+    """
+    if not cache_enabled():
+        print("! The DWH cache is switched off (PLOT_PROFILE_CACHE).")
+        sys.exit(1)
+
+    requests = requests or DEFAULT_REQUESTS
+    now = now or dt.datetime.utcnow()
+
+    # every request has to reach the cache with its own key
+    dwh_coalesce.set_coalescing(False)
+
+    def retrieve(request):
+        device, variables = request
+        timestamps = prefetch_timestamps(device, now, hours)
+        if verbose:
+            print(f"Prefetching {device} {variables} at {station}: {timestamps}")
+        try:
+            data = dwh_retrieve(device, station, variables, timestamps, verbose=verbose)
+        except SystemExit as e:
+            print(f"! Prefetch failed for {device} {variables}: {e}")
+            return request
+        if data.empty:
+            print(f"--- No data for {device} {variables} at {timestamps} yet, skipped")
+        return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+            failed = [request for request in pool.map(retrieve, requests) if request]
+    finally:
+        dwh_coalesce.set_coalescing(True)
+
+    return failed
+
+
+if __name__ == "__main__":
+    print(prefetch_timestamps("rs", dt.datetime(2021, 11, 19, 13, 5), 24))
+    print(prefetch_timestamps("mwr", dt.datetime(2021, 11, 19, 13, 5), 24))
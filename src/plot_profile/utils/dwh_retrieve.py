@@ -7,23 +7,39 @@ Date: 27/12/2022.
 
 # Standard library
 import datetime as dt
+import os
 import pprint
+import signal
 import subprocess  # use: run command line commands from python
 import sys
+import threading
+from functools import lru_cache
 from io import StringIO
 
 # Third-party
 import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
 
 # First-party
-from plot_profile.utils.calc_new_vars import calculate_pot_temp, calculate_qv_from_rh
-from plot_profile.utils.calc_new_vars import calculate_qv_from_tdew
+from plot_profile.utils import dwh_backend
+from plot_profile.utils.dwh_cache import cached_retrieve
+from plot_profile.utils.dwh_cache import str2time
+from plot_profile.utils.dwh_cache import time2str
+from plot_profile.utils.dwh_coalesce import coalesced_retrieve
+from plot_profile.utils.dwh_plan import compute_derived
+from plot_profile.utils.dwh_plan import plan_retrieval
+from plot_profile.utils.profile_array import profiles_to_array
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.variables import vdf
 
 #from ipdb import set_trace
 
+# limit on simultaneous jretrievedwh processes (see dwh_executor.py)
+DWH_MAX_PROCESSES = int(os.environ.get("PLOT_PROFILE_DWH_PROCESSES", 4))
+dwh_slots = threading.BoundedSemaphore(DWH_MAX_PROCESSES)
+
 
 def yy2yyyy(yy):
     """Add '20' to timestamp.
@@ -148,55 +164,222 @@ def parse_vars(vars, device):
     return vars_str
 
 
-def dwh2pandas(cmd, verbose):
-    """Run jretrievedwh command in terminal, create pandas dataframe."""
-    if verbose:
-        print("Calling: " + cmd)
+# columns of the jretrievedwh output which are not measurements
+DWH_STR_COLUMNS = ["name", "wmo_ind", "nat_abr"]
+DWH_STATION_COLUMNS = ["lat", "lon", "elev"]
+DWH_LEVEL_COLUMNS = ["level"]
+DWH_NA_VALUE = 1e7  # "10000000" marks missing values in the DWH
 
-    # run command in terminal
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-        shell=True,
-    )
-    try:
-        out, err = proc.communicate(timeout=120)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        out, err = proc.communicate()
-        raise SystemExit("--- ERROR: timeout expired for process " + cmd)
-    if proc.returncode != 0:
-        raise SystemExit(err)
 
-    # load DWH retrieve output
-    header_line = pd.read_csv(
-        StringIO(out), skiprows=0, nrows=1, sep="\s+", header=None, engine="c"
-    )
+def float32_enabled():
+    """Check whether measurements are kept as float32 (PLOT_PROFILE_FLOAT32)."""
+    return os.environ.get("PLOT_PROFILE_FLOAT32", "0").lower() in [
+        "1",
+        "true",
+        "yes",
+        "on",
+    ]
 
-    check = (
-        f"{header_line[0].iloc[0]} {header_line[1].iloc[0]} {header_line[2].iloc[0]}"
-    )
-    if check == "records read: 0":
+
+@lru_cache(maxsize=1)
+def measurement_ids():
+    """Raw DWH ids of all measurements listed in vdf."""
+    ids = set()
+    for var in vdf.columns:
+        dwh_id = getattr(vdf[var], "dwh_id", None)
+        if not isinstance(dwh_id, dict):
+            continue
+        for device_id in dwh_id.values():
+            # derived ids contain their raw ids, i.e. net_calc:175:1531:
+            ids.update(part for part in str(device_id).split(":") if part.isdigit())
+    return ids
+
+
+def dwh_schema(header):
+    """Column dtypes for parsing jretrievedwh output.
+
+    Station names are parsed as categoricals, measurements listed in vdf
+    as float32 if PLOT_PROFILE_FLOAT32 is set (float64 otherwise). Station
+    coordinates and levels are converted after parsing (see compact_columns).
+
+    Args:
+        header (list of str):   column names
+
+    Returns:
+        dict: column name -> dtype
+
+    """
+    measurement = "float32" if float32_enabled() else "float64"
+    schema = {}
+    for name in header:
+        if name == "termin":
+            continue
+        if name in DWH_STR_COLUMNS:
+            schema[name] = "category"
+        elif name in measurement_ids():
+            schema[name] = measurement
+        else:
+            schema[name] = "float64"
+    return schema
+
+
+def compact_columns(data):
+    """Store station coordinates as categoricals and levels as int32.
+
+    Levels are only converted if they are all integers.
+    """
+    for name in DWH_STATION_COLUMNS:
+        if name in data.columns:
+            data[name] = data[name].astype("category")
+
+    for name in DWH_LEVEL_COLUMNS:
+        if name not in data.columns:
+            continue
+        levels = data[name].to_numpy()
+        if levels.size and np.isfinite(levels).all() and (levels % 1 == 0).all():
+            data[name] = levels.astype("int32")
+    return data
+
+
+class DWHRecords:
+    """File-like view on the data lines of jretrievedwh output.
+
+    Blocks are pulled from a stream (i.e. the stdout pipe of jretrievedwh)
+    while pandas reads; the last <footer> lines are held back and dropped.
+    """
+
+    block_size = 2**16
+
+    def __init__(self, stream, footer=2):
+        """Read the data lines of stream.
+
+        Args:
+            stream  (file-like):    jretrievedwh output (after the header)
+            footer  (int):          number of trailing lines to drop
+
+        """
+        self.stream = stream
+        self.footer = footer
+        self.buffer = ""
+        self.eof = False
+
+    def _releasable(self):
+        """Length of the buffer which certainly does not belong to the footer."""
+        end = len(self.buffer)
+        if self.eof and self.buffer.endswith("\n"):
+            end -= 1
+        # hold back the last <footer> lines (+ the incomplete line if not eof)
+        for _ in range(self.footer if self.eof else self.footer + 1):
+            end = self.buffer.rfind("\n", 0, end)
+            if end < 0:
+                return 0
+        return end + 1
+
+    def read(self, size=-1):
+        while not self.eof and (size < 0 or self._releasable() < size):
+            block = self.stream.read(self.block_size)
+            if block:
+                self.buffer += block
+            else:
+                self.eof = True
+
+        end = self._releasable()
+        if 0 <= size < end:
+            end = size
+        data, self.buffer = self.buffer[:end], self.buffer[end:]
+        if self.eof and not self._releasable():
+            self.buffer = ""  # footer
+        return data
+
+
+def parse_dwh_output(stream, verbose=False):
+    """Parse jretrievedwh output into a dataframe while it is streamed.
+
+    The first line contains the column names, the second line and the
+    last two lines are skipped. The columns are parsed with the dtypes of
+    dwh_schema and the DWH sentinel 1e7 is replaced by NaN while parsing.
+
+    Args:
+        stream  (file-like or str): output of jretrievedwh
+        verbose (bool):             verbose statements
+
+    Returns:
+        pandas dataframe
+
+    """
+    if isinstance(stream, str):
+        stream = StringIO(stream)
+
+    header = stream.readline().split()
+
+    if header[:3] == ["records", "read:", "0"] or not header:
         if verbose:
             print(
                 f"--- WARNING: For the given time period, location and/or device, no data could be retrieved. Returning empty dataframe."
             )
         return pd.DataFrame()
 
-    # parse the command line output into pandas dataframe
+    # skip second line
+    stream.readline()
+
     data = pd.read_csv(
-        StringIO(out),
-        skiprows=2,
-        skipfooter=2,
+        DWHRecords(stream, footer=2),
         sep="|",
         header=None,
-        names=header_line.values.astype(str)[0, :],
-        engine="python",
+        names=header,
+        dtype=dwh_schema(header),
+        na_values=[DWH_NA_VALUE],
+        engine="c",
         parse_dates=["termin"],
     )
 
+    return compact_columns(data)
+
+
+def dwh2pandas(cmd, verbose):
+    """Run jretrievedwh command in terminal, create pandas dataframe.
+
+    The output is parsed while it is streamed from the process.
+    """
+    if verbose:
+        print("Calling: " + cmd)
+
+    # run command in terminal (or its stand-in, see dwh_backend.py)
+    with dwh_slots:
+        proc = subprocess.Popen(
+            dwh_backend.command(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            shell=True,
+        )
+
+        # kill process after timeout; read stderr in parallel s.t. the pipe never blocks
+        timer = threading.Timer(120, proc.kill)
+        err = []
+        err_reader = threading.Thread(target=lambda: err.append(proc.stderr.read()))
+        timer.start()
+        err_reader.start()
+        stdout = dwh_backend.open_output(cmd, proc.stdout)
+        data, parse_error = None, None
+        try:
+            data = parse_dwh_output(stdout, verbose)
+            stdout.read()  # drain remaining output
+        except (ValueError, pd.errors.ParserError) as e:
+            data, parse_error = None, e
+        finally:
+            proc.wait()
+            timer.cancel()
+            err_reader.join()
+            dwh_backend.finish_output(stdout, proc.returncode == 0 and data is not None)
+
+    if proc.returncode == -signal.SIGKILL:
+        raise SystemExit("--- ERROR: timeout expired for process " + cmd)
+    if proc.returncode != 0:
+        raise SystemExit("".join(err))
+    if parse_error is not None:
+        raise parse_error
+
     # check if no data is available for the time period
     if data.empty:
         # TODO: Code should not break but return empty dataframe
@@ -217,13 +400,125 @@ def dwh2pandas(cmd, verbose):
                 print(data.head())
             print("Finished data retrieve from DWH into dataframe.")
 
-    # clean up the dataframe: replae "10000000" with NaN
-    data.replace(1e7, np.nan, inplace=True)
-
     return data
 
 
-def dwh_surface(station_name, vars_str, start, end, verbose=False):
+def aggregate_dwh(data, aggregation, start, end):
+    """Aggregate surface data to a coarser time resolution.
+
+    Bins are closed on the right, labelled with their end (i.e. the hourly
+    mean at 12:00 covers 11:00 < t <= 12:00) and aligned to multiples of the
+    frequency since 1970 (see aggregation_range). For start < end, rows at
+    start are dropped: their bin belongs to the preceding time range, s.t.
+    adjacent ranges (sharing their boundary) yield disjoint bins.
+
+    Args:
+        data        (pandas dataframe): parsed jretrievedwh output
+        aggregation (tuple):            frequency (i.e. "1H") and statistic
+                                        (one of AGGREGATION_STATS)
+        start, end  (datetime):         retrieved time range
+
+    Returns:
+        pandas dataframe
+
+    """
+    freq, stat = aggregation
+    if data.empty:
+        return data
+    if start < end:
+        data = data[data["termin"] > start]
+
+    # stations are aggregated separately, metadata is kept
+    keys = [
+        pd.Grouper(
+            key="termin", freq=freq, closed="right", label="right", origin="epoch"
+        )
+    ]
+    if "nat_abr" in data.columns:
+        keys.insert(0, "nat_abr")
+    meta = [
+        name
+        for name in DWH_STR_COLUMNS + DWH_STATION_COLUMNS
+        if name in data.columns and name != "nat_abr"
+    ]
+    values = [
+        name
+        for name in data.columns
+        if name not in meta and name not in ["termin", "nat_abr"]
+    ]
+
+    grouped = data.groupby(keys, observed=True, sort=True)
+    aggregated = grouped[values].agg(stat)
+    if meta:
+        aggregated = aggregated.join(grouped[meta].first())
+    return aggregated.reset_index()
+
+
+def compute_derived_by_station(data, derived, verbose=False):
+    """Compute derived variables separately for every station (column nat_abr)."""
+    if not derived or data.empty:
+        return data
+    if "nat_abr" not in data.columns:
+        return compute_derived(data, derived, verbose)
+    return data.groupby("nat_abr", group_keys=False, observed=True).apply(
+        compute_derived, derived, verbose
+    )
+
+
+def cached_dwh2pandas(
+    source, station, vars_str, cmd, start, end, verbose, aggregation=None, derived=None
+):
+    """Run jretrievedwh command for [start, end], reusing cached time ranges.
+
+    Args:
+        source      (str):  DWH source, i.e. "surface" or "profile_mwr"
+        station     (str):  DWH station name or id
+        vars_str    (str):  DWH IDs of variables, separated by comma
+        cmd         (str):  jretrievedwh command with placeholders {start}, {end}
+        start       (str):  YYYYmmddHH
+        end         (str):  YYYYmmddHH (same or later as <start>)
+        verbose     (bool): verbose statements
+        aggregation (tuple):        aggregate every retrieved chunk (see
+                                    aggregate_dwh) before it is cached;
+                                    [start, end] must be aligned to the
+                                    bins (see aggregation_range)
+        derived     (list):         derived variables (DerivedVar) to compute
+                                    before the aggregation
+
+    Returns:
+        pandas dataframe
+
+    """
+    derived = derived or []
+
+    def fetch(fetch_start, fetch_end):
+        data = dwh2pandas(cmd.format(start=fetch_start, end=fetch_end), verbose)
+        if aggregation:
+            data = aggregate_dwh(
+                compute_derived_by_station(data, derived, verbose),
+                aggregation,
+                str2time(fetch_start),
+                str2time(fetch_end),
+            )
+        return data
+
+    # aggregated data is cached separately
+    options = cmd
+    if aggregation:
+        options += f" --aggregate {aggregation[0]}:{aggregation[1]}"
+        options += f" --derived {','.join(step.column for step in derived)}"
+
+    # chunks of whole bins (the range is aligned, see aggregation_range)
+    step = pd.Timedelta(to_offset(aggregation[0])) if aggregation else None
+
+    return cached_retrieve(
+        source, station, vars_str, options, start, end, fetch, verbose, step
+    )
+
+
+def dwh_surface(
+    station_name, vars_str, start, end, verbose=False, aggregation=None, derived=None
+):
     """Retrieve surface-based data from DWH.
 
     Args:
@@ -232,6 +527,9 @@ def dwh_surface(station_name, vars_str, start, end, verbose=False):
         start           (str):  YYYYmmddHH
         end             (str):  YYYYmmddHH (same or later as <start>)
         verbose         (bool): verbose statements
+        aggregation     (tuple):    frequency and statistic (see aggregate_dwh)
+        derived         (list):     derived variables to compute before
+                                    the aggregation
 
     Returns:
         pandas dataframe:   DWH surface data
@@ -251,13 +549,11 @@ def dwh_surface(station_name, vars_str, start, end, verbose=False):
             + " -i int_ind,06610"
             + " -p "
             + vars_str
-            + " -t "
-            + start
-            + "-"
-            + end
+            + " -t {start}-{end}"
             + " --use-limitation 50"
             + " -C 38 -w 31"
         )
+        source = "profile_integral"
     else:
         # jretrievedwh command:
         cmd = (
@@ -267,15 +563,77 @@ def dwh_surface(station_name, vars_str, start, end, verbose=False):
             + station_name
             + " -p "
             + vars_str
-            + " -t "
-            + start
-            + "-"
-            + end
+            + " -t {start}-{end}"
             + " --use-limitation 50"
         )
+        source = "surface"
+
+    # run command
+    data = cached_dwh2pandas(
+        source,
+        station_name,
+        vars_str,
+        cmd,
+        start,
+        end,
+        verbose,
+        aggregation=aggregation,
+        derived=derived,
+    )
+
+    return data
+
+
+def dwh_surface_stations(
+    station_names, vars_str, start, end, verbose=False, aggregation=None, derived=None
+):
+    """Retrieve surface-based data of several stations in one call.
+
+    Args:
+        station_names   (list of str):  DWH station names
+        vars_str        (str):          DWH IDs of variables, separated by comma
+        start           (str):          YYYYmmddHH
+        end             (str):          YYYYmmddHH (same or later as <start>)
+        verbose         (bool):         verbose statements
+        aggregation     (tuple):        frequency and statistic (see aggregate_dwh)
+        derived         (list):         derived variables to compute before
+                                        the aggregation
+
+    Returns:
+        pandas dataframe:   DWH surface data of all stations, incl. column nat_abr
+
+    """
+    stations_str = ",".join(station_names)
+    if verbose:
+        print(f"Retrieving surface-based data for:")
+        print(f"  {vars_str}")
+        print(f"  from {start} to {end}")
+        print(f"  at {len(station_names)} stations.")
+
+    # jretrievedwh command:
+    cmd = (
+        "/oprusers/osm/bin/jretrievedwh --show_records -j lat,lon,name,wmo_ind,nat_abr"
+        + f" -s surface"
+        + " -i nat_abr,"
+        + stations_str
+        + " -p "
+        + vars_str
+        + " -t {start}-{end}"
+        + " --use-limitation 50"
+    )
 
     # run command
-    data = dwh2pandas(cmd, verbose)
+    data = cached_dwh2pandas(
+        "surface_stations",
+        stations_str,
+        vars_str,
+        cmd,
+        start,
+        end,
+        verbose,
+        aggregation=aggregation,
+        derived=derived,
+    )
 
     return data
 
@@ -308,10 +666,7 @@ def dwh_profile(device, station_id, vars_str, start, end, verbose=False):
         + vars_str
         + " -i int_ind,"
         + station_id
-        + " -t "
-        + start
-        + "-"
-        + end
+        + " -t {start}-{end}"
     )
 
     if device == "rs":
@@ -327,12 +682,78 @@ def dwh_profile(device, station_id, vars_str, start, end, verbose=False):
         sys.exit(1)
 
     # run command
-    data = dwh2pandas(cmd, verbose)
+    data = cached_dwh2pandas(
+        f"profile_{device}", station_id, vars_str, cmd, start, end, verbose
+    )
 
     return data
 
 
-def dwh_retrieve(device, station, vars, timestamps, verbose=False):
+AGGREGATION_STATS = ["mean", "min", "max"]
+
+
+def check_aggregation(aggregation):
+    """Exit if aggregation is not a valid (frequency, statistic) tuple."""
+    if not aggregation:
+        return
+    freq, stat = aggregation
+    try:
+        offset = to_offset(freq)
+    except ValueError:
+        print(f"! Unknown aggregation frequency: {freq} (i.e. 1H, 30min).")
+        sys.exit(1)
+    # bins must be aligned to the time ranges of retrievals and cached blocks
+    if not isinstance(offset, Tick) or pd.Timedelta(offset) % pd.Timedelta("1min"):
+        print(f"! Aggregation frequency must be whole minutes, hours or days: {freq}")
+        sys.exit(1)
+    if stat not in AGGREGATION_STATS:
+        print(
+            f"! Unknown aggregation statistic: {stat}. Choose from {AGGREGATION_STATS}."
+        )
+        sys.exit(1)
+
+
+def aggregation_range(start, end, freq):
+    """Extend (start, end] to the aggregation bins which overlap it.
+
+    Like aggregate_dwh, the range excludes its start, unless start == end.
+    Every retrieval, cached block and chunk of the extended range consists
+    of whole bins, independent of the time ranges which have been retrieved
+    before. The bin ending at the new start is not part of the range, but
+    of a longer cached or shared retrieval: see whole_bins.
+
+    Args:
+        start, end  (str):  YYYYmmddHH
+        freq        (str):  aggregation frequency, i.e. "1H"
+
+    Returns:
+        start, end  (str):  beginning of the first and end of the last bin,
+                            YYYYmmddHHMM for bins shorter than 1 hour
+
+    """
+    step = pd.Timedelta(to_offset(freq))
+    first = pd.Timestamp(str2time(start)).floor(step)
+    last = pd.Timestamp(str2time(end)).ceil(step)
+    if first == last:  # start == end at the end of a bin
+        first -= step
+    length = 12 if first.minute or last.minute else 10
+    return time2str(first, length), time2str(last, length)
+
+
+def whole_bins(data, start):
+    """Drop the bin ending at start (the beginning of an aggregation_range).
+
+    It is only part of the data if the range was contained in a longer
+    cached or shared retrieval.
+    """
+    if data.empty:
+        return data
+    return data[data["termin"] > str2time(start)].reset_index(drop=True)
+
+
+def dwh_retrieve(
+    device, station, vars, timestamps, verbose=False, levels=None, aggregation=None
+):
     """Retrieve observational data from DWH.
 
     The jretrievedwh command works for two different observational types:
@@ -344,9 +765,15 @@ def dwh_retrieve(device, station, vars, timestamps, verbose=False):
         station     string              station short name
         vars        list of strings     variables
         timestamps  list of strings     either 1 or 2 timestamps YYYYmmddHH
+        levels      list of floats      profile data only: interpolate the
+                                        profiles to these altitudes
+        aggregation tuple               surface data only: frequency and
+                                        statistic, i.e. ("1H", "mean"); one
+                                        row per bin overlapping the timestamps
 
     Output:
-        pandas dataframe
+        pandas dataframe, or for profile data of several times an
+        xarray DataArray with dims (time, altitude, variable)
     """
     # parse timestamp input to 2 string of format YYYYmmddHH
     t1, t2 = parse_timestamps(timestamps)
@@ -355,9 +782,6 @@ def dwh_retrieve(device, station, vars, timestamps, verbose=False):
     if isinstance(vars, str):
         vars = (vars,)
 
-    # prepare string of DWH IDs for variable(s)
-    vars_str = parse_vars(vars, device)
-
     if verbose:
         print(f"Calling dwh retrieve command:")
         print(f"  device: {device}")
@@ -365,50 +789,41 @@ def dwh_retrieve(device, station, vars, timestamps, verbose=False):
         print(f"  variables: {vars}")
         print(f"  timestamps: {t1}, {t2}")
 
+    # minimal set of raw DWH ids and derivations of derived variables
+    raw_ids, derived = plan_retrieval(vars, device, verbose)
+    check_aggregation(aggregation)
+
     # profile-based data
     if device in ["rs", "mwr", "lidar", "ralmo"]:
 
-        # if potential temperature, need to retrieve press, temp
-        if "pot_temp" in vars_str:
-            
-            # air pressure and temp measurment ids
-            press_id = str(vdf["press"].dwh_id[device])
-            temp_id = vdf["temp"].dwh_id[device]
-            altitude_id = vdf["altitude"].dwh_id[device]
-            open_vars = f"{press_id},{temp_id},{altitude_id}"
-            
-
-            # call dwh retrieve for surface-based data
-            raw_data = dwh_profile(
-                device=device,
-                station_id=sdf[station].dwh_id,
-                vars_str=open_vars,
-                start=t1,
-                end=t2,
-                verbose=verbose,
-            )
-            # calculate pot_temp
-            raw_data["pot_temp"] = (
-                calculate_pot_temp(
-                    temp=raw_data[temp_id],
-                    press=raw_data[press_id],
-                    verbose=verbose,
-                )
-            )
-        else: 
-            # call dwh retrieve for profile-based data
-            raw_data = dwh_profile(
+        if aggregation:
+            print(f"! Aggregation is only available for surface-based data.")
+            sys.exit(1)
+
+        # call dwh retrieve for profile-based data (shared with identical
+        #  or contained requests of this run)
+        raw_data = coalesced_retrieve(
+            (device, station),
+            raw_ids,
+            t1,
+            t2,
+            lambda: dwh_profile(
                 device=device,
                 station_id=sdf[station].dwh_id,
-                vars_str=vars_str,
+                vars_str=",".join(raw_ids),
                 start=t1,
                 end=t2,
                 verbose=verbose,
-            )
+            ),
+            verbose=verbose,
+        )
 
         if raw_data.empty:
             return raw_data
 
+        # derived variables from the shared raw data
+        raw_data = compute_derived(raw_data, derived, verbose)
+
         # rename column names to nice short names and
         #  make list of relevant columns
         raw_data.rename(columns={"termin": "timestamp"}, inplace=True)
@@ -441,195 +856,55 @@ def dwh_retrieve(device, station, vars, timestamps, verbose=False):
         if t1 == t2:
             return data
 
-        # case B) 2 timestamps specified for profile data -> rearrange dataframe
+        # case B) 2 timestamps specified for profile data
+        #  -> labelled array (time, altitude, variable)
         else:
-            if len(vars) > 1:
-                print(
-                    f"! Profile retrieve not yet supported for multiple times AND multiple variables!"
-                )
-                sys.exit(1)
-            else:
-
-                # print warning
-                print(
-                    "! Assuming that retrieved profiles all have same altitude levels !"
-                )
-
-                # extract unique timestamps
-                unique_ts = data.timestamp.unique()
-
-                # create new dataframe with timestamps as columns
-                new_df = pd.DataFrame(columns=unique_ts)
-
-                # loop over timestamps to fill new dataframe
-                for ts in unique_ts:
-                    # print(ts)
-                    new_df[ts] = data[data.timestamp == ts][var].values
-
-                # use altitude as index
-                new_df.index = data[data.timestamp == ts]["altitude"]
-
-                return new_df
-
-    # surface-based data
-    elif device in ["5cm", "2m", "2m_tower", "10m", "10m_tower", "30m_tower", "mwri"]:
-
-        # if net lw/sw radiation is required we need to calculate it
-        if "net_calc" in vars_str:
-
-            # downward, upward radiation DWH ids
-            dwn_id, up_id = vars_str.split(":")[1:3]
-
-            # adding lw_down and lw_up DWH ids to vars_str"
-            vars_str = f"{vars_str.split('net_calc')[0]}{dwn_id},{up_id}{vars_str.split(':')[3]}"
-
-            # call dwh retrieve for surface-based data
-            raw_data = dwh_surface(
-                station_name=sdf[station].dwh_name,
-                vars_str=vars_str,
-                start=t1,
-                end=t2,
+            return profiles_to_array(
+                data,
+                [vdf[var].short_name for var in vars],
+                levels=levels,
                 verbose=verbose,
             )
 
-            if verbose:
-                print("Subtracting downward and upward radiations")
-
-            # lw_net = lw_down - lw_up
-            raw_data[f"net_calc:{dwn_id}:{up_id}:"] = raw_data[dwn_id] - raw_data[up_id]
-
-        # if specific humidity, need to retrieve P and tdew or rel_hum
-        elif "qv" in vars_str:
-
-            # 2m: calculate qv from tdew (rh not available)
-            if device == "2m":
-
-                # air pressure and dewp temp measurment ids
-                press_id = str(vdf["press"].dwh_id[device])
-                dewp_temp_id = vdf["dewp_temp"].dwh_id[device]
-                open_vars = f"{press_id},{dewp_temp_id}"
-
-                # call dwh retrieve for surface-based data
-                raw_data = dwh_surface(
-                    station_name=sdf[station].dwh_name,
-                    vars_str=open_vars,
-                    start=t1,
-                    end=t2,
-                    verbose=verbose,
-                )
-
-                # calculate specific humidity
-                raw_data["qv"] = (
-                    calculate_qv_from_tdew(
-                        Press=raw_data[press_id],
-                        Tdew=raw_data[dewp_temp_id],
-                        verbose=verbose,
-                    )
-                    * 1000  # from kg/kg to g/kg
-                )
-
-            # tower: calculate from rh (tdew not available)
-            elif device in ["2m_tower", "10m_tower", "30m_tower"]:
-
-                # air pressure and dewp temp measurment ids
-                press_id = vdf["press"].dwh_id[
-                    "2m"
-                ]  # pressure only available at 2 meter
-                rel_hum_id = vdf["rel_hum"].dwh_id[device]
-                temp_id = vdf["temp"].dwh_id[device]
-                open_vars = f"{press_id},{rel_hum_id},{temp_id}"
-
-                # call dwh retrieve for surface-based data
-                raw_data = dwh_surface(
-                    station_name=sdf[station].dwh_name,
-                    vars_str=open_vars,
-                    start=t1,
-                    end=t2,
-                    verbose=verbose,
-                )
-
-                # as pressure is measured by 2m device, we have some Na values
-                # so we propagate last valid observation forward to next valid
-                raw_data = raw_data.fillna(method="ffill")
-
-                # calculate specific humidity
-                raw_data["qv"] = (
-                    calculate_qv_from_rh(
-                        Press=raw_data[press_id],
-                        rh=raw_data[rel_hum_id],
-                        T=raw_data[temp_id],
-                        verbose=verbose,
-                    )
-                    * 1000  # from kg/kg to g/kg
-                )
-
-            # should not happen in principle
-            else:
-                print(f"Device: {device} not available for qv.")
-
-        elif "pot_temp" in vars_str:
-
-            # air pressure and dewp temp measurment ids
-            press_id = str(vdf["press"].dwh_id[device])
-            temp_id = vdf["temp"].dwh_id[device]
-            open_vars = f"{press_id},{temp_id}"
-
-            # call dwh retrieve for surface-based data
-            raw_data = dwh_surface(
-                station_name=sdf[station].dwh_name,
-                vars_str=open_vars,
-                start=t1,
-                end=t2,
-                verbose=verbose,
-            )
-
-            # calculate specific humidity
-            raw_data["pot_temp"] = (
-                calculate_pot_temp(
-                    temp=raw_data[temp_id],
-                    press=raw_data[press_id],
-                    verbose=verbose,
-                )
-            )
-
-        # if vertical temperature gradient we need to calculate it (between 30m and 10m)
-        elif "grad_temp" in vars_str:
-
-            top_id, bot_id = vars_str.split(":")[1:3]
-            open_vars = f"{top_id},{bot_id}"
+    # surface-based data
+    elif device in ["5cm", "2m", "2m_tower", "10m", "10m_tower", "30m_tower", "mwri"]:
 
-            # call dwh retrieve for surface-based data
-            raw_data = dwh_surface(
+        shared_ids = raw_ids
+        if aggregation:
+            # whole bins which overlap [t1, t2]
+            t1, t2 = aggregation_range(t1, t2, aggregation[0])
+            # derived variables are computed before the aggregation: only
+            #  share retrievals which computed them as well
+            shared_ids = raw_ids + [step.column for step in derived]
+
+        # call dwh retrieve for surface-based data (shared with identical
+        #  or contained requests of this run)
+        raw_data = coalesced_retrieve(
+            (device, station, aggregation),
+            shared_ids,
+            t1,
+            t2,
+            lambda: dwh_surface(
                 station_name=sdf[station].dwh_name,
-                vars_str=open_vars,
+                vars_str=",".join(raw_ids),
                 start=t1,
                 end=t2,
                 verbose=verbose,
-            )
-
-            # gradT = (Ttop - Tbot)/(alt_top - alt_bot)
-            raw_data[f"grad_temp:{top_id}:{bot_id}"] = (
-                raw_data[top_id] - raw_data[bot_id]
-            ) / 20
-
-            if verbose:
-                print(
-                    f"Calculating observed vertical temperature gradient ({vars_str})."
-                )
+                aggregation=aggregation,
+                derived=derived,
+            ),
+            verbose=verbose,
+        )
 
-        else:
-            # call dwh retrieve for surface-based data
-            raw_data = dwh_surface(
-                station_name=sdf[station].dwh_name,
-                vars_str=vars_str,
-                start=t1,
-                end=t2,
-                verbose=verbose,
-            )
+        if aggregation:
+            raw_data = whole_bins(raw_data, t1)
 
         if raw_data.empty:
             return raw_data
 
+        # derived variables from the shared raw data
+        raw_data = compute_derived(raw_data, derived, verbose)
+
         # rename column names to nice short names and
         #  make list of relevant columns
         raw_data.rename(columns={"termin": "timestamp"}, inplace=True)
@@ -652,6 +927,87 @@ def dwh_retrieve(device, station, vars, timestamps, verbose=False):
         sys.exit(1)
 
 
+def network_stations():
+    """Short names of all stations in sdf with a DWH station name."""
+    return [
+        station
+        for station in sdf.columns
+        if isinstance(getattr(sdf[station], "dwh_name", None), str)
+    ]
+
+
+def dwh_retrieve_stations(
+    device, stations, vars, timestamps, verbose=False, aggregation=None
+):
+    """Retrieve surface-based data of several stations in one jretrievedwh call.
+
+    Input:
+        device      string              surface device: '5cm', '2m', '10m', ...
+        stations    list of strings     station short names
+        vars        list of strings     variables
+        timestamps  list of strings     either 1 or 2 timestamps YYYYmmddHH
+        aggregation tuple               frequency and statistic, i.e. ("1H", "mean");
+                                        one row per bin overlapping the timestamps
+
+    Output:
+        pandas dataframe with (station, timestamp) index, one column per variable
+    """
+    # parse timestamp input to 2 string of format YYYYmmddHH
+    t1, t2 = parse_timestamps(timestamps)
+
+    # create tuple of variables if only 1 variable is given
+    if isinstance(vars, str):
+        vars = (vars,)
+
+    if device not in ["5cm", "2m", "2m_tower", "10m", "10m_tower", "30m_tower"]:
+        print(f"! Multi-station retrieve not available for device: {device}")
+        sys.exit(1)
+
+    # minimal set of raw DWH ids and derivations of derived variables
+    raw_ids, derived = plan_retrieval(vars, device, verbose)
+    check_aggregation(aggregation)
+    if aggregation:
+        # whole bins which overlap [t1, t2]
+        t1, t2 = aggregation_range(t1, t2, aggregation[0])
+
+    # DWH station name -> station short name
+    station_names = {sdf[station].dwh_name: station for station in stations}
+
+    raw_data = dwh_surface_stations(
+        station_names=list(station_names),
+        vars_str=",".join(raw_ids),
+        start=t1,
+        end=t2,
+        verbose=verbose,
+        aggregation=aggregation,
+        derived=derived,
+    )
+
+    if aggregation:
+        raw_data = whole_bins(raw_data, t1)
+
+    if raw_data.empty:
+        return raw_data
+
+    # derived variables, separately for every station
+    raw_data = compute_derived_by_station(raw_data, derived, verbose)
+
+    # rename column names to nice short names
+    raw_data.rename(columns={"termin": "timestamp"}, inplace=True)
+    relevant_vars = []
+    for var in vars:
+        dwh_id = vdf[var].dwh_id[device]
+        short_name = vdf[var].short_name
+        raw_data.rename(columns={dwh_id: short_name}, inplace=True)
+        relevant_vars.append(short_name)
+
+    # split by station
+    raw_data["station"] = raw_data["nat_abr"].astype(str).str.strip().map(station_names)
+    data = raw_data.set_index(["station", "timestamp"])[relevant_vars].sort_index()
+
+    return data
+
+
 if __name__ == "__main__":
 
     test_profile = False
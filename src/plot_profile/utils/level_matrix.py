@@ -0,0 +1,89 @@
+"""Purpose: (time x level) layout of model timeseries.
+
+Model timeseries are kept as an xarray Dataset with one (time, level) array
+per variable (plus a member dimension for PE-AROME members or statistics),
+s.t. derived variables are computed for all levels at once. The column
+labels used by the plots ("var~level", "var~level~member") are only created
+by level_frame, right before plotting:
+    level 0 (2D variables): "2m_temp"       (ensemble: "2m_temp~0~mean")
+    other levels:           "temp~3"        (ensemble: "temp~3~m1")
+
+Date: 19/10/2026.
+"""
+
+# Third-party
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+
+def level_dataset(timestamps, fields, levels, members=None):
+    """Dataset of model fields.
+
+    Args:
+        timestamps  (list of datetime):         valid times
+        fields      (dict):                     variable -> array of shape
+                                                (time, level[, member])
+        levels      (list of int or float):     model levels or heights
+        members     (list of str):              member or statistic labels
+
+    Returns:
+        xarray Dataset: dims (time, level[, member])
+
+    """
+    dims = ("time", "level") if members is None else ("time", "level", "member")
+    coords = {"time": pd.to_datetime(list(timestamps)), "level": list(levels)}
+    if members is not None:
+        coords["member"] = list(members)
+    return xr.Dataset(
+        {var: (dims, np.asarray(values)) for var, values in fields.items()},
+        coords=coords,
+    )
+
+
+def level_label(var, level, member=None):
+    """Column label of a variable at a level (and member)."""
+    if member is not None:
+        return f"{var}~{level}~{member}"
+    if level == 0:
+        return var
+    return f"{var}~{level}"
+
+
+def level_frame(datasets):
+    """Flatten datasets to a plotting dataframe (columns timestamp, var~level).
+
+    Args:
+        datasets    (Dataset or list of Datasets):  see level_dataset
+
+    Returns:
+        pandas dataframe
+
+    """
+    if isinstance(datasets, xr.Dataset):
+        datasets = [datasets]
+
+    columns = {"timestamp": datasets[0]["time"].to_numpy()}
+    for ds in datasets:
+        for var, array in ds.data_vars.items():
+            if "member" in array.dims:
+                array = array.transpose("time", "level", "member")
+                for j, level in enumerate(array["level"].values):
+                    for k, member in enumerate(array["member"].values):
+                        columns[level_label(var, level, member)] = array.values[:, j, k]
+            else:
+                array = array.transpose("time", "level")
+                for j, level in enumerate(array["level"].values):
+                    columns[level_label(var, level)] = array.values[:, j]
+
+    return pd.DataFrame(columns)
+
+
+if __name__ == "__main__":
+    ds = level_dataset(
+        pd.date_range("2021-11-19", periods=3, freq="H"),
+        {"temp": np.arange(6.0).reshape(3, 2), "press": np.ones((3, 2)) * 950},
+        levels=[1, 2],
+    )
+    print(ds)
+    print(level_frame(ds))
@@ -0,0 +1,128 @@
+"""Purpose: Interpolate profiles to pressure levels.
+
+Model columns and observed profiles are interpolated linearly in ln(p) to
+requested pressure levels. All columns (i.e. leadtimes, soundings or
+members) and all variables are interpolated in one batched operation: every
+column is sorted by ln(p) once, the neighbours of every target level are
+found by counting the levels below it, and the same indices are applied to
+all variables. Levels outside of a column are NaN.
+
+Date: 19/10/2026.
+"""
+
+# Third-party
+import numpy as np
+import pandas as pd
+from matplotlib.ticker import NullFormatter
+from matplotlib.ticker import ScalarFormatter
+
+# standard pressure levels of radiosoundings (hPa)
+STANDARD_LEVELS = [1000, 925, 850, 700, 500, 400, 300, 250, 200, 150, 100]
+
+VCOORDS = ["height", "press"]
+
+
+def interp_log_pressure(press, fields, levels, axis=-1):
+    """Interpolate fields linearly in ln(p) to pressure levels.
+
+    Args:
+        press   (array):            pressure of the columns (any unit)
+        fields  (array or dict):    one or several variables (dict: name ->
+                                    array), broadcastable against press
+        levels  (1d array):         target pressure levels (unit of press)
+        axis    (int):              vertical axis (either direction)
+
+    Returns:
+        array or dict (like fields): the vertical axis replaced by the levels
+
+    """
+    single = not isinstance(fields, dict)
+    if single:
+        fields = {None: fields}
+
+    targets = np.log(np.asarray(levels, dtype="float64"))
+    press = np.moveaxis(np.asarray(press, dtype="float64"), axis, -1)
+    fields = {
+        name: np.moveaxis(np.asarray(values, dtype="float64"), axis, -1)
+        for name, values in fields.items()
+    }
+    shape = np.broadcast_shapes(
+        press.shape, *(values.shape for values in fields.values())
+    )
+
+    # sort every column by ln(p), missing pressures last
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_press = np.log(np.broadcast_to(press, shape))
+    order = np.argsort(log_press, axis=-1)
+    log_press = np.take_along_axis(log_press, order, axis=-1)
+    n_valid = np.isfinite(log_press).sum(axis=-1)[..., None]
+
+    # neighbours of every target: number of levels with ln(p) <= target
+    below = (log_press[..., None, :] <= targets[:, None]).sum(axis=-1)
+    upper = np.clip(np.minimum(below, n_valid - 1), 0, None)
+    lower = np.maximum(below - 1, 0)
+    x_lower = np.take_along_axis(log_press, lower, axis=-1)
+    x_upper = np.take_along_axis(log_press, upper, axis=-1)
+    inside = (
+        (n_valid > 0)
+        & (targets >= log_press[..., :1])
+        & (targets <= np.take_along_axis(log_press, np.maximum(n_valid - 1, 0), -1))
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(
+            x_upper > x_lower, (targets - x_lower) / (x_upper - x_lower), 0
+        )
+
+    result = {}
+    for name, values in fields.items():
+        values = np.take_along_axis(np.broadcast_to(values, shape), order, axis=-1)
+        value_lower = np.take_along_axis(values, lower, axis=-1)
+        value_upper = np.take_along_axis(values, upper, axis=-1)
+        interpolated = value_lower + weight * (value_upper - value_lower)
+        result[name] = np.moveaxis(np.where(inside, interpolated, np.nan), -1, axis)
+
+    return result[None] if single else result
+
+
+def frame_to_pressure(df, press, levels):
+    """Interpolate all profile columns of a dataframe to pressure levels.
+
+    Args:
+        df      (pandas dataframe): one column per profile (variables, leadtimes)
+        press   (series or df):     pressure (hPa) of all columns (series) or of
+                                    every column (dataframe with the same columns)
+        levels  (list of float):    pressure levels (hPa)
+
+    Returns:
+        pandas dataframe: column press (levels) and the interpolated columns;
+                          levels without any value are dropped
+
+    """
+    columns = list(df.columns)
+    values = df.to_numpy(dtype="float64").T
+    if isinstance(press, pd.DataFrame):
+        press = press[columns].to_numpy(dtype="float64").T
+    else:
+        press = press.to_numpy(dtype="float64")[None, :]
+
+    interpolated = interp_log_pressure(press, values, levels)
+    data = pd.DataFrame(interpolated.T, columns=columns)
+    data.insert(0, "press", np.asarray(levels, dtype="float64"))
+    return data.dropna(how="all", subset=columns).reset_index(drop=True)
+
+
+def pressure_axis(ax, levels):
+    """Logarithmic, inverted pressure y-axis with ticks at the levels."""
+    ax.set_yscale("log")
+    ax.set_ylim(max(levels), min(levels))
+    ax.set_yticks(levels)
+    ax.yaxis.set_major_formatter(ScalarFormatter())
+    ax.yaxis.set_minor_formatter(NullFormatter())
+    ax.set_ylabel("Pressure [hPa]")
+
+
+if __name__ == "__main__":
+    # two soundings, top-down and bottom-up, with a missing level
+    press = np.array([[1000.0, 900.0, 800.0, 700.0], [650.0, 750.0, np.nan, 950.0]])
+    temp = np.array([[15.0, 8.0, 2.0, -4.0], [-6.0, 0.0, np.nan, 12.0]])
+    print(interp_log_pressure(press, temp, STANDARD_LEVELS[:4]))
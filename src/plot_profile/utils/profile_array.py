@@ -0,0 +1,164 @@
+"""Purpose: Reshape long DWH profile tables to labelled arrays.
+
+jretrievedwh returns profiles in long format: one row per (timestamp,
+altitude) with one column per variable. For several times and variables
+these rows are reshaped in one step into an xarray DataArray with the
+dimensions (time, altitude, variable). Soundings with different level sets
+(radiosondes, lidar) can optionally be interpolated to common levels.
+
+Date: 19/10/2026.
+"""
+
+# Third-party
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+
+def regrid_profiles(data, variables, levels, verbose=False):
+    """Interpolate every profile linearly to common altitude levels.
+
+    All profiles are interpolated at once: the altitudes of profile i are
+    shifted by i * width, s.t. the sorted (profile, altitude) pairs become
+    one monotonic axis and the neighbours of every target level can be found
+    with a single searchsorted. Levels outside of a profile are set to NaN.
+
+    Args:
+        data        (pandas dataframe): columns timestamp, altitude, <variables>
+        variables   (list of str):      columns to interpolate
+        levels      (1d array):         target altitudes
+        verbose     (bool):             print details
+
+    Returns:
+        xarray DataArray: dims (time, altitude, variable)
+
+    """
+    levels = np.asarray(levels, dtype="float64")
+    data = data.dropna(subset=["altitude"])
+    times, codes = np.unique(data["timestamp"].to_numpy(), return_inverse=True)
+
+    if verbose:
+        print(f"Regridding {len(times)} profiles to {len(levels)} levels.")
+
+    altitude = data["altitude"].to_numpy(dtype="float64")
+    base = min(altitude.min(), levels.min())
+    width = max(altitude.max(), levels.max()) - base + 1
+    targets = (np.arange(len(times))[:, None] * width + (levels - base)).ravel()
+    target_codes = np.repeat(np.arange(len(times)), len(levels))
+
+    # float32 data (PLOT_PROFILE_FLOAT32) stays float32
+    dtype = np.result_type(np.float32, *data[variables].dtypes)
+    values = np.full((len(times) * len(levels), len(variables)), np.nan, dtype=dtype)
+    for i, variable in enumerate(variables):
+        valid = data[variable].notna().to_numpy()
+        # average duplicated levels, sort by (profile, altitude)
+        profile = (
+            pd.DataFrame(
+                {
+                    "code": codes[valid],
+                    "altitude": altitude[valid],
+                    "value": data[variable].to_numpy(dtype=dtype)[valid],
+                }
+            )
+            .groupby(["code", "altitude"], sort=True)["value"]
+            .mean()
+        )
+        if profile.empty:
+            continue
+        code = profile.index.get_level_values("code").to_numpy()
+        keys = code * width + (profile.index.get_level_values("altitude") - base)
+        keys = keys.to_numpy()
+        value = profile.to_numpy()
+
+        # upper and lower neighbour of every target, within the same profile
+        upper = np.searchsorted(keys, targets, side="left")
+        lower = np.clip(upper - 1, 0, len(keys) - 1)
+        upper = np.clip(upper, 0, len(keys) - 1)
+        exact = keys[upper] == targets
+        inside = (
+            (code[lower] == target_codes)
+            & (code[upper] == target_codes)
+            & (keys[lower] <= targets)
+            & (keys[upper] >= targets)
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = (targets - keys[lower]) / (keys[upper] - keys[lower])
+            interpolated = value[lower] + weight * (value[upper] - value[lower])
+        values[:, i] = np.where(
+            exact, value[upper], np.where(inside, interpolated, np.nan)
+        )
+
+    return xr.DataArray(
+        values.reshape(len(times), len(levels), len(variables)),
+        coords={"time": times, "altitude": levels, "variable": list(variables)},
+        dims=("time", "altitude", "variable"),
+    )
+
+
+def profiles_to_array(data, variables, levels=None, verbose=False):
+    """Reshape long profile data to a (time, altitude, variable) array.
+
+    Args:
+        data        (pandas dataframe): columns timestamp, altitude, <variables>
+        variables   (list of str):      variable columns
+        levels      (1d array):         if given, interpolate all profiles to
+                                        these altitudes (Def: keep the union
+                                        of all levels, missing ones are NaN)
+        verbose     (bool):             print details
+
+    Returns:
+        xarray DataArray: dims (time, altitude, variable)
+
+    """
+    variables = list(variables)
+    if levels is not None:
+        return regrid_profiles(data, variables, levels, verbose)
+
+    # one pivot for all times and variables; duplicated levels are averaged
+    grouped = data.groupby(["timestamp", "altitude"], sort=True)[variables].mean()
+    array = (
+        grouped.to_xarray()
+        .to_array(dim="variable")
+        .rename({"timestamp": "time"})
+        .transpose("time", "altitude", "variable")
+    )
+
+    n_levels = grouped.groupby(level="timestamp").size()
+    if n_levels.min() < array.sizes["altitude"]:
+        print(
+            "! Profiles have different altitude levels; missing levels are NaN."
+            + " Specify levels to regrid them."
+        )
+
+    return array
+
+
+def profile_frame(array, variable):
+    """Dataframe of one variable: altitude as index, timestamps as columns.
+
+    Args:
+        array       (xarray DataArray): dims (time, altitude, variable)
+        variable    (str):              variable short name
+
+    Returns:
+        pandas dataframe
+
+    """
+    return array.sel(variable=variable).transpose("altitude", "time").to_pandas()
+
+
+if __name__ == "__main__":
+    # two soundings with different levels
+    example = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                ["2021-11-19 00:00"] * 3 + ["2021-11-19 12:00"] * 2
+            ),
+            "altitude": [491.0, 1000.0, 2000.0, 491.0, 1500.0],
+            "temp": [5.0, 2.0, -3.0, 8.0, 1.0],
+            "rel_hum": [90.0, 80.0, 60.0, 70.0, 50.0],
+        }
+    )
+    print(profiles_to_array(example, ["temp", "rel_hum"]))
+    print(profiles_to_array(example, ["temp", "rel_hum"], levels=[500, 1000, 1500]))
@@ -0,0 +1,134 @@
+"""Purpose: Read-only registry of variables or stations, indexed by short name.
+
+The attributes of all variables (stations) are read once from a compact data
+file next to this module into frozen dataclasses with __slots__, s.t. a
+lookup is a dict access and every attribute a plain attribute access:
+    vdf["temp"].dwh_id["rs"]
+The registry behaves like the former dataframes (one column per short name,
+one row per attribute) for reading: iteration and `in` over the short names,
+`.columns` and `.loc`, the latter via a dataframe view that is only built on
+first use.
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import csv
+import dataclasses
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+# Third-party
+import pandas as pd
+
+
+def data_path(name):
+    """Path of a data file of the registries."""
+    return Path(__file__).with_name(name)
+
+
+def read_json_records(name, section):
+    """Read the records of a JSON data file, completed by its defaults.
+
+    Args:
+        name    (str):  file name, i.e. variables.json
+        section (str):  key of the records, i.e. variables
+
+    Returns:
+        dict: short name -> attributes (dict)
+
+    """
+    with open(data_path(name), encoding="utf-8") as f:
+        data = json.load(f)
+    defaults = data.get("defaults", {})
+    return {
+        short_name: {**defaults, "short_name": short_name, **attributes}
+        for short_name, attributes in data[section].items()
+    }
+
+
+def read_csv_records(name, types):
+    """Read the records of a CSV data file with one row per short name.
+
+    Args:
+        name    (str):  file name, i.e. stations.csv
+        types   (dict): column -> type (i.e. float); other columns are str,
+                        empty cells are None
+
+    Returns:
+        dict: short name -> attributes (dict)
+
+    """
+    with open(data_path(name), encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    return {
+        row["short_name"]: {
+            column: None if value == "" else types.get(column, str)(value)
+            for column, value in row.items()
+        }
+        for row in rows
+    }
+
+
+def freeze(value):
+    """Convert lists to tuples (i.e. alternative icon names)."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+class Registry(Mapping):
+    """Short name -> record (frozen dataclass); read-only."""
+
+    __slots__ = ("_records", "_frame")
+
+    def __init__(self, record_type, records):
+        """Registry of records.
+
+        Args:
+            record_type (dataclass):    frozen dataclass of one record
+            records     (dict):         short name -> attributes (dict)
+
+        """
+        self._records = {
+            short_name: record_type(
+                **{key: freeze(value) for key, value in attributes.items()}
+            )
+            for short_name, attributes in records.items()
+        }
+        self._frame = None
+
+    def __getitem__(self, short_name):
+        return self._records[short_name]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __repr__(self):
+        return repr(self.frame)
+
+    @property
+    def columns(self):
+        """Short names (columns of the dataframe view)."""
+        return list(self._records)
+
+    @property
+    def frame(self):
+        """Dataframe view: one column per short name, one row per attribute."""
+        if self._frame is None:
+            records = list(self._records.values())
+            attributes = [field.name for field in dataclasses.fields(records[0])]
+            self._frame = pd.DataFrame(
+                [[getattr(record, name) for record in records] for name in attributes],
+                index=attributes,
+                columns=self.columns,
+                dtype=object,
+            )
+        return self._frame
+
+    @property
+    def loc(self):
+        """Label-based access to the dataframe view, i.e. vdf.loc["mult"]["temp"]."""
+        return self.frame.loc
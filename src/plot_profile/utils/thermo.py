@@ -0,0 +1,423 @@
+"""Purpose: Thermodynamic kernels for arrays of any shape.
+
+All kernels are built from element-wise arithmetic and numpy ufuncs only,
+s.t. they work on numpy arrays, pandas objects, xarray DataArrays and dask
+arrays alike and broadcast over any dimensions (time, level, station,
+member). Derived fields of a whole heatmap or of all stations are computed
+in one call instead of once per level or column; labelled inputs keep their
+index or coordinates.
+
+Units are explicit: every kernel takes the units of its inputs (and of its
+output where there is a choice) as keyword arguments:
+    temperature:        "degC", "K"
+    pressure:           "hPa", "Pa"
+    specific humidity:  "kg/kg", "g/kg"
+
+The element-wise chains (saturation vapour pressure, dew point, humidity,
+density, potential temperature, wind direction) create one temporary array
+per operation with numpy. With PLOT_PROFILE_THERMO_BACKEND=numba (and numba
+installed) they are compiled to fused, multi-threaded ufuncs instead, which
+evaluate the whole chain per element; without numba the numpy implementation
+is used. Compiled ufuncs still work on pandas, xarray and dask inputs.
+numpy stays the default: its SIMD transcendental functions beat the fused
+kernels on a single core, s.t. numba only pays off with several cores.
+Compare both on the target machine with:
+    python -m plot_profile.utils.thermo_benchmark
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import math
+import os
+import sys
+from functools import lru_cache
+from functools import partial
+
+# Third-party
+import numpy as np
+import pandas as pd
+
+try:
+    # Third-party
+    import numba
+except ImportError:
+    numba = None
+
+# constants
+ZERO_CELSIUS = 273.15  # K
+P_REF = 1000.0  # reference pressure of the potential temperature (hPa)
+R_D = 287.05  # specific gas constant for dry air (J/kg*K)
+CP_D = 1004.0  # specific heat of dry air at constant pressure (J/kg*K)
+R_V = 461.51  # specific gas constant for water vapour (J/kg*K)
+EPSILON = 0.622  # ratio of the gas constants of dry air and water vapour
+
+TEMP_UNITS = ["degC", "K"]
+PRESS_UNITS = {"hPa": 1.0, "Pa": 0.01}  # factor to hPa
+HUMIDITY_UNITS = {"kg/kg": 1.0, "g/kg": 1e-3}  # factor to kg/kg
+
+BACKENDS = ["numpy", "numba"]
+
+
+def backend():
+    """Return the kernel backend selected by PLOT_PROFILE_THERMO_BACKEND.
+
+    Falls back to numpy if numba is not installed.
+    """
+    name = os.environ.get("PLOT_PROFILE_THERMO_BACKEND", "numpy").lower()
+    if name not in BACKENDS:
+        print(f"! Unknown thermo backend: {name}. Choose from {BACKENDS}.")
+        sys.exit(1)
+    if name == "numba" and numba is None:
+        return "numpy"
+    return name
+
+
+def jit(function):
+    """Compile a scalar function lazily with numba (if installed)."""
+    return numba.njit(function) if numba is not None else function
+
+
+# scalar kernels for numba; units as in the numpy code of their public functions
+@jit
+def _saturation_vapour_pressure(temp):
+    return 6.112 * math.exp((17.67 * temp) / (temp + 243.5))
+
+
+@jit
+def _dewpoint_from_rh(rh, temp):
+    return (rh / 100) ** (1 / 8) * (112 + (0.9 * temp)) - 112 + (0.1 * temp)
+
+
+@jit
+def _qv_from_dewpoint(press, tdew):
+    e = _saturation_vapour_pressure(tdew)
+    return (EPSILON * e) / (press - ((1 - EPSILON) * e))
+
+
+@jit
+def _qv_from_rh(press, rh, temp):
+    return _qv_from_dewpoint(press, _dewpoint_from_rh(rh, temp))
+
+
+@jit
+def _rh_from_qv(temp, qv, press):
+    e = qv * press / ((1 - EPSILON) * qv + EPSILON)
+    rh = e / _saturation_vapour_pressure(temp)
+    # ordered comparisons of NaN would raise invalid value warnings
+    if rh != rh:
+        return rh
+    return 100 * min(max(rh, 0.0), 1.0)
+
+
+@jit
+def _potential_temperature(temp, press):
+    return temp * (P_REF / press) ** (R_D / CP_D)
+
+
+@jit
+def _air_density(press, temp, qv, qc):
+    return press / (R_D * temp * (1 + (R_V / R_D - 1) * qv - qc))
+
+
+@jit
+def _wind_direction(u, v):
+    return (270 - math.degrees(math.atan2(v, u))) % 360
+
+
+@lru_cache(maxsize=None)
+def compiled(kernel):
+    """Fused, multi-threaded float32/float64 ufunc of kernel (compiled on first use)."""
+    # float32 first: numpy takes the first loop its inputs can be cast to safely
+    n_args = kernel.py_func.__code__.co_argcount
+    signatures = [
+        f"{dtype}({', '.join([dtype] * n_args)})" for dtype in ["float32", "float64"]
+    ]
+    return numba.vectorize(signatures, target="parallel", cache=True)(kernel.py_func)
+
+
+def apply_ufunc(ufunc, *args):
+    """Apply ufunc; pandas series are aligned and passed as arrays.
+
+    pandas does not support ufuncs with more than two inputs if one of them
+    is a scalar.
+    """
+    series = [arg for arg in args if isinstance(arg, pd.Series)]
+    if not series:
+        return ufunc(*args)
+
+    index = series[0].index
+    for other in series[1:]:
+        if not other.index.equals(index):
+            index = index.union(other.index)
+    args = [
+        arg.reindex(index).to_numpy() if isinstance(arg, pd.Series) else arg
+        for arg in args
+    ]
+    return pd.Series(ufunc(*args), index=index)
+
+
+def fused(kernel):
+    """Compiled ufunc of kernel, or None with the numpy backend."""
+    if backend() != "numba":
+        return None
+    return partial(apply_ufunc, compiled(kernel))
+
+
+def check_unit(unit, units, quantity):
+    """Exit if unit is not one of the units of quantity."""
+    if unit not in units:
+        print(f"! Unknown {quantity} unit: {unit}. Choose from {list(units)}.")
+        sys.exit(1)
+
+
+def to_celsius(temp, unit="degC"):
+    """Temperature in °C."""
+    check_unit(unit, TEMP_UNITS, "temperature")
+    return temp - ZERO_CELSIUS if unit == "K" else temp
+
+
+def to_kelvin(temp, unit="degC"):
+    """Temperature in K."""
+    check_unit(unit, TEMP_UNITS, "temperature")
+    return temp + ZERO_CELSIUS if unit == "degC" else temp
+
+
+def from_celsius(temp, unit="degC"):
+    """Temperature in °C converted to unit."""
+    check_unit(unit, TEMP_UNITS, "temperature")
+    return temp + ZERO_CELSIUS if unit == "K" else temp
+
+
+def to_hpa(press, unit="hPa"):
+    """Pressure in hPa."""
+    check_unit(unit, PRESS_UNITS, "pressure")
+    factor = PRESS_UNITS[unit]
+    return press * factor if factor != 1 else press
+
+
+def to_kg_per_kg(qv, unit="kg/kg"):
+    """Specific humidity in kg/kg."""
+    check_unit(unit, HUMIDITY_UNITS, "humidity")
+    factor = HUMIDITY_UNITS[unit]
+    return qv * factor if factor != 1 else qv
+
+
+def from_kg_per_kg(qv, unit="kg/kg"):
+    """Specific humidity in kg/kg converted to unit."""
+    check_unit(unit, HUMIDITY_UNITS, "humidity")
+    factor = HUMIDITY_UNITS[unit]
+    return qv / factor if factor != 1 else qv
+
+
+def vertical_gradient(var_bot, var_top, alt_bot, alt_top):
+    """Vertical gradient (var_top - var_bot) / (alt_top - alt_bot) in unit/m."""
+    return (var_top - var_bot) / (alt_top - alt_bot)
+
+
+def saturation_vapour_pressure(temp, temp_unit="degC"):
+    """Saturation vapour pressure over water in hPa (eq. 4.2 in Stull).
+
+    Args:
+        temp        (array):    air or dew point temperature
+        temp_unit   (str):      unit of temp
+
+    Returns:
+        array: (saturation) vapour pressure in hPa
+
+    """
+    temp = to_celsius(temp, temp_unit)
+    kernel = fused(_saturation_vapour_pressure)
+    if kernel is not None:
+        return kernel(temp)
+    return 6.112 * np.exp((17.67 * temp) / (temp + 243.5))
+
+
+def potential_temperature(temp, press, temp_unit="degC", press_unit="hPa"):
+    """Potential temperature in K.
+
+    Args:
+        temp        (array):    air temperature
+        press       (array):    air pressure
+        temp_unit   (str):      unit of temp
+        press_unit  (str):      unit of press
+
+    Returns:
+        array: potential temperature in K
+
+    """
+    temp, press = to_kelvin(temp, temp_unit), to_hpa(press, press_unit)
+    kernel = fused(_potential_temperature)
+    if kernel is not None:
+        return kernel(temp, press)
+    return temp * (P_REF / press) ** (R_D / CP_D)
+
+
+def dewpoint_from_rh(rh, temp, temp_unit="degC"):
+    """Dew point temperature from relative humidity (in the unit of temp).
+
+    Inspired from humidity.to.dewpoint in:
+    https://github.com/geanders/weathermetrics/blob/master/R/moisture_conversions.R
+
+    Args:
+        rh          (array):    relative humidity in %
+        temp        (array):    air temperature
+        temp_unit   (str):      unit of temp (and of the result)
+
+    Returns:
+        array: dew point temperature
+
+    """
+    temp = to_celsius(temp, temp_unit)
+    kernel = fused(_dewpoint_from_rh)
+    if kernel is not None:
+        tdew = kernel(rh, temp)
+    else:
+        tdew = (rh / 100) ** (1 / 8) * (112 + (0.9 * temp)) - 112 + (0.1 * temp)
+    return from_celsius(tdew, temp_unit)
+
+
+def qv_from_dewpoint(press, tdew, press_unit="hPa", temp_unit="degC", qv_unit="kg/kg"):
+    """Specific humidity from pressure and dew point (eq. 4.24 in Stull).
+
+    Args:
+        press       (array):    air pressure
+        tdew        (array):    dew point temperature
+        press_unit  (str):      unit of press
+        temp_unit   (str):      unit of tdew
+        qv_unit     (str):      unit of the result
+
+    Returns:
+        array: specific humidity
+
+    """
+    press = to_hpa(press, press_unit)
+    kernel = fused(_qv_from_dewpoint)
+    if kernel is not None:
+        qv = kernel(press, to_celsius(tdew, temp_unit))
+    else:
+        e = saturation_vapour_pressure(tdew, temp_unit)
+        qv = (EPSILON * e) / (press - ((1 - EPSILON) * e))
+    return from_kg_per_kg(qv, qv_unit)
+
+
+def qv_from_rh(press, rh, temp, press_unit="hPa", temp_unit="degC", qv_unit="kg/kg"):
+    """Specific humidity from pressure, relative humidity and temperature.
+
+    Args:
+        press       (array):    air pressure
+        rh          (array):    relative humidity in %
+        temp        (array):    air temperature
+        press_unit  (str):      unit of press
+        temp_unit   (str):      unit of temp
+        qv_unit     (str):      unit of the result
+
+    Returns:
+        array: specific humidity
+
+    """
+    kernel = fused(_qv_from_rh)
+    if kernel is not None:
+        qv = kernel(to_hpa(press, press_unit), rh, to_celsius(temp, temp_unit))
+        return from_kg_per_kg(qv, qv_unit)
+    tdew = dewpoint_from_rh(rh, temp, temp_unit)
+    return qv_from_dewpoint(press, tdew, press_unit, temp_unit, qv_unit)
+
+
+def rh_from_qv(
+    temp, qv, press=1013.5, temp_unit="degC", press_unit="hPa", qv_unit="kg/kg"
+):
+    """Relative humidity in % (clipped to [0, 100]) from specific humidity.
+
+    Inspired from the qair2rh function in:
+    https://github.com/PecanProject/pecan/blob/master/modules/data.atmosphere/R/metutils.R
+
+    Args:
+        temp        (array):    air temperature
+        qv          (array):    specific humidity
+        press       (array):    air pressure (Def: 1013.5 hPa)
+        temp_unit   (str):      unit of temp
+        press_unit  (str):      unit of press
+        qv_unit     (str):      unit of qv
+
+    Returns:
+        array: relative humidity in %
+
+    """
+    qv, press = to_kg_per_kg(qv, qv_unit), to_hpa(press, press_unit)
+    kernel = fused(_rh_from_qv)
+    if kernel is not None:
+        return kernel(to_celsius(temp, temp_unit), qv, press)
+
+    es = saturation_vapour_pressure(temp, temp_unit)
+    e = qv * press / ((1 - EPSILON) * qv + EPSILON)
+
+    # ufuncs instead of clip, which has different signatures in pandas and xarray
+    return 100 * np.minimum(np.maximum(e / es, 0), 1)
+
+
+def air_density(press, temp, qv, qc=0, press_unit="Pa", temp_unit="K", qv_unit="kg/kg"):
+    """Density of moist air in kg/m**3 (after calrho in COSMO meteo_utilities).
+
+    rho = press / (R_D * temp * (1 + (R_V / R_D - 1) * qv - qc))
+
+    Args:
+        press       (array):    air pressure
+        temp        (array):    air temperature
+        qv          (array):    specific humidity
+        qc          (array):    specific cloud water content in kg/kg
+        press_unit  (str):      unit of press
+        temp_unit   (str):      unit of temp
+        qv_unit     (str):      unit of qv
+
+    Returns:
+        array: air density in kg/m**3
+
+    """
+    check_unit(press_unit, PRESS_UNITS, "pressure")
+    press = press * 100 if press_unit == "hPa" else press
+    temp = to_kelvin(temp, temp_unit)
+    qv = to_kg_per_kg(qv, qv_unit)
+    kernel = fused(_air_density)
+    if kernel is not None:
+        return kernel(press, temp, qv, qc)
+    return press / (R_D * temp * (1 + (R_V / R_D - 1) * qv - qc))
+
+
+def wind_speed(u, v):
+    """Wind speed from the u, v components (in their unit)."""
+    return np.sqrt(u**2 + v**2)
+
+
+def wind_direction(u, v, modulo_180=False):
+    """Meteorological wind direction in ° from the u, v components.
+
+    Inspired from the wind_uv_to_dir function in:
+    https://github.com/blaylockbk/Ute_WRF/blob/master/functions/wind_calcs.py
+
+    Args:
+        u, v        (array):    wind components
+        modulo_180  (bool):     directions in [-180, 180] instead of [0, 360]
+
+    Returns:
+        array: wind direction in °
+
+    """
+    # wind direction coordinates differ from the trigonometric unit circle;
+    # 360 becomes 0 (by % 360)
+    kernel = fused(_wind_direction)
+    if kernel is not None:
+        wind_dir = kernel(u, v)
+    else:
+        wind_dir = (270 - np.rad2deg(np.arctan2(v, u))) % 360
+    if modulo_180:
+        wind_dir = (wind_dir + 180) % 360 - 180
+    return wind_dir
+
+
+if __name__ == "__main__":
+    # (time, level) fields of a heatmap in one call
+    temp = np.array([[15.0, 10.0, 5.0], [14.0, 9.0, 3.0]])
+    press = np.array([950.0, 900.0, 850.0])
+    print(potential_temperature(temp, press))
+    print(qv_from_rh(press, 80.0, temp, qv_unit="g/kg"))
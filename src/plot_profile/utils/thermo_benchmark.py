@@ -0,0 +1,102 @@
+"""Purpose: Benchmark the numpy and numba backends of the thermo kernels.
+
+Derived variables are computed for synthetic model output blocks of
+48 hourly steps x 80 levels x 30 stations (Def), as for multi-level
+timeseries of a station network:
+    python -m plot_profile.utils.thermo_benchmark [steps levels stations]
+
+Date: 19/10/2026.
+"""
+
+# Standard library
+import os
+import sys
+import timeit
+
+# Third-party
+import numpy as np
+
+# First-party
+from plot_profile.utils import thermo
+
+
+def synthetic_block(shape, seed=0):
+    """Model-like fields of shape (time, level, station) in model units."""
+    rng = np.random.default_rng(seed)
+    levels = np.linspace(1, 0.3, shape[1])[None, :, None]
+    return {
+        "press": 101325 * levels + rng.normal(0, 100, shape),  # Pa
+        "temp": 288 - 60 * (1 - levels) + rng.normal(0, 2, shape),  # K
+        "rel_hum": rng.uniform(5, 100, shape),  # %
+        "qc": rng.uniform(0, 1e-4, shape),  # kg/kg
+        "u": rng.normal(0, 10, shape),  # m/s
+        "v": rng.normal(0, 10, shape),  # m/s
+    }
+
+
+def derive(block):
+    """Derive the variables of a block (in their plotting units)."""
+    press, temp = block["press"], block["temp"]
+    qv = thermo.qv_from_rh(
+        press, block["rel_hum"], temp, press_unit="Pa", temp_unit="K"
+    )
+    return {
+        "qv": qv,
+        "dewp_temp": thermo.dewpoint_from_rh(block["rel_hum"], temp, temp_unit="K"),
+        "rel_hum": thermo.rh_from_qv(temp, qv, press, temp_unit="K", press_unit="Pa"),
+        "rho": thermo.air_density(press, temp, qv, block["qc"]),
+        "pot_temp": thermo.potential_temperature(
+            temp, press, temp_unit="K", press_unit="Pa"
+        ),
+        "wind_dir": thermo.wind_direction(block["u"], block["v"]),
+    }
+
+
+def benchmark(shape=(48, 80, 30), repeat=5, verbose=True):
+    """Time derive() with every available backend.
+
+    Args:
+        shape   (tuple):    (steps, levels, stations)
+        repeat  (int):      timings per backend, the fastest one counts
+        verbose (bool):     print the timings
+
+    Returns:
+        dict: backend -> seconds per block
+
+    """
+    block = synthetic_block(shape)
+    backends = ["numpy"] + (["numba"] if thermo.numba is not None else [])
+    previous = os.environ.get("PLOT_PROFILE_THERMO_BACKEND")
+
+    timings, results = {}, {}
+    try:
+        for backend in backends:
+            os.environ["PLOT_PROFILE_THERMO_BACKEND"] = backend
+            # compile (numba) and warm up outside of the timing
+            results[backend] = derive(block)
+            timings[backend] = min(
+                timeit.repeat(lambda: derive(block), number=1, repeat=repeat)
+            )
+    finally:
+        if previous is None:
+            os.environ.pop("PLOT_PROFILE_THERMO_BACKEND", None)
+        else:
+            os.environ["PLOT_PROFILE_THERMO_BACKEND"] = previous
+
+    if verbose:
+        print(f"Derived variables of a {' x '.join(map(str, shape))} block:")
+        for backend, seconds in timings.items():
+            speedup = timings["numpy"] / seconds
+            print(f"  {backend:6s} {seconds * 1000:8.1f} ms  ({speedup:.1f}x)")
+        if "numba" not in timings:
+            print("  numba is not installed.")
+        else:
+            # both backends have to agree
+            for name, values in results["numpy"].items():
+                np.testing.assert_allclose(results["numba"][name], values, rtol=1e-10)
+
+    return timings
+
+
+if __name__ == "__main__":
+    benchmark(tuple(int(arg) for arg in sys.argv[1:4]) or (48, 80, 30))
@@ -14,6 +14,7 @@ import xarray as xr
 from matplotlib import cm
 
 # First-party
+from plot_profile.utils import thermo
 from plot_profile.utils.stations import sdf
 from plot_profile.utils.variables import vdf
 
@@ -271,17 +272,19 @@ def get_icon_name(
 
     if matches:
         if len(matches) > 1:
-            msg = f"The corresponding key for {variable.name} is not unique."
-            tip = "Check spelling of icon_names in variables.py"
+            msg = f"The corresponding key for {variable.short_name} is not unique."
+            tip = "Check spelling of icon_names in variables.json"
             raise ValueError(f"{msg} {tip}")
         if verbose:
-            print(f"Found icon variable name {matches[0]} for variable {variable.name}")
+            print(
+                f"Found icon variable name {matches[0]} for variable {variable.short_name}"
+            )
 
         # Return match if no errors detected
         return matches[0]
 
-    msg = f"No matches found for {variable.name}."
-    tip = "Check spelling of icon_names in variables.py"
+    msg = f"No matches found for {variable.short_name}."
+    tip = "Check spelling of icon_names in variables.json"
     raise ValueError(f"{msg} Possible names: {', '.join(icon_names)}. {tip}")
 
 
@@ -442,17 +445,16 @@ def decumulate(arr):
     since beginning of the model simulation.
 
     Args:
-        arr (1d array): arome output variable
+        arr (array): arome output variable, time along the first axis
 
     Returns:
-        1d numpy nd array: de-averaged output
+        numpy nd array: de-cumulated output (same shape)
 
     """
-    arr = arr.to_numpy()
-    arr = arr[1:] - arr[:-1]
-    arr = np.insert(arr, 0, np.nan)
+    arr = np.asarray(arr, dtype="float64")
+    first = np.full((1,) + arr.shape[1:], np.nan)
 
-    return arr
+    return np.concatenate([first, arr[1:] - arr[:-1]])
 
 
 def calc_qv_from_td(td, p):
@@ -467,14 +469,7 @@ def calc_qv_from_td(td, p):
         array (qv in g/kg)
 
     """
-    e = 6.112 * np.exp((17.67 * td) / (td + 243.5))
-    qv = (0.622 * e) / (p - (0.378 * e)) * 1000  # to get g/kg
-    # equivalent formula would be:
-    # from calculating spec. hum. from dew point temperatures github-discussion
-    # after eq. 4.24 in Practical Meteorology from Stull
-    # td=td+273.15
-    # qv = (622*6.113*np.exp(5423*(td-273.15)/(td*273.15)))/p
-    return qv
+    return thermo.qv_from_dewpoint(p, td, qv_unit="g/kg")
 
 
 def parse_grid_file(height_file, model_src):
@@ -0,0 +1,29 @@
+"""Test module ``plot_profile/plot_arome/arome_points.py``."""
+# Third-party
+import numpy as np
+
+# First-party
+from plot_profile.plot_arome.arome_points import arome_station_points
+from plot_profile.plot_arome.arome_points import calc_arome_point
+from plot_profile.plot_arome.arome_points import gather_point
+
+
+def test_bilinear_weights():
+    point = calc_arome_point(48.5, 6.0)
+    assert (point.y0, point.x0) == (20, 40)
+    assert np.isclose(point.weights.sum(), 1)
+    # bilinear interpolation reproduces a linear field exactly
+    fy, fx = (49 - 48.5) * 121 / 3, (6.0 - 5) * 201 / 5
+    box = np.add.outer(np.arange(2.0) + point.y0, 2 * (np.arange(2.0) + point.x0))
+    assert np.isclose(gather_point(box, point), fy + 2 * fx)
+
+
+def test_outside_domain():
+    assert calc_arome_point(40.0, 6.0) is None
+
+
+def test_station_points():
+    table = arome_station_points()
+    assert "pay" in table.index
+    weights = table[["w00", "w01", "w10", "w11"]].sum(axis=1)
+    assert np.allclose(weights, 1)
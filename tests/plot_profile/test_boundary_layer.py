@@ -0,0 +1,85 @@
+"""Test module ``plot_profile/utils/boundary_layer.py``."""
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.plot_icon.get_icon import icon_pbl_heights
+from plot_profile.utils import boundary_layer
+from plot_profile.utils import thermo
+
+HEIGHT = np.arange(500.0, 3001.0, 25.0)  # m asl
+
+
+def mixed_layer(top):
+    """Potential temperature (K): mixed layer up to top, 5 K inversion above."""
+    above = HEIGHT - top
+    return 290 + np.clip(above, 0, 100) / 20 + 0.003 * np.clip(above - 100, 0, None)
+
+
+def test_mixed_layer():
+    wind = np.full(HEIGHT.shape, 5.0)
+    heights = boundary_layer.pbl_heights(HEIGHT, mixed_layer(1200), wind, 0 * wind)
+
+    # parcel: 0.5 K excess 10 m above the top
+    np.testing.assert_allclose(heights["parcel"], 1210)
+    np.testing.assert_allclose(heights["theta_grad"], 1212.5)
+    # Ri = 0.25 a few metres above the top (5 m/s)
+    assert 1200 < heights["bulk_ri"] < 1210
+
+
+def test_block_equals_columns():
+    tops = [700, 1000, 1350, 2000]
+    pot_temp = np.stack([mixed_layer(top) for top in tops])
+    wind_u = np.linspace(2, 10, 4)[:, None] + 0 * pot_temp
+
+    block = boundary_layer.pbl_heights(HEIGHT, pot_temp, wind_u, 0 * wind_u)
+    # top-down columns on axis 0
+    flipped = boundary_layer.pbl_heights(
+        HEIGHT[::-1, None], pot_temp.T[::-1], wind_u.T[::-1], 0, axis=0
+    )
+    for i, top in enumerate(tops):
+        single = boundary_layer.pbl_heights(HEIGHT, pot_temp[i], wind_u[i], 0)
+        for method in boundary_layer.METHODS:
+            np.testing.assert_allclose(block[method][i], single[method])
+            np.testing.assert_allclose(flipped[method][i], single[method])
+
+
+def test_missing_data():
+    pot_temp = np.stack([mixed_layer(1000), np.full(HEIGHT.shape, np.nan)])
+    # retrieval starting above the lowest altitude
+    pot_temp[0, :4] = np.nan
+    heights = boundary_layer.pbl_heights(HEIGHT, pot_temp)
+
+    np.testing.assert_allclose(heights["parcel"][0], 1010)
+    assert np.isnan(heights["parcel"][1])
+    # no wind: no bulk Richardson number
+    assert np.isnan(heights["bulk_ri"]).all()
+
+    # well-mixed up to the top of the column
+    neutral = boundary_layer.pbl_heights(HEIGHT, np.full(HEIGHT.shape, 290.0))
+    assert np.isnan(neutral["parcel"]) and np.isnan(neutral["theta_grad"])
+
+
+def test_static_temperature():
+    temp = mixed_layer(1000) - boundary_layer.GRAVITY / thermo.CP_D * (HEIGHT - 500)
+    static = boundary_layer.static_temperature(HEIGHT, temp, temp_unit="K")
+    np.testing.assert_allclose(static, mixed_layer(1000))
+
+
+def test_icon_pbl_heights():
+    # get_icon: rows bottom-up, one column per leadtime
+    leadtimes = [0, 1, 2]
+    pot_temp = np.stack([mixed_layer(top) for top in [800, 1000, 1200]], axis=1)
+    press = 950 * np.exp(-(HEIGHT[:, None] - 500) / 8000) + 0 * pot_temp
+    temp = pot_temp * (press / thermo.P_REF) ** (thermo.R_D / thermo.CP_D)
+    data_dict = {"height": pd.Series(HEIGHT)}
+    fields = {"temp": temp - thermo.ZERO_CELSIUS, "press": press, "qv": 0 * temp}
+    fields.update(u=5 + 0 * temp, v=0 * temp)
+    for var, values in fields.items():
+        data_dict[var] = pd.DataFrame(values, columns=leadtimes)
+
+    heights = icon_pbl_heights(data_dict, ["parcel", "bulk_ri"])
+    assert heights.index.tolist() == leadtimes
+    assert heights.columns.tolist() == ["parcel", "bulk_ri"]
+    np.testing.assert_allclose(heights["parcel"], [810, 1010, 1210])
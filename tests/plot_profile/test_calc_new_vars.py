@@ -0,0 +1,52 @@
+"""Test module ``plot_profile/utils/calc_new_vars.py``."""
+# Third-party
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# First-party
+from plot_profile.utils import calc_new_vars
+from plot_profile.utils import thermo
+
+
+def test_integrate_over_z(monkeypatch):
+    # arome heights (m agl) of levels 1..8 at any point
+    heights = pd.Series([20.0, 50.0, 100.0, 170.0, 260.0, 380.0, 530.0, 720.0])
+    monkeypatch.setattr(calc_new_vars, "arome_point", lambda lat, lon: None)
+    monkeypatch.setattr(calc_new_vars, "calc_arome_height_agl", lambda point: heights)
+    calc_new_vars.arome_layer_thickness.cache_clear()
+
+    rng = np.random.default_rng(0)
+    levels = [1, 2, 3, 4, 5]
+    shape = (6, len(levels))  # (time, level)
+    ds = xr.Dataset(
+        {
+            "press": (("time", "level"), rng.uniform(850, 1000, shape)),  # hPa
+            "temp": (("time", "level"), rng.uniform(-5, 15, shape)),  # °C
+            "qc": (("time", "level"), rng.uniform(0, 0.5, shape)),  # g/kg
+            "rel_hum": (("time", "level"), rng.uniform(60, 100, shape)),  # %
+        },
+        coords={"level": levels},
+    )
+
+    tqc = calc_new_vars.integrate_over_z(ds, "qc", 46.8, 6.9)
+    calc_new_vars.arome_layer_thickness.cache_clear()
+
+    # explicit sum over the levels: qc * rho * layer thickness
+    expected = np.zeros(shape[0])
+    bottom = 0.0
+    for i, level in enumerate(levels):
+        top = heights[level - 1]
+        press, temp = ds["press"].values[:, i], ds["temp"].values[:, i]
+        qc = ds["qc"].values[:, i]
+        qv = thermo.qv_from_rh(press, ds["rel_hum"].values[:, i], temp)
+        rho = (press * 100) / (
+            thermo.R_D
+            * (temp + 273.15)
+            * (1 + (thermo.R_V / thermo.R_D - 1) * qv - qc / 1000)
+        )
+        expected += qc * rho * (top - bottom)
+        bottom = top
+
+    assert tqc.dims == ("time",)
+    assert np.allclose(tqc.values, expected)
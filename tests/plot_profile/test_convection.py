@@ -0,0 +1,115 @@
+"""Test module ``plot_profile/utils/convection.py``."""
+# Third-party
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# First-party
+from plot_profile.utils import convection
+from plot_profile.utils import thermo
+from plot_profile.utils.calc_new_vars import calc_new_var_timeseries
+from plot_profile.utils.level_matrix import level_dataset
+from plot_profile.utils.level_matrix import level_frame
+
+PRESS = np.linspace(1000, 200, 81)  # hPa
+
+
+def column(temp_sfc, dewp_sfc):
+    """Temperature and dew point (°C): 45 K (temp) and 15 K (dewp) per octave."""
+    octaves = np.log(1000 / PRESS) / np.log(2)
+    temp = temp_sfc - 45 * octaves
+    return temp, np.minimum(temp, dewp_sfc - 15 * octaves)
+
+
+def test_reference_values():
+    # MetPy 1.7: surface_based_cape_cin, lcl, lifted_index
+    temp, dewp_temp = column(20, 10)
+    indices = convection.convective_indices(PRESS, temp, dewp_temp)
+
+    np.testing.assert_allclose(indices["cape"], 2515.5, rtol=0.02)
+    np.testing.assert_allclose(indices["cin"], -98.8, rtol=0.02)
+    np.testing.assert_allclose(indices["li"], -5.91, atol=0.05)
+    # 125 m per K dew point depression
+    np.testing.assert_allclose(indices["lcl"], 1250, rtol=0.02)
+
+
+def test_stable_column():
+    temp = np.full(PRESS.shape, 10.0)
+    indices = convection.convective_indices(PRESS, temp, temp - 5)
+    assert indices["cape"] == 0
+    assert indices["cin"] == 0
+    assert indices["li"] > 0
+
+
+def test_block_equals_columns():
+    rng = np.random.default_rng(0)
+    depressions = [0, 2, 5, 8, 12, 20]
+    columns = [column(t, t - d) for t, d in zip(rng.uniform(5, 30, 6), depressions)]
+    temp = np.stack([t for t, _ in columns]) + rng.normal(0, 0.5, (6, PRESS.size))
+    dewp_temp = np.minimum(temp, np.stack([d for _, d in columns]))
+
+    block = convection.convective_indices(PRESS, temp, dewp_temp)
+    for i in range(6):
+        single = convection.convective_indices(PRESS, temp[i], dewp_temp[i])
+        for name in convection.INDICES:
+            np.testing.assert_allclose(block[name][i], single[name])
+
+
+def test_level_order_and_missing_levels():
+    temp, dewp_temp = column(24, 16)
+    expected = convection.convective_indices(PRESS, temp, dewp_temp)
+
+    # top-down columns (i.e. icon), on axis 0, in K and Pa
+    flipped = convection.convective_indices(
+        PRESS[::-1, None] * 100,
+        temp[::-1, None] + 273.15,
+        dewp_temp[::-1, None] + 273.15,
+        axis=0,
+        press_unit="Pa",
+        temp_unit="K",
+    )
+    # soundings regridded to fixed altitudes: missing levels below the station
+    missing = [
+        np.concatenate([[np.nan] * 3, values]) for values in (PRESS, temp, dewp_temp)
+    ]
+    shifted = convection.convective_indices(*missing)
+
+    for name in convection.INDICES:
+        np.testing.assert_allclose(flipped[name][0], expected[name])
+        np.testing.assert_allclose(shifted[name], expected[name])
+
+    empty = convection.convective_indices(*[np.full(5, np.nan)] * 3)
+    assert np.isnan(empty["cape"])
+
+
+def test_timeseries_of_model_columns():
+    # icon: press, temp and qv on 81 levels ("1" = lowest level)
+    temp, dewp_temp = np.stack([column(20, 10), column(26, 20)], axis=1)
+    qv = thermo.qv_from_dewpoint(PRESS, dewp_temp, qv_unit="g/kg")
+    ds = level_dataset(
+        pd.date_range("2021-11-19", periods=2, freq="H"),
+        {"press": np.tile(PRESS, (2, 1)), "temp": temp, "qv": qv},
+        np.arange(1, PRESS.size + 1),
+    )
+    cape = level_frame(calc_new_var_timeseries(ds, "cape", None, 46.8, 6.9))
+
+    assert cape.columns.tolist() == ["timestamp", "cape"]
+    # dew point from qv via rel_hum (approximate inversions)
+    expected = convection.convective_indices(PRESS, temp, dewp_temp)["cape"]
+    np.testing.assert_allclose(cape["cape"], expected, rtol=0.02)
+
+
+def test_sounding_indices():
+    temp, dewp_temp = column(20, 10)
+    profiles = xr.DataArray(
+        np.stack([PRESS, temp, dewp_temp], axis=-1)[None],
+        coords={
+            "time": pd.to_datetime(["2021-11-19 12:00"]),
+            "altitude": np.arange(PRESS.size) * 150.0,
+            "variable": ["press", "temp", "dewp_temp"],
+        },
+        dims=("time", "altitude", "variable"),
+    )
+    data = convection.sounding_indices(profiles)
+    assert data.columns.tolist() == ["timestamp"] + convection.INDICES
+    assert data["cape"].iloc[0] > 0
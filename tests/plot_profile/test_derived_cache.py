@@ -0,0 +1,45 @@
+"""Test module ``plot_profile/utils/derived_cache.py``."""
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils.calc_new_vars import calc_new_var_timeseries
+from plot_profile.utils.derived_cache import clear_cache
+from plot_profile.utils.derived_cache import derived_key
+from plot_profile.utils.derived_cache import memoised
+from plot_profile.utils.level_matrix import level_dataset
+
+
+def test_memoised():
+    clear_cache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return pd.DataFrame({"u~1": [3.0, 0.0], "v~1": [4.0, -5.0]})
+
+    key = derived_key(("icon", "/ref", "2021111900"), "pay", 0, 6, [1], ["u", "v"])
+    assert key == (("icon", "/ref", "2021111900"), "pay", 0, 6, (1,), ("u", "v"))
+
+    first = memoised(key, load)
+    # callers get their own copy
+    del first["u~1"]
+    second = memoised(key, load)
+    assert loads == [1]
+    assert second.columns.tolist() == ["u~1", "v~1"]
+
+
+def test_derive_from_same_fields():
+    # wind_vel and wind_dir from one load of u and v
+    uv = level_dataset(
+        pd.date_range("2021-11-19", periods=2, freq="H"),
+        {"u": [[3.0], [0.0]], "v": [[4.0], [-5.0]]},
+        levels=[1],
+    )
+    wind_vel = calc_new_var_timeseries(uv, "wind_vel", 1, 46.8, 6.9)
+    wind_dir = calc_new_var_timeseries(uv, "wind_dir", 1, 46.8, 6.9)
+
+    assert list(uv.data_vars) == ["u", "v"]
+    assert list(wind_vel.data_vars) == ["wind_vel"]
+    assert list(wind_dir.data_vars) == ["wind_dir"]
+    assert wind_vel["wind_vel"].values.ravel().tolist() == [5.0, 5.0]
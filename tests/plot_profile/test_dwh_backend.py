@@ -0,0 +1,36 @@
+"""Test module ``plot_profile/utils/dwh_backend.py``."""
+# First-party
+from plot_profile.utils import dwh_backend
+from plot_profile.utils.dwh_retrieve import dwh2pandas
+
+OUTPUT = (
+    "termin name 91\n"
+    "--------------------\n"
+    "2021-11-19 00:00|Payerne|1.5\n"
+    "\n"
+    "records read: 1\n"
+)
+
+
+def test_normalise_command():
+    normalise = dwh_backend.normalise_command
+    key = normalise("/a/jretrievedwh --show_records -s surface -p 91,90")
+    assert key == normalise("jretrievedwh -p 91,90 -s surface --show_records")
+    assert key != normalise("jretrievedwh -p 90,91 -s surface --show_records")
+
+
+def test_record_and_replay(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_DWH_RECORDINGS", str(tmp_path / "recordings"))
+    source = tmp_path / "output.txt"
+    source.write_text(OUTPUT)
+
+    # record: "cat" stands in for jretrievedwh
+    monkeypatch.setenv("PLOT_PROFILE_DWH_BACKEND", "record")
+    recorded = dwh2pandas(f"cat {source}", verbose=False)
+    assert dwh_backend.recording_path(f"cat {source}").read_text() == OUTPUT
+
+    # replay: served by the stand-in executable
+    monkeypatch.setenv("PLOT_PROFILE_DWH_BACKEND", "replay")
+    source.unlink()
+    replayed = dwh2pandas(f"/any/path/jretrievedwh {source}", verbose=False)
+    assert replayed.equals(recorded)
@@ -0,0 +1,167 @@
+"""Test module ``plot_profile/utils/dwh_cache.py``."""
+# Standard library
+import datetime as dt
+import os
+
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils.dwh_cache import cached_retrieve
+from plot_profile.utils.dwh_cache import evict
+from plot_profile.utils.dwh_cache import find_gaps
+from plot_profile.utils.dwh_cache import is_expired
+from plot_profile.utils.dwh_cache import read_block
+from plot_profile.utils.dwh_cache import split_range
+from plot_profile.utils.dwh_cache import str2time
+from plot_profile.utils.dwh_cache import time2str
+from plot_profile.utils.dwh_cache import write_block
+
+
+def hourly(hours):
+    return [dt.datetime(2021, 11, 19, hour) for hour in hours]
+
+
+def test_find_gaps():
+    t0, t6, t9, t12 = hourly([0, 6, 9, 12])
+    assert find_gaps(t0, t12, []) == [(t0, t12)]
+    assert find_gaps(t0, t12, [(t0, t6)]) == [(t6, t12)]
+    assert find_gaps(t0, t12, [(t6, t9)]) == [(t0, t6), (t9, t12)]
+    assert find_gaps(t0, t6, [(t0, t12)]) == []
+    assert find_gaps(t6, t6, [(t0, t6)]) == []
+
+
+def test_cached_retrieve(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path))
+    fetched = []
+
+    def fetch(start, end):
+        fetched.append((start, end))
+        times = pd.date_range(str2time(start), str2time(end), freq="10min")
+        return pd.DataFrame({"termin": times, "91": times.minute + 100 * times.hour})
+
+    first = cached_retrieve(
+        "surface", "PAY", "91", "", "2021111900", "2021111906", fetch
+    )
+    second = cached_retrieve(
+        "surface", "PAY", "91", "", "2021111903", "2021111912", fetch
+    )
+
+    assert fetched == [("2021111900", "2021111906"), ("2021111906", "2021111912")]
+    assert len(first) == 37
+    assert second["termin"].is_unique
+    assert second["termin"].iloc[0] == pd.Timestamp("2021-11-19 03:00")
+    assert second["termin"].iloc[-1] == pd.Timestamp("2021-11-19 12:00")
+    assert len(second) == 9 * 6 + 1
+
+    # fully cached: no retrieval
+    third = cached_retrieve(
+        "surface", "PAY", "91", "", "2021111903", "2021111909", fetch
+    )
+    assert len(fetched) == 2
+    assert len(third) == 6 * 6 + 1
+
+
+def test_split_range():
+    t0, t6, t9, t12 = hourly([0, 6, 9, 12])
+    assert split_range(t0, t12, dt.timedelta(hours=6)) == [(t0, t6), (t6, t12)]
+    assert split_range(t6, t12, dt.timedelta(hours=3)) == [(t6, t9), (t9, t12)]
+    assert split_range(t0, t6, dt.timedelta(hours=24)) == [(t0, t6)]
+
+
+def test_chunked_retrieve(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("PLOT_PROFILE_DWH_CHUNK_HOURS", "6")
+    fetched = []
+
+    def fetch(start, end):
+        fetched.append((start, end))
+        times = pd.date_range(str2time(start), str2time(end), freq="10min")
+        return pd.DataFrame({"termin": times, "91": times.minute + 100 * times.hour})
+
+    data = cached_retrieve(
+        "surface", "PAY", "91", "", "2021111900", "2021111918", fetch
+    )
+
+    assert sorted(fetched) == [
+        ("2021111900", "2021111906"),
+        ("2021111906", "2021111912"),
+        ("2021111912", "2021111918"),
+    ]
+    assert len(list(tmp_path.rglob("*-*.*"))) == 3
+    assert data["termin"].is_unique
+    assert data["termin"].is_monotonic_increasing
+    assert len(data) == 18 * 6 + 1
+
+
+def test_unwritable_cache(tmp_path, monkeypatch, capsys):
+    # cache directory below a file: mkdir fails
+    (tmp_path / "file").touch()
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path / "file" / "cache"))
+
+    def fetch(start, end):
+        times = pd.date_range(str2time(start), str2time(end), freq="10min")
+        return pd.DataFrame({"termin": times, "91": times.minute + 100 * times.hour})
+
+    data = cached_retrieve(
+        "surface", "PAY", "91", "", "2021111900", "2021111906", fetch
+    )
+
+    assert len(data) == 37
+    assert "DWH cache not writable" in capsys.readouterr().out
+
+
+def test_recent_block_expires_while_read(tmp_path):
+    now = dt.datetime.utcnow()
+    start, end = now - dt.timedelta(hours=3), now - dt.timedelta(hours=2)
+    data = pd.DataFrame({"termin": [start, end], "91": [1.0, 2.0]})
+    path = write_block(data, tmp_path, start, end, 12)
+
+    # retrieved 2 h ago, last read 70 min ago
+    retrieved = (now - dt.timedelta(hours=2) - dt.datetime(1970, 1, 1)).total_seconds()
+    os.utime(path, (retrieved + 50 * 60, retrieved))
+    assert is_expired(end, path, now)
+
+    read_block(path)
+    assert is_expired(end, path, now)
+
+
+def test_evict_least_recently_read(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path))
+    t0, t6, t12 = hourly([0, 6, 12])
+    data = pd.DataFrame({"termin": [t0, t6], "91": [1.0, 2.0]})
+    old = write_block(data, tmp_path, t0, t6, 10)
+    new = write_block(data, tmp_path, t6, t12, 10)
+    # the older block has been retrieved first but read last
+    os.utime(old, (1000, 1000))
+    os.utime(new, (2000, 2000))
+    read_block(old)
+
+    evict(max_bytes=old.stat().st_size)
+
+    assert old.exists()
+    assert not new.exists()
+
+
+def test_empty_recent_data_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path))
+    hour = dt.datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    start, end = time2str(hour - dt.timedelta(hours=1)), time2str(hour)
+    available = []
+
+    def fetch(fetch_start, fetch_end):
+        if not available:  # not in the DWH yet
+            return pd.DataFrame()
+        times = pd.date_range(str2time(fetch_start), str2time(fetch_end), freq="10min")
+        return pd.DataFrame({"termin": times, "91": range(len(times))})
+
+    assert cached_retrieve("surface", "PAY", "91", "", start, end, fetch).empty
+    assert not list(tmp_path.rglob("*-*.*"))
+
+    available.append(True)
+    assert len(cached_retrieve("surface", "PAY", "91", "", start, end, fetch)) == 7
+
+    # empty old data is final and cached
+    available.clear()
+    cached_retrieve("surface", "PAY", "91", "", "2021111900", "2021111906", fetch)
+    assert len(list(tmp_path.rglob("*-*.*"))) == 2
@@ -0,0 +1,66 @@
+"""Test module ``plot_profile/utils/dwh_coalesce.py``."""
+# Standard library
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils.dwh_coalesce import clear_requests
+from plot_profile.utils.dwh_coalesce import coalesced_retrieve
+
+
+def make_fetch(calls, raw_ids):
+    def fetch():
+        calls.append(raw_ids)
+        times = pd.date_range("2021-11-19 00:00", "2021-11-19 12:00", freq="6H")
+        return pd.DataFrame(
+            {"termin": times, **{i: range(len(times)) for i in raw_ids}}
+        )
+
+    return fetch
+
+
+def test_contained_requests_share_one_retrieval():
+    clear_requests()
+    calls = []
+    key = ("2m", "pay")
+    data = coalesced_retrieve(
+        key, ["91", "90"], "2021111900", "2021111912", make_fetch(calls, ["91", "90"])
+    )
+    sub = coalesced_retrieve(
+        key, ["90"], "2021111906", "2021111912", make_fetch(calls, ["90"])
+    )
+    assert calls == [["91", "90"]]
+    assert list(sub.columns) == ["termin", "90"]
+    assert sub["90"].tolist() == [1, 2]
+
+    # every caller gets its own copy
+    sub["90"] = -1
+    assert data["90"].tolist() == [0, 1, 2]
+
+    # not contained: new retrieval
+    coalesced_retrieve(
+        key, ["98"], "2021111900", "2021111912", make_fetch(calls, ["98"])
+    )
+    assert calls[-1] == ["98"]
+
+
+def test_concurrent_identical_requests():
+    clear_requests()
+    calls = []
+    with ThreadPoolExecutor(4) as pool:
+        results = list(
+            pool.map(
+                lambda _: coalesced_retrieve(
+                    ("rs", "pay"),
+                    ["745"],
+                    "2021111900",
+                    "2021111912",
+                    make_fetch(calls, ["745"]),
+                ),
+                range(4),
+            )
+        )
+    assert len(calls) == 1
+    assert all(result.equals(results[0]) for result in results)
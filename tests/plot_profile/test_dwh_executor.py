@@ -0,0 +1,43 @@
+"""Test module ``plot_profile/utils/dwh_executor.py``."""
+# Standard library
+import threading
+import time
+
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils import dwh_executor
+from plot_profile.utils import dwh_retrieve as dwh
+from plot_profile.utils.dwh_executor import DWHRequest
+
+
+def test_retrieve_concurrently(monkeypatch):
+    # restore the global limit after the test
+    monkeypatch.setattr(dwh, "dwh_slots", dwh.dwh_slots)
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def fake_retrieve(device, station, vars, timestamps, verbose=False):
+        # like dwh2pandas: one slot per jretrievedwh process
+        with dwh.dwh_slots:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.3 if station == "slow" else 0.02)
+            with lock:
+                running[0] -= 1
+        return pd.DataFrame({"station": [station]})
+
+    monkeypatch.setattr(dwh, "dwh_retrieve", fake_retrieve)
+    requests = [DWHRequest("slow", "rs", "slow", "temp", ["21111900"])] + [
+        DWHRequest(i, "rs", f"st{i}", "temp", ["21111900"]) for i in range(5)
+    ]
+
+    results = list(dwh_executor.retrieve_concurrently(requests, max_processes=2))
+
+    assert peak[0] == 2
+    # in order of completion: the slow retrieval comes last
+    assert [key for key, _ in results][-1] == "slow"
+    assert sorted(str(key) for key, _ in results) == ["0", "1", "2", "3", "4", "slow"]
+    assert all(data["station"][0] in ["slow", f"st{key}"] for key, data in results)
@@ -0,0 +1,28 @@
+"""Test module ``plot_profile/utils/dwh_plan.py``."""
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils.dwh_plan import compute_derived
+from plot_profile.utils.dwh_plan import plan_retrieval
+
+
+def test_plan_shares_raw_ids():
+    # temp, pot_temp and qv at 2m share temp and pressure
+    raw_ids, steps = plan_retrieval(("temp", "pot_temp", "qv"), "2m")
+    assert raw_ids == ["91", "90", "194"]
+    assert [step.column for step in steps] == ["pot_temp", "qv"]
+
+
+def test_plan_raw_only():
+    raw_ids, steps = plan_retrieval(("temp", "rel_hum"), "rs")
+    assert raw_ids == ["745", "746", "742"]
+    assert steps == []
+
+
+def test_compute_derived():
+    raw_ids, steps = plan_retrieval(("lw_net", "lw_up"), "2m")
+    assert raw_ids == ["175", "1531"]
+    data = pd.DataFrame({"175": [300.0, 310.0], "1531": [350.0, 340.0]})
+    data = compute_derived(data, steps)
+    assert data["net_calc:175:1531:"].tolist() == [-50.0, -30.0]
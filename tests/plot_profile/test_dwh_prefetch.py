@@ -0,0 +1,48 @@
+"""Test module ``plot_profile/utils/dwh_prefetch.py``."""
+# Standard library
+import datetime as dt
+
+# Third-party
+import pandas as pd
+
+# First-party
+from plot_profile.utils import dwh_retrieve as dwh
+from plot_profile.utils.dwh_prefetch import prefetch
+from plot_profile.utils.dwh_prefetch import prefetch_timestamps
+
+
+def test_prefetch_timestamps():
+    now = dt.datetime(2021, 11, 19, 13, 5)
+    assert prefetch_timestamps("rs", now, 24) == ["2021111912"]
+    assert prefetch_timestamps("rs", now.replace(hour=11), 24) == ["2021111900"]
+    assert prefetch_timestamps("mwr", now, 6) == ["2021111907", "2021111913"]
+
+
+def test_prefetch_sounding_not_yet_available(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path))
+    now = dt.datetime.utcnow().replace(hour=12, minute=5, second=0, microsecond=0)
+    sounding = pd.DataFrame(
+        {
+            "termin": [now.replace(minute=0)] * 2,
+            "742": [490.0, 1000.0],
+            "745": [8.0, 3.0],
+        }
+    )
+    outputs = [pd.DataFrame(), sounding]
+    calls = []
+
+    def fake_dwh2pandas(cmd, verbose):
+        calls.append(cmd)
+        return outputs[len(calls) - 1]
+
+    monkeypatch.setattr(dwh, "dwh2pandas", fake_dwh2pandas)
+    requests = [("rs", ("temp",))]
+
+    assert prefetch("pay", requests, now=now) == []
+    assert "No data for rs" in capsys.readouterr().out
+
+    # the sounding has arrived: retrieved again and cached
+    assert prefetch("pay", requests, now=now) == []
+    data = dwh.dwh_retrieve("rs", "pay", "temp", [now.replace(minute=0)])
+    assert len(calls) == 2
+    assert list(data["temp"]) == [8.0, 3.0]
@@ -0,0 +1,213 @@
+"""Test module ``plot_profile/utils/dwh_retrieve.py``."""
+# Standard library
+import datetime as dt
+import re
+
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.plot_timeseries.plot_timeseries import create_network_plot
+from plot_profile.utils import dwh_retrieve as dwh
+from plot_profile.utils import thermo
+from plot_profile.utils.dwh_cache import str2time
+from plot_profile.utils.dwh_coalesce import clear_requests
+from plot_profile.utils.dwh_retrieve import aggregate_dwh
+from plot_profile.utils.dwh_retrieve import aggregation_range
+from plot_profile.utils.dwh_retrieve import dwh_retrieve
+from plot_profile.utils.dwh_retrieve import dwh_retrieve_stations
+from plot_profile.utils.dwh_retrieve import DWHRecords
+from plot_profile.utils.dwh_retrieve import parse_dwh_output
+
+OUTPUT = (
+    "termin name wmo_ind 91 3147\n"
+    "--------------------\n"
+    "2021-11-19 00:00|Payerne|06610|1.5|10000000\n"
+    "2021-11-19 00:10|Payerne|06610|10000000|280.2\n"
+    "\n"
+    "records read: 2\n"
+)
+
+
+def test_parse_dwh_output():
+    data = parse_dwh_output(OUTPUT)
+    assert list(data.columns) == ["termin", "name", "wmo_ind", "91", "3147"]
+    assert data["termin"].iloc[1] == pd.Timestamp("2021-11-19 00:10")
+    assert data["wmo_ind"].iloc[0] == "06610"
+    assert np.isnan(data["91"].iloc[1]) and np.isnan(data["3147"].iloc[0])
+    assert data["3147"].iloc[1] == 280.2
+
+
+def test_parse_dwh_output_small_blocks(monkeypatch):
+    expected = parse_dwh_output(OUTPUT)
+    monkeypatch.setattr(DWHRecords, "block_size", 5)
+    assert parse_dwh_output(OUTPUT).equals(expected)
+
+
+def test_parse_dwh_output_empty():
+    assert parse_dwh_output("records read: 0\n").empty
+
+
+def test_parse_dwh_output_schema(monkeypatch):
+    output = OUTPUT.replace("91 3147\n", "level 3147\n")
+    output = output.replace("|1.5|", "|100|").replace("|10000000|", "|200|")
+    data = parse_dwh_output(output)
+    assert isinstance(data["name"].dtype, pd.CategoricalDtype)
+    assert data["level"].dtype == "int32"
+    assert data["3147"].dtype == "float64"
+
+    monkeypatch.setenv("PLOT_PROFILE_FLOAT32", "1")
+    assert parse_dwh_output(output)["3147"].dtype == "float32"
+
+
+def test_aggregate_dwh():
+    start, end = dt.datetime(2021, 11, 19, 0), dt.datetime(2021, 11, 19, 2)
+    times = pd.date_range(start, end, freq="10min")
+    data = pd.DataFrame({"termin": times, "name": "Payerne", "91": range(len(times))})
+
+    hourly = aggregate_dwh(data, ("1H", "max"), start, end)
+    assert hourly["termin"].tolist() == [
+        pd.Timestamp("2021-11-19 01:00"),
+        pd.Timestamp(end),
+    ]
+    assert hourly["91"].tolist() == [6, 12]  # (00:00, 01:00], (01:00, 02:00]
+    assert hourly["name"].tolist() == ["Payerne", "Payerne"]
+
+
+def test_dwh_retrieve_stations(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE", "0")
+    commands = []
+
+    def fake_dwh2pandas(cmd, verbose):
+        # both stations in one output, rows interleaved in time; the
+        # pressure (2m, for qv at the tower) is missing after PAY 00:00
+        commands.append(cmd)
+        return pd.DataFrame(
+            {
+                "termin": pd.to_datetime(
+                    ["2021-11-19 00:00"] * 2 + ["2021-11-19 00:10"] * 2
+                ),
+                "nat_abr": pd.Categorical(["PAY", "GRE", "PAY", "GRE"]),
+                "90": [950.0, np.nan, np.nan, np.nan],
+                "4953": [80.0, 90.0, 85.0, 95.0],
+                "4949": [5.0, 3.0, 6.0, 4.0],
+            }
+        )
+
+    monkeypatch.setattr(dwh, "dwh2pandas", fake_dwh2pandas)
+    start, end = dt.datetime(2021, 11, 19, 0), dt.datetime(2021, 11, 19, 0, 10)
+    data = dwh_retrieve_stations("10m_tower", ["pay", "gre"], "qv", [start, end])
+
+    assert len(commands) == 1
+    assert "-i nat_abr,PAY,GRE" in commands[0]
+    assert data.index.names == ["station", "timestamp"]
+    assert sorted(data.index.get_level_values("station").unique()) == ["gre", "pay"]
+
+    # qv per station: PAY propagates its own pressure, GRE has none
+    pay = data.xs("pay", level="station")["qv"]
+    expected = thermo.qv_from_rh(950.0, np.array([80.0, 85.0]), np.array([5.0, 6.0]))
+    assert np.allclose(pay.values, expected * 1000)
+    assert data.xs("gre", level="station")["qv"].isna().all()
+
+    create_network_plot(
+        data=data,
+        variable="qv",
+        device="10m_tower",
+        location="pay",
+        start=start,
+        end=end,
+        ymin=(),
+        ymax=(),
+        grid=True,
+        datatypes=("png",),
+        outpath=str(tmp_path),
+        appendix="",
+        verbose=False,
+    )
+    assert len(list(tmp_path.glob("timeseries_*_network_10m_tower_qv.png"))) == 1
+
+
+def stub_surface(monkeypatch, fetched):
+    """Stub dwh2pandas by 10 minute data of the -t range, numbered since 19.11."""
+
+    def fake_dwh2pandas(cmd, verbose):
+        start, end = re.search(r"-t (\d+)-(\d+)", cmd).groups()
+        fetched.append((start, end))
+        times = pd.date_range(str2time(start), str2time(end), freq="10min")
+        number = (times - pd.Timestamp("2021-11-19")) // pd.Timedelta("10min")
+        return pd.DataFrame(
+            {
+                "termin": times,
+                "name": "Payerne",
+                "91": number.to_numpy(float),  # temp
+                "90": 950.0 + number % 3,  # press
+                "194": -10.0 + number % 20,  # dewp_temp
+            }
+        )
+
+    monkeypatch.setattr(dwh, "dwh2pandas", fake_dwh2pandas)
+
+
+def test_aggregation_range():
+    assert aggregation_range("2021111906", "2021111918", "1D") == (
+        "2021111900",
+        "2021112000",
+    )
+    assert aggregation_range("2021111900", "2021111900", "1H") == (
+        "2021111823",
+        "2021111900",
+    )
+    assert aggregation_range("2021111906", "2021111906", "30min") == (
+        "202111190530",
+        "202111190600",
+    )
+
+
+def test_aggregation_through_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path / "cache"))
+    fetched = []
+    stub_surface(monkeypatch, fetched)
+
+    def daily_means(timestamps):
+        clear_requests()  # no sharing within the run: read the cache
+        return dwh_retrieve("2m", "pay", "temp", timestamps, aggregation=("1D", "mean"))
+
+    # the day overlapping 06-18 UTC, then two days: one of them cached
+    first = daily_means(["2021111906", "2021111918"])
+    second = daily_means(["2021111900", "2021112100"])
+
+    assert fetched == [("2021111900", "2021112000"), ("2021112000", "2021112100")]
+    assert first["timestamp"].tolist() == [pd.Timestamp("2021-11-20")]
+    assert second["timestamp"].tolist() == [
+        pd.Timestamp("2021-11-20"),
+        pd.Timestamp("2021-11-21"),
+    ]
+    # whole days: 00:10 ... 24:00
+    assert second["temp"].tolist() == [72.5, 216.5]
+
+    # same bins in chunks (not aligned to the chunk length) and without cache
+    monkeypatch.setenv("PLOT_PROFILE_DWH_CHUNK_HOURS", "5")
+    monkeypatch.setenv("PLOT_PROFILE_CACHE_DIR", str(tmp_path / "chunked"))
+    assert daily_means(["2021111900", "2021112100"]).equals(second)
+    monkeypatch.setenv("PLOT_PROFILE_CACHE", "0")
+    assert daily_means(["2021111900", "2021112100"]).equals(second)
+
+
+def test_aggregation_of_derived_variables(monkeypatch):
+    monkeypatch.setenv("PLOT_PROFILE_CACHE", "0")
+    stub_surface(monkeypatch, [])
+    timestamps, aggregation = ["2021111900", "2021111906"], ("1H", "mean")
+
+    # qv of the hourly means differs from the hourly mean of qv
+    clear_requests()
+    alone = dwh_retrieve("2m", "pay", "qv", timestamps, aggregation=aggregation)
+
+    # a retrieval of the inputs of qv is not shared
+    clear_requests()
+    inputs = ["press", "dewp_temp"]
+    dwh_retrieve("2m", "pay", inputs, timestamps, aggregation=aggregation)
+    after_inputs = dwh_retrieve("2m", "pay", "qv", timestamps, aggregation=aggregation)
+
+    assert len(alone) == 6
+    assert after_inputs.equals(alone)
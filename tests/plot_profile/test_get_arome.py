@@ -0,0 +1,42 @@
+"""Test module ``plot_profile/plot_arome/get_arome.py``."""
+# Third-party
+import numpy as np
+from click.testing import CliRunner
+
+# First-party
+from plot_profile.plot_arome.get_arome import MemberStatistics
+from plot_profile.plot_timeseries import cli_timeseries
+
+
+def test_member_statistics():
+    members = np.random.default_rng(0).normal(size=(7, 5, 3))
+    stats = MemberStatistics(["mean", "spread", "min", "max", "q10", "q50"], 7)
+    for values in members:
+        stats.add(values)
+    result = stats.result()
+
+    assert np.allclose(result["mean"], np.mean(members, axis=0))
+    assert np.allclose(result["spread"], np.std(members, axis=0, ddof=1))
+    assert np.allclose(result["min"], np.min(members, axis=0))
+    assert np.allclose(result["max"], np.max(members, axis=0))
+    assert np.allclose(result["q10"], np.quantile(members, 0.1, axis=0))
+    assert np.allclose(result["q50"], np.quantile(members, 0.5, axis=0))
+
+
+def test_member_statistics_welford_only():
+    # mean and spread do not keep the members in memory
+    stats = MemberStatistics(["mean", "spread"], 3)
+    for values in np.arange(6.0).reshape(3, 2):
+        stats.add(values)
+    assert stats.members is None
+    assert np.allclose(stats.result()["spread"], 2)
+
+
+def test_ens_stats_without_members():
+    result = CliRunner().invoke(
+        cli_timeseries.main,
+        ["--start", "21111900", "--end", "21111912", "--loc", "pay"]
+        + ["--ens_stats", "mean"],
+    )
+    assert result.exit_code == 1
+    assert "--arome_members" in result.output
@@ -0,0 +1,53 @@
+"""Test module ``plot_profile/utils/level_matrix.py``."""
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.utils.calc_new_vars import calc_new_var_timeseries
+from plot_profile.utils.level_matrix import level_dataset
+from plot_profile.utils.level_matrix import level_frame
+from plot_profile.utils.utils import decumulate
+
+TIMES = pd.date_range("2021-11-19", periods=3, freq="H")
+
+
+def test_level_frame_labels():
+    profile = level_dataset(TIMES, {"temp": np.arange(6.0).reshape(3, 2)}, [1, 2])
+    surface = level_dataset(TIMES, {"2m_temp": np.zeros((3, 1))}, [0])
+    df = level_frame([profile, surface])
+
+    assert df.columns.tolist() == ["timestamp", "temp~1", "temp~2", "2m_temp"]
+    assert df["temp~2"].tolist() == [1.0, 3.0, 5.0]
+    assert (df["timestamp"] == TIMES).all()
+
+
+def test_level_frame_members():
+    ds = level_dataset(
+        TIMES, {"2m_temp": np.ones((3, 1, 2))}, [0], members=["m1", "mean"]
+    )
+    assert level_frame(ds).columns.tolist() == [
+        "timestamp",
+        "2m_temp~0~m1",
+        "2m_temp~0~mean",
+    ]
+
+
+def test_derive_all_levels():
+    ds = level_dataset(
+        TIMES,
+        {"temp": np.full((3, 2), 15.0), "press": np.tile([1000.0, 900.0], (3, 1))},
+        [1, 2],
+    )
+    pot_temp = level_frame(calc_new_var_timeseries(ds, "pot_temp", [1, 2], 0, 0))
+
+    assert pot_temp.columns.tolist() == ["timestamp", "pot_temp~1", "pot_temp~2"]
+    np.testing.assert_allclose(pot_temp["pot_temp~1"], 288.15, atol=1e-6)
+    assert (pot_temp["pot_temp~2"] > 288.15).all()
+
+
+def test_decumulate_levels():
+    values = np.array([[0.0, 1.0], [2.0, 4.0], [5.0, 4.0]])
+    np.testing.assert_array_equal(
+        decumulate(values), [[np.nan, np.nan], [2.0, 3.0], [3.0, 0.0]]
+    )
@@ -0,0 +1,77 @@
+"""Test module ``plot_profile/utils/pressure_levels.py``."""
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.plot_profiles.get_profiles import add_pressure
+from plot_profile.utils.pressure_levels import frame_to_pressure
+from plot_profile.utils.pressure_levels import interp_log_pressure
+
+PRESS = np.array([1000.0, 900.0, 800.0, 700.0, 600.0, 500.0])
+LEVELS = [950, 850, 700, 550]
+
+
+def linear(press):
+    """Field that is linear in ln(p)."""
+    return 10 + 20 * np.log(press / 1000)
+
+
+def test_linear_in_log_pressure():
+    expected = linear(np.array(LEVELS, dtype=float))
+    actual = interp_log_pressure(PRESS, linear(PRESS), LEVELS)
+    np.testing.assert_allclose(actual, expected)
+    # top-down columns (i.e. icon)
+    np.testing.assert_allclose(
+        interp_log_pressure(PRESS[::-1], linear(PRESS[::-1]), LEVELS), expected
+    )
+
+
+def test_missing_and_outside_levels():
+    press = PRESS.copy()
+    press[2] = np.nan
+    values = interp_log_pressure(press, linear(PRESS), [1050, 950, 750, 450])
+    assert np.isnan(values[0]) and np.isnan(values[-1])
+    np.testing.assert_allclose(values[1:3], linear(np.array([950.0, 750.0])))
+
+    empty = interp_log_pressure(np.full(4, np.nan), np.ones(4), LEVELS)
+    assert np.isnan(empty).all()
+
+
+def test_block_equals_columns():
+    rng = np.random.default_rng(0)
+    press = np.sort(rng.uniform(400, 1000, (5, 20)), axis=-1)[:, ::-1]
+    fields = {"temp": rng.normal(size=(5, 20)), "qv": rng.normal(size=(5, 20))}
+
+    block = interp_log_pressure(press.T, {k: v.T for k, v in fields.items()}, LEVELS, 0)
+    for i in range(5):
+        for name, values in fields.items():
+            single = interp_log_pressure(press[i], values[i], LEVELS)
+            np.testing.assert_allclose(block[name][:, i], single)
+
+
+def test_frame_to_pressure():
+    df = pd.DataFrame({"temp": linear(PRESS), "qv": 2 * linear(PRESS)})
+    data = frame_to_pressure(df, pd.Series(PRESS), LEVELS + [300])
+    assert data.columns.tolist() == ["press", "temp", "qv"]
+    # 300 hPa is above all columns
+    assert data["press"].tolist() == LEVELS
+    np.testing.assert_allclose(data["qv"], 2 * data["temp"])
+
+    # one pressure profile per column (i.e. leadtimes)
+    press = pd.DataFrame({"temp": PRESS, "qv": PRESS * 0.9})
+    data = frame_to_pressure(df, press, LEVELS)
+    np.testing.assert_allclose(data["temp"], linear(np.array(LEVELS, dtype=float)))
+    assert np.isnan(data["qv"].iloc[0])
+
+
+def test_add_pressure():
+    elements = [
+        ("icon", "temp", "ref", "folder", 0, "ch1"),
+        ("icon", "qv", "ref", "folder", 0, "ch1"),
+        ("rs", "temp"),
+        ("rs", "press"),
+    ]
+    assert add_pressure(elements) == elements + [
+        ("icon", "press", "ref", "folder", 0, "ch1")
+    ]
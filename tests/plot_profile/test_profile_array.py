@@ -0,0 +1,46 @@
+"""Test module ``plot_profile/utils/profile_array.py``."""
+# Third-party
+import numpy as np
+import pandas as pd
+
+# First-party
+from plot_profile.utils.profile_array import profile_frame
+from plot_profile.utils.profile_array import profiles_to_array
+
+TIMES = pd.to_datetime(["2021-11-19 00:00"] * 3 + ["2021-11-19 12:00"] * 3)
+
+PROFILES = pd.DataFrame(
+    {
+        "timestamp": TIMES,
+        "altitude": [500.0, 1000.0, 1500.0, 500.0, 1000.0, 1500.0],
+        "temp": [5.0, 2.0, -1.0, 8.0, 4.0, 0.0],
+        "rel_hum": [90.0, 80.0, 70.0, 60.0, 50.0, 40.0],
+    }
+)
+
+
+def test_profiles_to_array():
+    array = profiles_to_array(PROFILES, ["temp", "rel_hum"])
+    assert array.dims == ("time", "altitude", "variable")
+    assert array.shape == (2, 3, 2)
+    assert array.sel(altitude=1000.0, variable="temp").values.tolist() == [2.0, 4.0]
+    assert array.isel(time=1).sel(variable="rel_hum").values.tolist() == [60, 50, 40]
+
+
+def test_profile_frame():
+    frame = profile_frame(profiles_to_array(PROFILES, ["temp"]), "temp")
+    assert frame.index.tolist() == [500.0, 1000.0, 1500.0]
+    assert frame.columns.tolist() == sorted(set(TIMES))
+    assert frame.iloc[0].tolist() == [5.0, 8.0]
+
+
+def test_regrid_profiles():
+    # second profile misses one level and a value
+    data = PROFILES.drop(index=4).copy()
+    data.loc[2, "rel_hum"] = np.nan
+    array = profiles_to_array(data, ["temp", "rel_hum"], levels=[250, 750, 1000, 1500])
+    temp = array.sel(variable="temp").values
+    rel_hum = array.sel(variable="rel_hum").values
+    assert np.isnan(temp[:, 0]).all()  # below all profiles
+    np.testing.assert_allclose(temp[:, 1:], [[3.5, 2.0, -1.0], [6.0, 4.0, 0.0]])
+    assert rel_hum[0, 2] == 80.0 and np.isnan(rel_hum[0, 3])
@@ -0,0 +1,56 @@
+"""Test module ``plot_profile/utils/registry.py``."""
+# Standard library
+import dataclasses
+
+# Third-party
+import pytest
+
+# First-party
+from plot_profile.utils.stations import sdf
+from plot_profile.utils.variables import vdf
+
+
+def test_lookup_by_short_name():
+    assert vdf["temp"].unit == "°C"
+    assert vdf["temp"].dwh_id["rs"] == "745"
+    assert sdf["pay"].dwh_name == "PAY"
+    assert sdf["pay"].elevation == 490
+
+    # defaults of variables.json
+    assert vdf["u"].mult == 1 and vdf["u"].icon_hfl
+    assert vdf["tke"].icon_hfl is False
+    assert vdf["ddt_t_lw"].icon_names == ("ddt_temp_radlw", "THHR_RAD")
+
+    with pytest.raises(KeyError):
+        sdf["xyz"]
+
+
+def test_short_names():
+    assert "temp" in vdf and "pay" in sdf
+    for registry in (vdf, sdf):
+        assert list(registry) == registry.columns
+        assert all(registry[name].short_name == name for name in registry)
+    assert sdf["int"].long_name == "Interlaken"
+    assert sdf["ins"].dwh_id is None
+
+
+def test_records_are_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        vdf["temp"].unit = "K"
+    # no instance dict: attributes live in slots
+    assert not hasattr(sdf["pay"], "__dict__")
+
+    # modified copies for local use
+    temp = dataclasses.replace(vdf["temp"], icon_name="t")
+    assert temp.icon_name == "t" and vdf["temp"].icon_name == "T"
+
+
+def test_dataframe_view():
+    assert vdf.loc["mult"]["qv"] == 1000
+    assert vdf.frame.shape == (21, len(vdf))
+    assert sdf.frame["pay"]["lat"] == sdf["pay"].lat
+
+
+def test_colormap():
+    assert vdf["temp"].colormap.name == "viridis"
+    assert vdf["ddt_t_sw"].colormap(1.0) != vdf["ddt_t_lw"].colormap(1.0)
@@ -0,0 +1,95 @@
+"""Test module ``plot_profile/utils/thermo.py``."""
+# Third-party
+import dask.array as da
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+# First-party
+from plot_profile.utils import thermo
+from plot_profile.utils.utils import calc_qv_from_td
+
+TEMP = np.array([[15.0, 10.0, 5.0], [14.0, 9.0, -3.0]])  # (time, level) in °C
+PRESS = np.array([950.0, 900.0, 850.0])  # (level) in hPa
+
+
+def test_units_are_equivalent():
+    expected = thermo.potential_temperature(TEMP, PRESS)
+    kelvin = thermo.potential_temperature(
+        TEMP + 273.15, PRESS * 100, temp_unit="K", press_unit="Pa"
+    )
+    np.testing.assert_allclose(kelvin, expected)
+    np.testing.assert_allclose(
+        thermo.qv_from_rh(PRESS, 80.0, TEMP, qv_unit="g/kg"),
+        thermo.qv_from_rh(PRESS, 80.0, TEMP) * 1000,
+    )
+
+
+def test_unknown_unit():
+    with pytest.raises(SystemExit):
+        thermo.to_kelvin(TEMP, "F")
+
+
+def test_array_types():
+    expected = thermo.qv_from_dewpoint(PRESS, TEMP)
+    assert expected.shape == (2, 3)
+
+    # labelled arrays broadcast by dimension names and keep their coordinates
+    temp = xr.DataArray(TEMP, dims=("time", "level"), coords={"level": [1, 2, 3]})
+    press = xr.DataArray(PRESS, dims="level", coords={"level": [1, 2, 3]})
+    result = thermo.qv_from_dewpoint(press, temp)
+    np.testing.assert_allclose(result.transpose("time", "level"), expected)
+
+    # lazy arrays stay lazy
+    result = thermo.qv_from_dewpoint(PRESS, da.from_array(TEMP, chunks=1))
+    assert isinstance(result, da.Array)
+    np.testing.assert_allclose(result.compute(), expected)
+
+
+def test_rh_round_trip():
+    qv = thermo.qv_from_rh(PRESS, 60.0, TEMP, qv_unit="g/kg")
+    rh = thermo.rh_from_qv(TEMP, qv, PRESS, qv_unit="g/kg")
+    np.testing.assert_allclose(rh, 60.0, rtol=0.05)
+
+    # supersaturation is clipped, also for pandas series
+    rh = thermo.rh_from_qv(pd.Series([10.0]), pd.Series([50.0]), qv_unit="g/kg")
+    assert rh.tolist() == [100.0]
+
+
+def test_wind():
+    # wind from the west and from the north
+    u, v = np.array([5.0, 0.0]), np.array([0.0, -5.0])
+    np.testing.assert_allclose(thermo.wind_speed(u, v), [5.0, 5.0])
+    np.testing.assert_allclose(thermo.wind_direction(u, v), [270.0, 0.0])
+    np.testing.assert_allclose(
+        thermo.wind_direction(u, v, modulo_180=True), [-90.0, 0.0]
+    )
+
+
+def test_calc_qv_from_td():
+    # after eq. 4.24 in Practical Meteorology from Stull, in g/kg
+    e = 6.112 * np.exp((17.67 * TEMP) / (TEMP + 243.5))
+    expected = (0.622 * e) / (PRESS - (0.378 * e)) * 1000
+    np.testing.assert_allclose(calc_qv_from_td(TEMP, PRESS), expected)
+
+
+def test_numba_backend(monkeypatch):
+    pytest.importorskip("numba")
+    press = np.full((2, 3), 90000.0)
+    expected = thermo.qv_from_rh(press, 80.0, TEMP, press_unit="Pa")
+    rh = pd.Series([50.0, np.nan, 120.0])
+    expected_rh = thermo.rh_from_qv(pd.Series([10.0, 10.0, 10.0]), rh, qv_unit="g/kg")
+
+    monkeypatch.setenv("PLOT_PROFILE_THERMO_BACKEND", "numba")
+    np.testing.assert_allclose(
+        thermo.qv_from_rh(press, 80.0, TEMP, press_unit="Pa"), expected
+    )
+    # float32 stays float32
+    qv = thermo.qv_from_rh(
+        press.astype("float32"), 80.0, TEMP.astype("float32"), press_unit="Pa"
+    )
+    assert qv.dtype == "float32"
+    # series with NaN and a scalar
+    result = thermo.rh_from_qv(pd.Series([10.0, 10.0, 10.0]), rh, qv_unit="g/kg")
+    pd.testing.assert_series_equal(result, expected_rh)